@@ -0,0 +1,296 @@
+"""Client benchmarks against a local stand-in Blizzard API.
+
+Starts a ``FakeBlizzardServer`` in a child process, so the server does not
+compete with the client for the GIL, and measures the client through its
+public API:
+
+- ``raw``: plain ``requests.Session.get`` calls, the baseline of the client
+  overhead.
+- ``sequential``: ``get_item`` calls one after the other.
+- ``threaded``: ``get_item`` calls from a thread pool sharing one client.
+- ``async``: ``get_item`` calls gathered on one event loop (needs ``httpx``).
+- ``search``: every result of a paginated search through ``iter_search_*``.
+- ``auctions``: ``get_auctions`` of a connected realm.
+- ``commodities``: ``get_commodities`` of a region.
+- ``commodities-stream``: the same auctions through ``iter_commodities``.
+
+Each scenario reports requests per second, latency percentiles, the client
+overhead per call over the raw baseline, and the peak memory traced while it
+runs once more under ``tracemalloc``.
+
+Usage:
+    python benchmarks/run.py
+    python benchmarks/run.py --calls 5000 --workers 16 sequential threaded
+    python benchmarks/run.py --json before.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests  # noqa: E402
+
+from blizzardapi2 import BlizzardApi  # noqa: E402
+from blizzardapi2.testing import FakeBlizzardServer, redirect  # noqa: E402
+
+REGION = "us"
+LOCALE = "en_US"
+
+
+@dataclass
+class Result:
+    """The measurements of one scenario."""
+
+    scenario: str
+    requests: int
+    seconds: float
+    cpu_seconds: float
+    latencies: list[float] = field(repr=False)
+    peak_bytes: int = 0
+    overhead_us: float = 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    @property
+    def cpu_us_per_request(self) -> float:
+        return self.cpu_seconds / self.requests * 1e6 if self.requests else 0.0
+
+    def percentile(self, percent: int) -> float:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[percent - 1]
+
+    def summary(self) -> dict[str, Any]:
+        data = asdict(self)
+        del data["latencies"]
+        data["requests_per_second"] = round(self.requests_per_second, 1)
+        data["cpu_us_per_request"] = round(self.cpu_us_per_request, 1)
+        for percent in (50, 90, 99):
+            data[f"p{percent}_ms"] = round(self.percentile(percent) * 1000, 3)
+        data["overhead_us"] = round(self.overhead_us, 1)
+        return data
+
+
+def _serve(options: dict[str, int], ready: Any) -> None:
+    server = FakeBlizzardServer(**options)
+    # Build the large bodies up front, so no scenario times their generation.
+    server.document("/data/wow/connected-realm/1146/auctions", {})
+    server.document("/data/wow/auctions/commodities", {})
+    server.start()
+    ready.send(server.url)
+    ready.recv()
+    server.stop()
+
+
+def _timed(call: Callable[[], Any], latencies: list[float]) -> Any:
+    start = time.perf_counter()
+    result = call()
+    latencies.append(time.perf_counter() - start)
+    return result
+
+
+class Bench:
+    """Runs the scenarios against one server."""
+
+    def __init__(self, url: str, calls: int, workers: int) -> None:
+        self.url = url
+        self.calls = calls
+        self.workers = workers
+        self.api = BlizzardApi("bench", "secret", REGION, LOCALE)
+        self.game_data = self.api.wow.game_data
+        self.game_data.get_item(1)  # fetch the token and open a connection
+
+    def raw(self) -> tuple[int, list[float]]:
+        session = requests.Session()
+        token = self.game_data._ensure_valid_token(REGION)
+        headers = {"Authorization": f"Bearer {token}"}
+        params = {"namespace": f"static-{REGION}", "locale": LOCALE}
+        latencies: list[float] = []
+        for item_id in range(self.calls):
+            url = f"{self.url}/data/wow/item/{item_id}"
+            _timed(
+                lambda: session.get(url, params=params, headers=headers).json(),
+                latencies,
+            )
+        return self.calls, latencies
+
+    def sequential(self) -> tuple[int, list[float]]:
+        latencies: list[float] = []
+        for item_id in range(self.calls):
+            _timed(lambda: self.game_data.get_item(item_id), latencies)
+        return self.calls, latencies
+
+    def threaded(self) -> tuple[int, list[float]]:
+        latencies: list[float] = []
+        with ThreadPoolExecutor(self.workers) as executor:
+            for item_id in range(self.calls):
+                executor.submit(
+                    _timed, lambda i=item_id: self.game_data.get_item(i), latencies
+                )
+        return self.calls, latencies
+
+    def async_(self) -> tuple[int, list[float]]:
+        from blizzardapi2.aio import AsyncBlizzardApi
+
+        async def run() -> list[float]:
+            latencies: list[float] = []
+            semaphore = asyncio.Semaphore(self.workers)
+            async with AsyncBlizzardApi("bench", "secret", REGION, LOCALE) as api:
+                game_data = api.wow.game_data
+
+                async def call(item_id: int) -> None:
+                    async with semaphore:
+                        start = time.perf_counter()
+                        await game_data.get_item(item_id)
+                        latencies.append(time.perf_counter() - start)
+
+                await call(0)
+                latencies.clear()
+                await asyncio.gather(*(call(i) for i in range(self.calls)))
+            return latencies
+
+        return self.calls, asyncio.run(run())
+
+    def search(self) -> tuple[int, list[float]]:
+        latencies: list[float] = []
+        results = _timed(
+            lambda: sum(1 for _ in self.game_data.iter_search_decor(_pageSize=100)),
+            latencies,
+        )
+        return -(-results // 100), latencies
+
+    def auctions(self) -> tuple[int, list[float]]:
+        latencies: list[float] = []
+        for _ in range(3):
+            _timed(lambda: self.game_data.get_auctions(1146), latencies)
+        return 3, latencies
+
+    def commodities(self) -> tuple[int, list[float]]:
+        latencies: list[float] = []
+        for _ in range(3):
+            _timed(lambda: self.game_data.get_commodities(), latencies)
+        return 3, latencies
+
+    def commodities_stream(self) -> tuple[int, list[float]]:
+        latencies: list[float] = []
+        for _ in range(3):
+            _timed(lambda: sum(1 for _ in self.game_data.iter_commodities()), latencies)
+        return 3, latencies
+
+
+SCENARIOS = {
+    "raw": Bench.raw,
+    "sequential": Bench.sequential,
+    "threaded": Bench.threaded,
+    "async": Bench.async_,
+    "search": Bench.search,
+    "auctions": Bench.auctions,
+    "commodities": Bench.commodities,
+    "commodities-stream": Bench.commodities_stream,
+}
+
+COLUMNS = {
+    "requests_per_second": "req/s",
+    "p50_ms": "p50 ms",
+    "p90_ms": "p90 ms",
+    "p99_ms": "p99 ms",
+    "cpu_us_per_request": "cpu us/req",
+    "overhead_us": "overhead us",
+    "peak_bytes": "peak bytes",
+}
+
+
+def measure(bench: Bench, name: str) -> Result:
+    """Time a scenario, then run it again under ``tracemalloc``."""
+    scenario = SCENARIOS[name]
+    start, cpu_start = time.perf_counter(), time.process_time()
+    requests_sent, latencies = scenario(bench)
+    seconds = time.perf_counter() - start
+    cpu_seconds = time.process_time() - cpu_start
+
+    calls, bench.calls = bench.calls, min(bench.calls, 200)
+    tracemalloc.start()
+    try:
+        scenario(bench)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        bench.calls = calls
+    return Result(name, requests_sent, seconds, cpu_seconds, latencies, peak)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "scenarios", nargs="*", metavar="scenario", help=", ".join(SCENARIOS)
+    )
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--auctions", type=int, default=20_000)
+    parser.add_argument("--commodities", type=int, default=100_000)
+    parser.add_argument("--search-results", type=int, default=5_000)
+    parser.add_argument("--json", type=Path, help="also write the results here")
+    args = parser.parse_args(argv)
+    names = args.scenarios or list(SCENARIOS)
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    if "async" in names:
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            print("skipping async: httpx is not installed", file=sys.stderr)
+            names.remove("async")
+
+    options = {
+        "auctions": args.auctions,
+        "commodities": args.commodities,
+        "search_results": args.search_results,
+    }
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_serve, args=(options, child))
+    process.start()
+    url = parent.recv()
+    results: list[Result] = []
+    try:
+        with redirect(url):
+            bench = Bench(url, args.calls, args.workers)
+            # The raw baseline always runs first.
+            for name in ["raw", *(name for name in names if name != "raw")]:
+                results.append(measure(bench, name))
+    finally:
+        parent.send("stop")
+        process.join()
+
+    # The server runs in another process, so the CPU time of this one is the
+    # client's own; the overhead is what it spends per call beyond requests.
+    baseline = results[0].cpu_us_per_request
+    for result in results:
+        if result.scenario in ("sequential", "threaded", "async"):
+            result.overhead_us = result.cpu_us_per_request - baseline
+
+    summaries = [result.summary() for result in results]
+    print(f"{'scenario':<20}" + "".join(f"{title:>14}" for title in COLUMNS.values()))
+    for summary in summaries:
+        values = "".join(f"{summary[column]:>14}" for column in COLUMNS)
+        print(f"{summary['scenario']:<20}{values}")
+    if args.json:
+        args.json.write_text(json.dumps(summaries, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
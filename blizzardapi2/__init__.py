@@ -1,5 +1,42 @@
 """__init__.py file."""
 
+from importlib import import_module
+from typing import Any
+
 from requests.exceptions import *  # noqa
 
+from .api import RawResponse  # noqa
+from .batch import ApiRequest, get_many, iter_completed  # noqa
 from .blizzard_api import BlizzardApi  # noqa
+from .cache import (  # noqa
+    ResponseCache,
+    ResponseStore,
+    SqliteResponseCache,
+    ValidatorCache,
+)
+from .context import ApiContext  # noqa
+from .hooks import MetricsCollector, RequestHooks  # noqa
+from .rate_limit import RateLimiter  # noqa
+from .retry import RetryPolicy  # noqa
+from .singleflight import SingleFlight  # noqa
+from .token_store import FileTokenStore, MemoryTokenStore, TokenStore  # noqa
+
+# Names whose modules are only imported on first use, so that importing the
+# package does not load the asyncio client, the HTTP/2 transport or recording.
+_LAZY = {
+    "AsyncBlizzardApi": ".aio",
+    "Http2Session": ".http2",
+    "RecordingSession": ".recording",
+    "ReplayMiss": ".recording",
+    "ReplaySession": ".recording",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        return getattr(import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
@@ -0,0 +1,4 @@
+"""Asyncio clients for the Blizzard API (requires the ``async`` extra)."""
+
+from .batch import get_many, iter_completed  # noqa
+from .blizzard_api import AsyncBlizzardApi  # noqa
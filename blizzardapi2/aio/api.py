@@ -0,0 +1,454 @@
+"""Asyncio counterparts of the shared API services.
+
+Every endpoint method in this library funnels through ``BaseApi._make_request``.
+``AsyncBaseApi`` replaces that single seam (and the token helpers it relies on)
+with coroutines backed by a pooled ``httpx.AsyncClient``. Endpoint classes then
+become asynchronous simply by mixing ``AsyncBaseApi`` in ahead of the
+synchronous class: each endpoint method returns the coroutine produced by
+``_make_request``, ready to be awaited.
+"""
+
+import asyncio
+import itertools
+import time
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Optional
+
+import requests
+
+from ..api import BaseApi, LocaleApi, RawResponse
+from ..batch import ApiRequest
+from ..cache import RequestKey, request_key
+from ..hooks import RequestInfo, exchange
+from ..http2 import _translate_errors
+from ..pagination import aiter_search_results
+from ..refresher import AsyncTokenRefresher
+from ..streaming import abatched, aiter_json_array
+from ..types import Region
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncBaseApi(BaseApi):
+    """Asyncio variant of ``BaseApi``.
+
+    Requests are sent through the context's ``httpx.AsyncClient`` so a single
+    event loop can keep many requests in flight over a shared connection pool.
+    Client-credentials tokens are refreshed under an ``asyncio.Lock``; the tokens
+    themselves live on the shared context, so sync and async clients built on the
+    same context reuse each other's token.
+    """
+
+    @property
+    def _async_session(self) -> "httpx.AsyncClient":
+        """The pooled async HTTP client shared through the API context."""
+        return self._context.async_session
+
+    @staticmethod
+    def _raise_for_status(response: "httpx.Response") -> None:
+        """Raise ``requests.HTTPError`` for an unsuccessful response.
+
+        The async transport is ``httpx``, but the library surfaces the same
+        ``requests`` exception types from both clients, so callers can catch
+        ``blizzardapi2.HTTPError`` regardless of which one they use.
+
+        Args:
+            response: The response to check.
+
+        Raises:
+            requests.HTTPError: If the response has a 4xx or 5xx status code.
+        """
+        if 400 <= response.status_code < 600:
+            raise requests.HTTPError(
+                f"{response.status_code} Error for url: {response.url}",
+                response=response,
+            )
+
+    async def _get_client_token(self, region: str) -> dict[str, Any]:
+        """Fetch an access token using client credentials flow.
+
+        Args:
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+
+        Returns:
+            The token response from the API.
+        """
+        url = self._build_oauth_url("/oauth/token", region)
+        start = time.perf_counter()
+        with _translate_errors():
+            response = await self._async_session.post(
+                url,
+                params={"grant_type": "client_credentials"},
+                auth=(self.client_id, self._client_secret),
+                timeout=self.DEFAULT_POST_TIMEOUT,
+            )
+        self._raise_for_status(response)
+        token_data = response.json()
+        self._store_client_token(region, token_data)
+        for hook in self._context.hooks:
+            hook.on_token_refresh(region, time.perf_counter() - start)
+        return token_data
+
+    @asynccontextmanager
+    async def _token_lock(self, region: str) -> AsyncIterator[None]:
+        """Hold the locks that serialize renewals of the region's token.
+
+        The asyncio lock queues coroutines of this process on the event loop;
+        the token store's lock, which may block on a file lock held by another
+        process, is then acquired from a worker thread.
+        """
+        key = self._token_key(region)
+        async with self._context.async_token_lock(key):
+            store_lock = self._context.token_store.lock(key)
+            acquire = asyncio.ensure_future(asyncio.to_thread(store_lock.__enter__))
+            try:
+                await asyncio.shield(acquire)
+            except asyncio.CancelledError:
+                # The worker thread still takes the lock after the waiter is
+                # cancelled; release it as soon as it does.
+                acquire.add_done_callback(
+                    lambda future: future.cancelled()
+                    or future.exception() is not None
+                    or store_lock.__exit__(None, None, None)
+                )
+                raise
+            try:
+                yield
+            finally:
+                store_lock.__exit__(None, None, None)
+
+    async def _ensure_valid_token(self, region: str) -> str:
+        """Ensure we have a valid client credentials token for a region.
+
+        Concurrent coroutines that find the token stale wait on the token
+        lock so only the first one performs the OAuth POST.
+        """
+        if not self._is_token_expired(region):
+            return self._cached_token(region).access_token
+        async with self._token_lock(region):
+            if self._is_token_expired(region):
+                await self._get_client_token(region)
+            return self._cached_token(region).access_token
+
+    async def _refresh_rejected_token(self, region: str, rejected: str) -> str:
+        """Replace a client token that the API answered with a 401."""
+        async with self._token_lock(region):
+            token = self._cached_token(region)
+            if token is None or token.access_token == rejected:
+                await self._get_client_token(region)
+            return self._cached_token(region).access_token
+
+    async def _renew_token(self, region: str, lead: timedelta = timedelta(0)) -> str:
+        """Fetch a new client token for a region unless another worker just did."""
+        async with self._token_lock(region):
+            token = self._cached_token(region)
+            if token is None or token.expires_within(self.TOKEN_REFRESH_BUFFER + lead):
+                await self._get_client_token(region)
+            return self._cached_token(region).access_token
+
+    def start_token_refresher(
+        self,
+        regions: Optional[Iterable[Region | str]] = None,
+        **kwargs: Any,
+    ) -> AsyncTokenRefresher:
+        """Start renewing client tokens in a background asyncio task.
+
+        Must be called from a running event loop.
+
+        Args:
+            regions: The regions whose tokens are kept fresh. Defaults to None,
+                in which case the default region provided at instantiation is used.
+            **kwargs: Scheduling options forwarded to ``AsyncTokenRefresher``
+                (``lead``, ``jitter``, ``retry_interval``).
+
+        Returns:
+            AsyncTokenRefresher: the running refresher. Await ``stop()`` or use it
+            as an async context manager to shut it down.
+
+        Raises:
+            ValueError: If ``regions`` is empty.
+        """
+        regions = regions if regions is not None else [Region(self.region)]
+        return AsyncTokenRefresher(self, regions, **kwargs).start()
+
+    async def _send(
+        self,
+        url: str,
+        region: str,
+        params: dict[str, Any],
+        headers: Optional[dict[str, str]],
+        token: str,
+        stream: bool = False,
+    ) -> "httpx.Response":
+        """Send a GET request with a bearer token.
+
+        The request waits for the context's rate limiter, if any, and is
+        retried according to the context's retry policy, if any. Every attempt
+        is reported to the context's hooks.
+
+        Args:
+            url: The complete URL to request.
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+            params: The query parameters, without any access token.
+            headers: Extra request headers.
+            token: The bearer token.
+            stream: Whether to defer downloading the body until it is read.
+                A streamed response must be closed with ``aclose()``.
+                Defaults to False.
+
+        Returns:
+            The response, whatever its status code.
+
+        Raises:
+            requests.Timeout: If the request timed out.
+            requests.ConnectionError: If the request failed in transport.
+        """
+        limiter = self._context.rate_limiter
+        hooks = self._context.hooks
+        attempts = itertools.count(1)
+        session = self._async_session
+        request_headers = {**(headers or {}), "Authorization": f"Bearer {token}"}
+
+        async def get() -> "httpx.Response":
+            if stream:
+                request = session.build_request(
+                    "GET",
+                    url,
+                    params=params,
+                    headers=request_headers,
+                    timeout=self.DEFAULT_GET_TIMEOUT,
+                )
+                return await session.send(request, stream=True)
+            return await session.get(
+                url,
+                params=params,
+                headers=request_headers,
+                timeout=self.DEFAULT_GET_TIMEOUT,
+            )
+
+        async def send() -> "httpx.Response":
+            if limiter is not None:
+                await limiter.acquire_async()
+            if not hooks:
+                return await get()
+            request = RequestInfo(url, region, params, next(attempts), stream)
+            with exchange(hooks, request) as observed:
+                response = await get()
+                observed.received(response)
+            return response
+
+        # Transport errors are retried as ``httpx`` errors, then surface as
+        # ``requests`` exceptions, like those of the sync clients.
+        with _translate_errors():
+            if self._context.retry_policy is None:
+                return await send()
+            import httpx
+
+            return await self._context.retry_policy.call_async(
+                send, (httpx.TransportError,)
+            )
+
+    async def _get(
+        self,
+        url: str,
+        region: str,
+        params: dict[str, Any],
+        user_token: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
+        stream: bool = False,
+    ) -> "httpx.Response":
+        """Send an authenticated GET request.
+
+        Args:
+            url: The complete URL to request.
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+            params: The query parameters, without any access token.
+            user_token: A user OAuth token. Defaults to None, in which case the
+                client-credentials token for the region is used.
+            headers: Extra request headers.
+            stream: Whether to defer downloading the body until it is read.
+                Defaults to False.
+
+        Returns:
+            The response, whatever its status code.
+        """
+        if user_token:
+            token = user_token
+        else:
+            token = await self._ensure_valid_token(region)
+
+        response = await self._send(url, region, params, headers, token, stream)
+
+        # Handle 401 errors for client credentials (not user tokens)
+        if response.status_code == 401 and not user_token:
+            if stream:
+                await response.aclose()
+            self._notify_unauthorized_retry(url, region, params, stream)
+            token = await self._refresh_rejected_token(region, token)
+            response = await self._send(url, region, params, headers, token, stream)
+
+        return response
+
+    async def _make_request(
+        self,
+        url: str,
+        region: str,
+        query_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Make an authenticated request to the API.
+
+        Args:
+            url: The complete URL to request.
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+            query_params: Optional query parameters.
+
+        Returns:
+            The API response as a dictionary.
+        """
+        params, user_token = self._split_user_token(query_params)
+        key = request_key(url, params)
+        if not user_token and self._context.response_cache is not None:
+            cached = self._context.response_cache.get(key)
+            if cached is not None:
+                return cached
+        flights = self._context.single_flight
+        if flights is None:
+            return await self._fetch(url, region, params, user_token, key)
+        # Calls with a user token only share flights with the same user.
+        flight_key = (key, user_token or self._token_key(region))
+        return await flights.do_async(
+            flight_key, lambda: self._fetch(url, region, params, user_token, key)
+        )
+
+    async def _fetch(
+        self,
+        url: str,
+        region: str,
+        params: dict[str, Any],
+        user_token: Optional[str],
+        key: RequestKey,
+    ) -> dict[str, Any]:
+        """Send a request that missed the response cache and decode it.
+
+        Args:
+            url: The complete URL to request.
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+            params: The query parameters, without any access token.
+            user_token: A user OAuth token, or None.
+            key: The request key, as built by ``request_key``.
+
+        Returns:
+            The API response as a dictionary.
+        """
+        validators = None if user_token else self._context.validator_cache
+        validated = validators.get(key) if validators is not None else None
+
+        response = await self._get(
+            url,
+            region,
+            params,
+            user_token,
+            validated.conditional_headers() if validated is not None else None,
+        )
+        if validated is not None and response.status_code == 304:
+            self._cache_response(
+                key, params, validated.value, validated.size, response.headers
+            )
+            return validated.value
+
+        self._raise_for_status(response)
+        data = self._decode(response)
+        if not user_token:
+            size = len(response.content)
+            if validators is not None:
+                validators.remember(key, response.headers, data, size)
+            self._cache_response(key, params, data, size, response.headers)
+        return data
+
+    async def _make_raw_request(
+        self,
+        url: str,
+        region: str,
+        query_params: Optional[dict[str, Any]] = None,
+    ) -> RawResponse:
+        """Make an authenticated request and return the undecoded response.
+
+        Args:
+            url: The complete URL to request.
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+            query_params: Optional query parameters.
+
+        Returns:
+            RawResponse: The response body and headers.
+        """
+        params, user_token = self._split_user_token(query_params)
+        response = await self._get(url, region, params, user_token)
+        self._raise_for_status(response)
+        return RawResponse(
+            response.content, response.headers, response.status_code, str(response.url)
+        )
+
+    def _stream_items(
+        self,
+        request: ApiRequest,
+        key: str,
+        batch_size: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """Stream the elements of an array member of a large response.
+
+        Args:
+            request: The request to send, as built by the ``deferred`` view.
+            key: The name of the array member of the response to stream.
+            batch_size: If given, yield lists of up to this many elements
+                instead of single elements. Defaults to None.
+
+        Returns:
+            An async iterator over the elements (or lists of elements). The
+            request is sent when iteration starts.
+        """
+        items = self._iter_json_array(request, key)
+        return abatched(items, batch_size) if batch_size else items
+
+    async def _iter_json_array(
+        self, request: ApiRequest, key: str
+    ) -> AsyncIterator[Any]:
+        params, user_token = self._split_user_token(request.query_params)
+        response = await self._get(
+            request.url, request.region, params, user_token, stream=True
+        )
+        try:
+            self._raise_for_status(response)
+            chunks = response.aiter_bytes(self.STREAM_CHUNK_SIZE)
+            with _translate_errors():
+                async for item in aiter_json_array(chunks, key):
+                    yield item
+        finally:
+            await response.aclose()
+
+    def _iter_search(
+        self,
+        search: Callable[..., ApiRequest],
+        prefetch: int,
+        query_params: dict[str, Any],
+    ) -> AsyncIterator[Any]:
+        """Iterate over the results of every page of a search.
+
+        Args:
+            search: A search method of this client's ``deferred`` view.
+            prefetch: The maximum number of pages requested ahead of the caller.
+            query_params: The search parameters. ``_page`` sets the first page.
+
+        Returns:
+            An async iterator over the results. The first page is requested
+            when iteration starts.
+        """
+        first_page = int(query_params.pop("_page", 1))
+        return aiter_search_results(
+            lambda page: search(**query_params, _page=page), first_page, prefetch
+        )
+
+
+class AsyncLocaleApi(AsyncBaseApi, LocaleApi):
+    """Asyncio variant of ``LocaleApi``."""
@@ -0,0 +1,98 @@
+"""Concurrent execution of deferred requests on an event loop.
+
+The asyncio counterparts of ``blizzardapi2.batch``: requests built from the
+``deferred`` view of an async client are sent concurrently, with at most
+``max_concurrency`` of them in flight at once.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Iterable
+
+from ..batch import ApiRequest
+
+DEFAULT_MAX_CONCURRENCY = 32
+
+
+async def _bounded(request: ApiRequest, semaphore: asyncio.Semaphore) -> Any:
+    async with semaphore:
+        return await request.execute()
+
+
+async def get_many(
+    requests: Iterable[ApiRequest],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Send many requests concurrently and collect their results in order.
+
+    Example:
+        ```python
+        items = await get_many(
+            [api.wow.game_data.deferred.get_item(item_id) for item_id in item_ids],
+            return_exceptions=True,
+        )
+        ```
+
+    Args:
+        requests: Requests built from the ``deferred`` view of an async client.
+        max_concurrency (keyword-only): The maximum number of requests in
+            flight. Defaults to 32.
+        return_exceptions (keyword-only): If True, a failed request puts its
+            exception in its slot of the results. Defaults to False, in which
+            case the first failure is raised and the other requests are
+            cancelled.
+
+    Returns:
+        list[Any]: The results, in the order of ``requests``.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    tasks = [
+        asyncio.ensure_future(_bounded(request, semaphore)) for request in requests
+    ]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def iter_completed(
+    requests: Iterable[ApiRequest],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> AsyncIterator[tuple[int, Any]]:
+    """Send many requests concurrently and yield results as they complete.
+
+    Args:
+        requests: Requests built from the ``deferred`` view of an async client.
+        max_concurrency (keyword-only): The maximum number of requests in
+            flight. Defaults to 32.
+        return_exceptions (keyword-only): If True, a failed request yields its
+            exception. Defaults to False, in which case it is raised and the
+            other requests are cancelled.
+
+    Yields:
+        tuple[int, Any]: The index of a request in ``requests`` and its result.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def indexed(position: int, request: ApiRequest) -> tuple[int, Any]:
+        try:
+            return position, await _bounded(request, semaphore)
+        except Exception as exc:
+            if not return_exceptions:
+                raise
+            return position, exc
+
+    tasks = [
+        asyncio.ensure_future(indexed(position, request))
+        for position, request in enumerate(requests)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,22 @@
+"""Asyncio Battle.net API client."""
+
+from ..battlenet.battlenet_api import BattlenetApi
+from ..battlenet.battlenet_oauth_api import BattlenetOAuthApi
+from ..endpoint import SubClient
+from .api import AsyncBaseApi
+
+
+class AsyncBattlenetOAuthApi(AsyncBaseApi, BattlenetOAuthApi):
+    """Battle.net OAuth API methods, returning awaitables."""
+
+
+class AsyncBattlenetApi(BattlenetApi):
+    """Asyncio Battle.net API client.
+
+    Attributes:
+        oauth: The async OAuth API client.
+    """
+
+    oauth = SubClient(
+        "blizzardapi2.aio.battlenet:AsyncBattlenetOAuthApi", localized=False
+    )
@@ -0,0 +1,69 @@
+"""Asyncio entry point for the Blizzard API client.
+
+``AsyncBlizzardApi`` mirrors ``BlizzardApi``: the same game properties expose
+the same endpoint methods, but every method returns an awaitable. All
+sub-clients share one context, and therefore one ``httpx.AsyncClient``
+connection pool and one client-credentials token.
+"""
+
+from typing import Any, Iterable, Optional
+
+from ..endpoint import ApiEndpoint, SubClient
+from ..refresher import AsyncTokenRefresher
+from ..types import Region
+
+
+class AsyncBlizzardApi(ApiEndpoint):
+    """Asyncio Blizzard API client.
+
+    Example:
+        ```python
+        async with AsyncBlizzardApi("your_id", "your_secret", Region.US) as api:
+            items = await asyncio.gather(
+                *(api.wow.game_data.get_item(item_id) for item_id in item_ids)
+            )
+        ```
+
+    Attributes:
+        wow: The async World of Warcraft API client.
+        diablo3: The async Diablo III API client.
+        hearthstone: The async Hearthstone API client.
+        starcraft2: The async StarCraft II API client.
+        battlenet: The async Battle.net API client.
+    """
+
+    wow = SubClient("blizzardapi2.aio.wow:AsyncWowApi")
+    diablo3 = SubClient("blizzardapi2.aio.diablo3:AsyncDiablo3Api")
+    hearthstone = SubClient("blizzardapi2.aio.hearthstone:AsyncHearthstoneApi")
+    starcraft2 = SubClient("blizzardapi2.aio.starcraft2:AsyncStarcraft2Api")
+    battlenet = SubClient(
+        "blizzardapi2.aio.battlenet:AsyncBattlenetApi", localized=False
+    )
+
+    def start_token_refresher(
+        self,
+        regions: Optional[Iterable[Region | str]] = None,
+        **kwargs: Any,
+    ) -> AsyncTokenRefresher:
+        """Start renewing client tokens ahead of expiry in an asyncio task.
+
+        Args:
+            regions: The regions whose tokens are kept fresh. Defaults to None,
+                in which case the default region provided at instantiation is used.
+            **kwargs: Scheduling options forwarded to ``AsyncTokenRefresher``
+                (``lead``, ``jitter``, ``retry_interval``).
+
+        Returns:
+            AsyncTokenRefresher: the running refresher.
+        """
+        return self.battlenet.oauth.start_token_refresher(regions, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the shared async HTTP client."""
+        await self.context.aclose()
+
+    async def __aenter__(self) -> "AsyncBlizzardApi":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,29 @@
+"""Asyncio Diablo III API client."""
+
+from ..diablo3.diablo3_api import Diablo3Api
+from ..diablo3.diablo3_community_api import Diablo3CommunityApi
+from ..diablo3.diablo3_game_data_api import Diablo3GameDataApi
+from ..endpoint import SubClient
+from .api import AsyncBaseApi
+
+
+class AsyncDiablo3CommunityApi(AsyncBaseApi, Diablo3CommunityApi):
+    """All Diablo 3 Community API methods, returning awaitables."""
+
+
+class AsyncDiablo3GameDataApi(AsyncBaseApi, Diablo3GameDataApi):
+    """All Diablo 3 Game Data API methods, returning awaitables."""
+
+
+class AsyncDiablo3Api(Diablo3Api):
+    """Asyncio Diablo III API client.
+
+    Attributes:
+        community: The async community API client.
+        game_data: The async game data API client.
+    """
+
+    community = SubClient("blizzardapi2.aio.diablo3:AsyncDiablo3CommunityApi")
+    game_data = SubClient(
+        "blizzardapi2.aio.diablo3:AsyncDiablo3GameDataApi", localized=False
+    )
@@ -0,0 +1,20 @@
+"""Asyncio Hearthstone API client."""
+
+from ..endpoint import SubClient
+from ..hearthstone.hearthstone_api import HearthstoneApi
+from ..hearthstone.hearthstone_game_data_api import HearthstoneGameDataApi
+from .api import AsyncBaseApi
+
+
+class AsyncHearthstoneGameDataApi(AsyncBaseApi, HearthstoneGameDataApi):
+    """All Hearthstone Game Data API methods, returning awaitables."""
+
+
+class AsyncHearthstoneApi(HearthstoneApi):
+    """Asyncio Hearthstone API client.
+
+    Attributes:
+        game_data: The async Hearthstone game-data API client.
+    """
+
+    game_data = SubClient("blizzardapi2.aio.hearthstone:AsyncHearthstoneGameDataApi")
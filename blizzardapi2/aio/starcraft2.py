@@ -0,0 +1,29 @@
+"""Asyncio StarCraft II API client."""
+
+from ..endpoint import SubClient
+from ..starcraft2.starcraft2_api import Starcraft2Api
+from ..starcraft2.starcraft2_community_api import Starcraft2CommunityApi
+from ..starcraft2.starcraft2_game_data_api import Starcraft2GameDataApi
+from .api import AsyncBaseApi
+
+
+class AsyncStarcraft2CommunityApi(AsyncBaseApi, Starcraft2CommunityApi):
+    """All Starcraft 2 Community API methods, returning awaitables."""
+
+
+class AsyncStarcraft2GameDataApi(AsyncBaseApi, Starcraft2GameDataApi):
+    """Starcraft2 Game Data API methods, returning awaitables."""
+
+
+class AsyncStarcraft2Api(Starcraft2Api):
+    """Asyncio StarCraft II API client.
+
+    Attributes:
+        community: The async community API client.
+        game_data: The async game data API client.
+    """
+
+    community = SubClient("blizzardapi2.aio.starcraft2:AsyncStarcraft2CommunityApi")
+    game_data = SubClient(
+        "blizzardapi2.aio.starcraft2:AsyncStarcraft2GameDataApi", localized=False
+    )
@@ -0,0 +1,27 @@
+"""Asyncio World of Warcraft API client."""
+
+from ..endpoint import SubClient
+from ..wow.wow_api import WowApi
+from ..wow.wow_game_data_api import WowGameDataApi
+from ..wow.wow_profile_api import WowProfileApi
+from .api import AsyncBaseApi
+
+
+class AsyncWowGameDataApi(AsyncBaseApi, WowGameDataApi):
+    """All Wow Game Data API methods, returning awaitables."""
+
+
+class AsyncWowProfileApi(AsyncBaseApi, WowProfileApi):
+    """All Wow Profile API methods, returning awaitables."""
+
+
+class AsyncWowApi(WowApi):
+    """Asyncio World of Warcraft API client.
+
+    Attributes:
+        game_data: The async game data API client.
+        profile: The async profile API client.
+    """
+
+    game_data = SubClient("blizzardapi2.aio.wow:AsyncWowGameDataApi")
+    profile = SubClient("blizzardapi2.aio.wow:AsyncWowProfileApi")
@@ -1,13 +1,54 @@
 """api.py file."""
 
+import contextlib
+import copy
+import itertools
+import time
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import Any, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Self,
+)
 
 import requests
 
+from .batch import ApiRequest
+from .cache import RequestKey, namespace_version, request_key
 from .endpoint import ApiEndpoint
+from .hooks import RequestInfo, exchange
+from .pagination import iter_search_results
+from .refresher import TokenRefresher
+from .streaming import batched, iter_json_array
+from .token_store import ClientToken, token_key
 from .types import Locale, OptionalLocale, OptionalRegion, Region
 
+if TYPE_CHECKING:
+    from .http2 import Http2Session
+
+
+@dataclass(frozen=True)
+class RawResponse:
+    """An undecoded API response, as returned by the ``raw`` view of a client.
+
+    Attributes:
+        content (bytes): The response body.
+        headers (Mapping[str, str]): The response headers.
+        status_code (int): The HTTP status code.
+        url (str): The URL of the response.
+    """
+
+    content: bytes
+    headers: Mapping[str, str]
+    status_code: int
+    url: str
+
 
 class BaseApi(ApiEndpoint):
     """Shared API services for Blizzard API clients.
@@ -35,16 +76,40 @@ class BaseApi(ApiEndpoint):
     DEFAULT_GET_TIMEOUT = 30.0
     DEFAULT_POST_TIMEOUT = 10.0
 
-    def extend_endpoint(self) -> None:
-        self._access_token: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
-        self._session = requests.Session()
+    # Size of the chunks read from streamed responses, in bytes.
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    @property
+    def _session(self) -> "requests.Session | Http2Session":
+        """The pooled HTTP session shared through the API context."""
+        return self._context.session
+
+    def _token_authority(self, region: Region | str) -> str:
+        """Get the OAuth authority that issues client tokens for a region.
+
+        Tokens are cached per authority rather than per region: every region
+        but CN shares the global OAuth host and therefore one token.
+
+        Args:
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+
+        Returns:
+            The base URL of the OAuth authority.
+        """
+        return self.OAUTH_URLS.get(region, self.OAUTH_URLS["default"])
+
+    def _token_key(self, region: Region | str) -> str:
+        """Get the token store key of this client's token for a region."""
+        return token_key(self.client_id, self._token_authority(region))
+
+    def _cached_token(self, region: Region | str) -> Optional[ClientToken]:
+        """Get the cached client-credentials token for a region, if any."""
+        return self._context.token_store.get(self._token_key(region))
 
-    def _is_token_expired(self) -> bool:
-        """Check if the token is expiring within the refresh buffer window."""
-        if self._token_expires_at is None:
-            return True
-        return datetime.now(UTC) >= self._token_expires_at - self.TOKEN_REFRESH_BUFFER
+    def _is_token_expired(self, region: Region | str) -> bool:
+        """Check if the region's token is missing or expiring within the refresh buffer window."""
+        token = self._cached_token(region)
+        return token is None or token.expires_within(self.TOKEN_REFRESH_BUFFER)
 
     def _get_client_token(self, region: str) -> dict[str, Any]:
         """Fetch an access token using client credentials flow.
@@ -56,6 +121,7 @@ class BaseApi(ApiEndpoint):
             The token response from the API.
         """
         url = self._build_oauth_url("/oauth/token", region)
+        start = time.perf_counter()
         response = self._session.post(
             url,
             params={"grant_type": "client_credentials"},
@@ -64,18 +130,117 @@ class BaseApi(ApiEndpoint):
         )
         response.raise_for_status()
         token_data = response.json()
+        self._store_client_token(region, token_data)
+        for hook in self._context.hooks:
+            hook.on_token_refresh(region, time.perf_counter() - start)
+        return token_data
 
-        # Store token and calculate expiration
-        self._access_token = token_data["access_token"]
+    def _store_client_token(
+        self, region: Region | str, token_data: dict[str, Any]
+    ) -> ClientToken:
+        """Cache a client-credentials token response under its authority.
+
+        Args:
+            region: The region the token was fetched for.
+            token_data: The token response from the OAuth endpoint.
+
+        Returns:
+            The cached token.
+        """
         expires_in = token_data.get("expires_in", 86400)  # Default 24 hours
-        self._token_expires_at = datetime.now(UTC) + timedelta(seconds=expires_in)
+        token = ClientToken(
+            access_token=token_data["access_token"],
+            expires_at=datetime.now(UTC) + timedelta(seconds=expires_in),
+        )
+        self._context.token_store.set(self._token_key(region), token)
+        return token
 
-        return token_data
+    def _ensure_valid_token(self, region: str) -> str:
+        """Ensure we have a valid client credentials token for a region.
+
+        The check is repeated under the token store's lock: when several
+        sub-clients, threads or (with a shared store) processes find the token
+        stale at the same moment, only the first one fetches a new token.
+
+        Args:
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+
+        Returns:
+            The access token to use for the region.
+        """
+        if not self._is_token_expired(region):
+            return self._cached_token(region).access_token
+        with self._context.token_store.lock(self._token_key(region)):
+            if self._is_token_expired(region):
+                self._get_client_token(region)
+            return self._cached_token(region).access_token
+
+    def _refresh_rejected_token(self, region: str, rejected: str) -> str:
+        """Replace a client token that the API answered with a 401.
+
+        If another caller already replaced the rejected token, the newer token
+        is reused instead of fetching yet another one.
+
+        Args:
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+            rejected: The access token that was rejected.
+
+        Returns:
+            The access token to retry with.
+        """
+        with self._context.token_store.lock(self._token_key(region)):
+            token = self._cached_token(region)
+            if token is None or token.access_token == rejected:
+                self._get_client_token(region)
+            return self._cached_token(region).access_token
+
+    def _renew_token(self, region: str, lead: timedelta = timedelta(0)) -> str:
+        """Fetch a new client token for a region ahead of the request path.
+
+        Used by the background refresher to renew tokens ahead of expiry. The
+        stored token is re-read under the token store's lock: if another
+        worker sharing the store renewed it in the meantime and it has more
+        than ``TOKEN_REFRESH_BUFFER + lead`` left, it is kept as is.
+
+        Args:
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+            lead: How long before the refresh window the token is renewed.
+                Defaults to no lead.
+
+        Returns:
+            The renewed (or freshly renewed by another worker) access token.
+        """
+        with self._context.token_store.lock(self._token_key(region)):
+            token = self._cached_token(region)
+            if token is None or token.expires_within(self.TOKEN_REFRESH_BUFFER + lead):
+                self._get_client_token(region)
+            return self._cached_token(region).access_token
 
-    def _ensure_valid_token(self, region: str) -> None:
-        """Ensure we have a valid client credentials token."""
-        if self._access_token is None or self._is_token_expired():
-            self._get_client_token(region)
+    def start_token_refresher(
+        self,
+        regions: Optional[Iterable[Region | str]] = None,
+        **kwargs: Any,
+    ) -> TokenRefresher:
+        """Start renewing client tokens in a background thread.
+
+        Tokens live on the shared context, so one refresher keeps every
+        sub-client of a ``BlizzardApi`` supplied with fresh tokens.
+
+        Args:
+            regions: The regions whose tokens are kept fresh. Defaults to None,
+                in which case the default region provided at instantiation is used.
+            **kwargs: Scheduling options forwarded to ``TokenRefresher``
+                (``lead``, ``jitter``, ``retry_interval``).
+
+        Returns:
+            TokenRefresher: the running refresher. Call ``stop()`` or use it as a
+            context manager to shut it down.
+
+        Raises:
+            ValueError: If ``regions`` is empty.
+        """
+        regions = regions if regions is not None else [Region(self.region)]
+        return TokenRefresher(self, regions, **kwargs).start()
 
     def _build_oauth_url(self, resource: str, region: Region | str) -> str:
         """Build URL for OAuth endpoints.
@@ -105,58 +270,385 @@ class BaseApi(ApiEndpoint):
         )
         return f"{base_url}{resource}"
 
-    def _make_request(
+    @property
+    def deferred(self) -> Self:
+        """Get a view of this client that describes requests instead of sending them.
+
+        Every endpoint method of the view returns an ``ApiRequest`` that can be
+        sent later with ``execute()``, or together with others through
+        ``get_many``.
+
+        Example:
+            ```python
+            request = api.wow.game_data.deferred.get_item(19019)
+            item = request.execute()
+            ```
+
+        Returns:
+            A copy of this client whose endpoint methods return ``ApiRequest``
+            objects.
+        """
+        view = copy.copy(self)
+
+        def describe(
+            url: str, region: str, query_params: Optional[dict[str, Any]] = None
+        ) -> ApiRequest:
+            return ApiRequest(self, url, region, dict(query_params or {}))
+
+        view._make_request = describe
+        return view
+
+    @property
+    def raw(self) -> Self:
+        """Get a view of this client that returns undecoded responses.
+
+        Every endpoint method of the view returns a ``RawResponse`` holding the
+        body bytes and headers, skipping JSON decoding and the response caches.
+        Useful to archive or forward payloads as they are.
+
+        Example:
+            ```python
+            response = api.wow.game_data.raw.get_commodities()
+            archive.write(response.content)
+            ```
+
+        Returns:
+            A copy of this client whose endpoint methods return ``RawResponse``
+            objects.
+        """
+        view = copy.copy(self)
+        view._make_request = self._make_raw_request
+        return view
+
+    def _make_raw_request(
         self,
         url: str,
         region: str,
         query_params: Optional[dict[str, Any]] = None,
-    ) -> dict[str, Any]:
-        """Make an authenticated request to the API.
+    ) -> RawResponse:
+        """Make an authenticated request and return the undecoded response.
 
         Args:
             url: The complete URL to request.
-            region: The region to query (e.g., us, eu, kr, tw, cn).  Defaults to None, in which case the default region provided at instantiation is used.
+            region: The region to query (e.g., us, eu, kr, tw, cn).
             query_params: Optional query parameters.
 
         Returns:
-            The API response as a dictionary.
+            RawResponse: The response body and headers.
         """
-        # Prepare query parameters
-        params = (query_params or {}).copy()
+        params, user_token = self._split_user_token(query_params)
+        response = self._get(url, region, params, user_token)
+        response.raise_for_status()
+        return RawResponse(
+            response.content, response.headers, response.status_code, str(response.url)
+        )
+
+    def _decode(self, response: requests.Response) -> Any:
+        """Decode a JSON response body with the context's decoder, if any.
+
+        Args:
+            response: A successful response.
 
-        # Check if user provided their own access token
+        Returns:
+            The decoded body.
+        """
+        if self._context.decoder is None:
+            return response.json()
+        return self._context.decoder(response.content)
+
+    @staticmethod
+    def _split_user_token(
+        query_params: Optional[dict[str, Any]],
+    ) -> tuple[dict[str, Any], Optional[str]]:
+        """Separate a user-supplied OAuth token from the query parameters.
+
+        User tokens travel in the ``Authorization`` header, never in the URL.
+        The caller's dict is copied, not mutated.
+
+        Args:
+            query_params: Optional query parameters.
+
+        Returns:
+            The remaining query parameters and the user token, if any.
+        """
+        params = (query_params or {}).copy()
         user_token = params.pop("access_token", None)
+        return params, user_token
 
+    def _send(
+        self,
+        url: str,
+        region: str,
+        params: dict[str, Any],
+        headers: Optional[dict[str, str]],
+        token: str,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a GET request with a bearer token.
+
+        The request waits for the context's rate limiter, if any, and is
+        retried according to the context's retry policy, if any. Every attempt
+        is reported to the context's hooks.
+
+        Args:
+            url: The complete URL to request.
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+            params: The query parameters, without any access token.
+            headers: Extra request headers.
+            token: The bearer token.
+            stream: Whether to defer downloading the body until it is read.
+                Defaults to False.
+
+        Returns:
+            The response, whatever its status code.
+        """
+        limiter = self._context.rate_limiter
+        hooks = self._context.hooks
+        attempts = itertools.count(1)
+
+        def get() -> requests.Response:
+            return self._session.get(
+                url,
+                params=params,
+                headers={**(headers or {}), "Authorization": f"Bearer {token}"},
+                timeout=self.DEFAULT_GET_TIMEOUT,
+                stream=stream,
+            )
+
+        def send() -> requests.Response:
+            if limiter is not None:
+                limiter.acquire()
+            if not hooks:
+                return get()
+            request = RequestInfo(url, region, params, next(attempts), stream)
+            with exchange(hooks, request) as observed:
+                response = get()
+                observed.received(response)
+            return response
+
+        if self._context.retry_policy is None:
+            return send()
+        return self._context.retry_policy.call(send)
+
+    def _get(
+        self,
+        url: str,
+        region: str,
+        params: dict[str, Any],
+        user_token: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send an authenticated GET request.
+
+        Args:
+            url: The complete URL to request.
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+            params: The query parameters, without any access token.
+            user_token: A user OAuth token. Defaults to None, in which case the
+                client-credentials token for the region is used.
+            headers: Extra request headers.
+            stream: Whether to defer downloading the body until it is read.
+                Defaults to False.
+
+        Returns:
+            The response, whatever its status code.
+        """
         # Determine which token to use
         if user_token:
             # Use user-provided token (for OAuth user endpoints)
             token = user_token
         else:
             # Ensure client credentials token is valid
-            self._ensure_valid_token(region)
-            token = self._access_token
+            token = self._ensure_valid_token(region)
 
         # Make the request
-        response = self._session.get(
-            url,
-            params=params,
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=self.DEFAULT_GET_TIMEOUT,
-        )
+        response = self._send(url, region, params, headers, token, stream)
 
         # Handle 401 errors for client credentials (not user tokens)
         if response.status_code == 401 and not user_token:
             # Token might have expired, refresh and retry
-            self._get_client_token(region)
-            response = self._session.get(
-                url,
-                params=params,
-                headers={"Authorization": f"Bearer {self._access_token}"},
-                timeout=self.DEFAULT_GET_TIMEOUT,
+            response.close()
+            self._notify_unauthorized_retry(url, region, params, stream)
+            token = self._refresh_rejected_token(region, token)
+            response = self._send(url, region, params, headers, token, stream)
+
+        return response
+
+    def _notify_unauthorized_retry(
+        self, url: str, region: str, params: dict[str, Any], stream: bool
+    ) -> None:
+        """Report a ``401`` answer that leads to a retry to the context's hooks."""
+        if self._context.hooks:
+            request = RequestInfo(url, region, params, stream=stream)
+            for hook in self._context.hooks:
+                hook.on_unauthorized_retry(request)
+
+    def _cache_response(
+        self,
+        key: RequestKey,
+        params: dict[str, Any],
+        data: Any,
+        size: int,
+        headers: Mapping[str, str],
+    ) -> None:
+        """Keep a decoded response in the context's response cache, if any.
+
+        Args:
+            key: The request key, as built by ``request_key``.
+            params: The query parameters of the request.
+            data: The decoded response body.
+            size: The length of the encoded response body, in bytes.
+            headers: The response headers.
+        """
+        if self._context.response_cache is not None:
+            self._context.response_cache.put(
+                key,
+                data,
+                params.get("namespace"),
+                size,
+                namespace_version(headers, data),
             )
 
+    def _make_request(
+        self,
+        url: str,
+        region: str,
+        query_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Make an authenticated request to the API.
+
+        When the context has a ``ResponseCache``, fresh client-credentials
+        responses are served from memory. When it has a ``ValidatorCache``,
+        the others are revalidated with ``If-Modified-Since`` and a
+        ``304 Not Modified`` answer is served from the remembered body. When it
+        has a ``SingleFlight``, identical concurrent calls share one request.
+
+        Args:
+            url: The complete URL to request.
+            region: The region to query (e.g., us, eu, kr, tw, cn).  Defaults to None, in which case the default region provided at instantiation is used.
+            query_params: Optional query parameters.
+
+        Returns:
+            The API response as a dictionary.
+        """
+        params, user_token = self._split_user_token(query_params)
+        key = request_key(url, params)
+        if not user_token and self._context.response_cache is not None:
+            cached = self._context.response_cache.get(key)
+            if cached is not None:
+                return cached
+        flights = self._context.single_flight
+        if flights is None:
+            return self._fetch(url, region, params, user_token, key)
+        # Calls with a user token only share flights with the same user.
+        flight_key = (key, user_token or self._token_key(region))
+        return flights.do(
+            flight_key, lambda: self._fetch(url, region, params, user_token, key)
+        )
+
+    def _fetch(
+        self,
+        url: str,
+        region: str,
+        params: dict[str, Any],
+        user_token: Optional[str],
+        key: RequestKey,
+    ) -> dict[str, Any]:
+        """Send a request that missed the response cache and decode it.
+
+        Args:
+            url: The complete URL to request.
+            region: The region to query (e.g., us, eu, kr, tw, cn).
+            params: The query parameters, without any access token.
+            user_token: A user OAuth token, or None.
+            key: The request key, as built by ``request_key``.
+
+        Returns:
+            The API response as a dictionary.
+        """
+        validators = None if user_token else self._context.validator_cache
+        validated = validators.get(key) if validators is not None else None
+
+        response = self._get(
+            url,
+            region,
+            params,
+            user_token,
+            validated.conditional_headers() if validated is not None else None,
+        )
+        if validated is not None and response.status_code == 304:
+            self._cache_response(
+                key, params, validated.value, validated.size, response.headers
+            )
+            return validated.value
+
         response.raise_for_status()
-        return response.json()
+        data = self._decode(response)
+        if not user_token:
+            size = len(response.content)
+            if validators is not None:
+                validators.remember(key, response.headers, data, size)
+            self._cache_response(key, params, data, size, response.headers)
+        return data
+
+    def _stream_items(
+        self,
+        request: ApiRequest,
+        key: str,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Stream the elements of an array member of a large response.
+
+        The body is downloaded and parsed incrementally, so memory use does
+        not grow with the size of the array. Streamed responses bypass the
+        response caches.
+
+        Args:
+            request: The request to send, as built by the ``deferred`` view.
+            key: The name of the array member of the response to stream.
+            batch_size: If given, yield lists of up to this many elements
+                instead of single elements. Defaults to None.
+
+        Returns:
+            An iterator over the elements (or lists of elements). The request
+            is sent when iteration starts.
+        """
+        items = self._iter_json_array(request, key)
+        return batched(items, batch_size) if batch_size else items
+
+    def _iter_json_array(self, request: ApiRequest, key: str) -> Iterator[Any]:
+        params, user_token = self._split_user_token(request.query_params)
+        response = self._get(
+            request.url, request.region, params, user_token, stream=True
+        )
+        with contextlib.closing(response):
+            response.raise_for_status()
+            yield from iter_json_array(
+                response.iter_content(self.STREAM_CHUNK_SIZE), key
+            )
+
+    def _iter_search(
+        self,
+        search: Callable[..., ApiRequest],
+        prefetch: int,
+        query_params: dict[str, Any],
+    ) -> Iterator[Any]:
+        """Iterate over the results of every page of a search.
+
+        Args:
+            search: A search method of this client's ``deferred`` view.
+            prefetch: The maximum number of pages requested ahead of the caller.
+            query_params: The search parameters. ``_page`` sets the first page.
+
+        Returns:
+            An iterator over the results. The first page is requested when
+            iteration starts.
+        """
+        first_page = int(query_params.pop("_page", 1))
+        return iter_search_results(
+            lambda page: search(**query_params, _page=page), first_page, prefetch
+        )
 
     def get_resource(
         self,
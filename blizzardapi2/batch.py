@@ -0,0 +1,131 @@
+"""batch.py file.
+
+Deferred requests and concurrent execution of many of them.
+
+Every endpoint method builds a URL and query parameters, then hands them to
+``BaseApi._make_request``. The ``deferred`` view of a client stops at that
+point and returns an ``ApiRequest`` describing the call instead of sending it.
+``get_many`` and ``iter_completed`` then run lists of such requests on a
+bounded thread pool.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from .api import BaseApi
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class ApiRequest:
+    """A described but unsent API request.
+
+    Built by the endpoint methods of a client's ``deferred`` view, e.g.
+    ``api.wow.game_data.deferred.get_item(19019)``.
+
+    Attributes:
+        api (BaseApi): The client that sends the request.
+        url (str): The complete URL to request.
+        region (str): The region to query.
+        query_params (dict[str, Any]): The query parameters.
+    """
+
+    api: "BaseApi" = field(repr=False)
+    url: str
+    region: str
+    query_params: dict[str, Any] = field(default_factory=dict)
+
+    def execute(self) -> Any:
+        """Send the request.
+
+        Returns:
+            The API response as a dictionary, or, for the async clients, a
+            coroutine resolving to it.
+        """
+        return self.api._make_request(self.url, self.region, self.query_params)
+
+
+def _run(
+    requests: Iterable[ApiRequest], max_workers: int
+) -> tuple[ThreadPoolExecutor, list[Future]]:
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="blizzardapi2-batch"
+    )
+    return executor, [executor.submit(request.execute) for request in requests]
+
+
+def _outcome(future: Future, return_exceptions: bool) -> Any:
+    if return_exceptions:
+        return future.exception() or future.result()
+    return future.result()
+
+
+def get_many(
+    requests: Iterable[ApiRequest],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Send many requests concurrently and collect their results in order.
+
+    Example:
+        ```python
+        items = get_many(
+            [api.wow.game_data.deferred.get_item(item_id) for item_id in item_ids],
+            max_workers=16,
+            return_exceptions=True,
+        )
+        ```
+
+    Args:
+        requests: The requests to send.
+        max_workers (keyword-only): The maximum number of requests in flight.
+            Defaults to 8. Keep it within the connection pool size of the
+            session (10 for a default ``requests.Session``) to reuse every
+            connection.
+        return_exceptions (keyword-only): If True, a failed request puts its
+            exception in its slot of the results. Defaults to False, in which
+            case the first failure (in input order) is raised once every
+            request has completed.
+
+    Returns:
+        list[Any]: The results, in the order of ``requests``.
+    """
+    executor, futures = _run(requests, max_workers)
+    with executor:
+        wait(futures)
+    return [_outcome(future, return_exceptions) for future in futures]
+
+
+def iter_completed(
+    requests: Iterable[ApiRequest],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    return_exceptions: bool = False,
+) -> Iterator[tuple[int, Any]]:
+    """Send many requests concurrently and yield results as they complete.
+
+    Args:
+        requests: The requests to send.
+        max_workers (keyword-only): The maximum number of requests in flight.
+            Defaults to 8.
+        return_exceptions (keyword-only): If True, a failed request yields its
+            exception. Defaults to False, in which case it is raised and the
+            requests not yet started are cancelled.
+
+    Yields:
+        tuple[int, Any]: The index of a request in ``requests`` and its result.
+    """
+    executor, futures = _run(requests, max_workers)
+    index = {future: position for position, future in enumerate(futures)}
+    pending: set[Future] = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=index.__getitem__):
+                yield index[future], _outcome(future, return_exceptions)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -1,7 +1,6 @@
 """battlenet_api.py file."""
 
-from ..endpoint import ApiEndpoint
-from .battlenet_oauth_api import BattlenetOAuthApi
+from ..endpoint import ApiEndpoint, SubClient
 
 
 class BattlenetApi(ApiEndpoint):
@@ -14,6 +13,7 @@ class BattlenetApi(ApiEndpoint):
         oauth (BattlenetOAuthApi): An instance of the BattlenetOAuthApi class for accessing OAuth endpoints.
     """
 
-    def extend_endpoint(self) -> None:
-        """Init BattlenetApi."""
-        self.oauth = BattlenetOAuthApi(self.client_id, self.client_secret, self.region)
+    oauth = SubClient(
+        "blizzardapi2.battlenet.battlenet_oauth_api:BattlenetOAuthApi",
+        localized=False,
+    )
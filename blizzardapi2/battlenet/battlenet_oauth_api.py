@@ -7,9 +7,11 @@ including user information and authentication.
 from typing import Any
 
 from ..api import BaseApi
+from ..registry import path_templates
 from ..types import OptionalRegion
 
 
+@path_templates("/oauth/userinfo")
 class BattlenetOAuthApi(BaseApi):
     """Battle.net OAuth API client.
 
@@ -2,15 +2,15 @@
 
 This module provides a unified interface to all Blizzard game APIs through
 a single client instance. Each game's API is accessible through its own
-property on the main client.
+property on the main client, and is only imported and created the first time
+that property is read.
 """
 
-from .battlenet.battlenet_api import BattlenetApi
-from .diablo3.diablo3_api import Diablo3Api
-from .endpoint import ApiEndpoint
-from .hearthstone.hearthstone_api import HearthstoneApi
-from .starcraft2.starcraft2_api import Starcraft2Api
-from .wow.wow_api import WowApi
+from typing import Any, Iterable, Optional
+
+from .endpoint import ApiEndpoint, SubClient
+from .refresher import TokenRefresher
+from .types import Region
 
 
 class BlizzardApi(ApiEndpoint):
@@ -28,15 +28,31 @@ class BlizzardApi(ApiEndpoint):
         battlenet: The Battle.net API client.
     """
 
-    def extend_endpoint(self) -> None:
-        self.wow = WowApi(self.client_id, self.client_secret, self.region, self.locale)
-        self.diablo3 = Diablo3Api(
-            self.client_id, self.client_secret, self.region, self.locale
-        )
-        self.hearthstone = HearthstoneApi(
-            self.client_id, self.client_secret, self.region, self.locale
-        )
-        self.starcraft2 = Starcraft2Api(
-            self.client_id, self.client_secret, self.region, self.locale
-        )
-        self.battlenet = BattlenetApi(self.client_id, self.client_secret, self.region)
+    wow = SubClient("blizzardapi2.wow.wow_api:WowApi")
+    diablo3 = SubClient("blizzardapi2.diablo3.diablo3_api:Diablo3Api")
+    hearthstone = SubClient("blizzardapi2.hearthstone.hearthstone_api:HearthstoneApi")
+    starcraft2 = SubClient("blizzardapi2.starcraft2.starcraft2_api:Starcraft2Api")
+    battlenet = SubClient(
+        "blizzardapi2.battlenet.battlenet_api:BattlenetApi", localized=False
+    )
+
+    def start_token_refresher(
+        self,
+        regions: Optional[Iterable[Region | str]] = None,
+        **kwargs: Any,
+    ) -> TokenRefresher:
+        """Start renewing client tokens ahead of expiry in a background thread.
+
+        Every sub-client shares this client's context, so the refresher keeps
+        all of them supplied with fresh tokens.
+
+        Args:
+            regions: The regions whose tokens are kept fresh. Defaults to None,
+                in which case the default region provided at instantiation is used.
+            **kwargs: Scheduling options forwarded to ``TokenRefresher``
+                (``lead``, ``jitter``, ``retry_interval``).
+
+        Returns:
+            TokenRefresher: the running refresher.
+        """
+        return self.battlenet.oauth.start_token_refresher(regions, **kwargs)
@@ -0,0 +1,613 @@
+"""cache.py file.
+
+Response reuse for ``BaseApi._make_request``.
+
+``ResponseCache`` keeps decoded responses in memory for a time that depends on
+the namespace they were requested in, so repeated calls for static game data
+never leave the process; ``SqliteResponseCache`` keeps them in a SQLite file so
+they also survive restarts. ``ValidatorCache`` remembers the ``Last-Modified``
+and ``ETag`` validators of responses together with their decoded bodies.
+Requests for the same URL and query parameters are then sent as conditional
+GETs, and a ``304 Not Modified`` answer is served from the remembered body
+without downloading or decoding it again.
+
+Cached bodies are shared between callers and must be treated as read-only.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+from urllib.parse import parse_qs, urlsplit
+
+RequestKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def request_key(url: str, params: Mapping[str, Any]) -> RequestKey:
+    """Build the cache key of a GET request.
+
+    Args:
+        url: The complete URL of the request.
+        params: The query parameters, without any access token.
+
+    Returns:
+        RequestKey: a hashable key that ignores query-parameter order.
+    """
+    return url, tuple(sorted((str(name), str(value)) for name, value in params.items()))
+
+
+@dataclass(frozen=True)
+class Validated:
+    """A decoded response body and the validators it was served with.
+
+    Attributes:
+        value (Any): The decoded response body.
+        last_modified (str, optional): The ``Last-Modified`` response header.
+        etag (str, optional): The ``ETag`` response header.
+        size (int): The length of the encoded response body, in bytes.
+    """
+
+    value: Any
+    last_modified: Optional[str] = None
+    etag: Optional[str] = None
+    size: int = 0
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Get the request headers that revalidate this response.
+
+        Returns:
+            dict[str, str]: ``If-Modified-Since`` and/or ``If-None-Match``.
+        """
+        headers = {}
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        return headers
+
+
+class ValidatorCache:
+    """Remembers validators and bodies for conditional GET revalidation.
+
+    Like ``ResponseCache``, the cache is bounded both by entry count and by the
+    approximate memory of the entries, measured as the length of their encoded
+    bodies; the least recently used entries are evicted first. Only requests
+    made with the client-credentials token are remembered; requests carrying a
+    user OAuth token return per-user data and always go to the network
+    unconditionally.
+
+    Example:
+        ```python
+        context = ApiContext(validator_cache=ValidatorCache())
+        api = BlizzardApi("your_id", "your_secret", Region.US, context=context)
+        api.wow.game_data.get_commodities()  # 200, body downloaded
+        api.wow.game_data.get_commodities()  # 304, body reused
+        ```
+    """
+
+    DEFAULT_MAX_ENTRIES = 256
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: The number of responses to remember. The least
+                recently used response is forgotten first. Defaults to 256.
+            max_bytes (keyword-only): The maximum total size of the remembered
+                responses, in bytes of encoded body. Responses larger than this
+                are never remembered. Defaults to 256 MiB.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[RequestKey, Validated] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Get the approximate memory of the remembered responses, in bytes."""
+        return self._bytes
+
+    def get(self, key: RequestKey) -> Optional[Validated]:
+        """Get the remembered response for a request.
+
+        Args:
+            key: The request key, as built by ``request_key``.
+
+        Returns:
+            Validated, optional: the remembered response, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def remember(
+        self, key: RequestKey, headers: Mapping[str, str], value: Any, size: int = 0
+    ) -> None:
+        """Remember a response if it carries a validator.
+
+        A response larger than ``max_bytes`` is not remembered, and the
+        response previously remembered for the same request is forgotten.
+
+        Args:
+            key: The request key, as built by ``request_key``.
+            headers: The response headers.
+            value: The decoded response body.
+            size: The length of the encoded response body, in bytes.
+        """
+        last_modified = headers.get("Last-Modified")
+        etag = headers.get("ETag")
+        if not last_modified and not etag:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            if size > self.max_bytes:
+                return
+            self._entries[key] = Validated(value, last_modified, etag, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+
+    def clear(self) -> None:
+        """Forget every remembered response."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def namespace_kind(namespace: Optional[str]) -> Optional[str]:
+    """Get the kind of a Game Data namespace.
+
+    Args:
+        namespace: The ``namespace`` query parameter (e.g. ``static-us`` or
+            ``dynamic-classic-eu``), or None.
+
+    Returns:
+        str, optional: ``static``, ``dynamic`` or ``profile``, or None for
+        requests made outside of a namespace.
+    """
+    if not namespace:
+        return None
+    return str(namespace).split("-", 1)[0]
+
+
+def namespace_version(headers: Mapping[str, str], value: Any) -> Optional[str]:
+    """Get the versioned namespace a response was served from.
+
+    Game Data responses name the exact namespace version they come from (e.g.
+    ``static-11.0.2_56313-us``) in the ``Battlenet-Namespace`` header and in
+    the ``namespace`` parameter of their ``_links.self.href``.
+
+    Args:
+        headers: The response headers.
+        value: The decoded response body.
+
+    Returns:
+        str, optional: The versioned namespace, or None if the response does
+        not name one.
+    """
+    version = headers.get("Battlenet-Namespace")
+    if isinstance(version, str) and version:
+        return version
+    if isinstance(value, dict):
+        href = value.get("_links", {}).get("self", {}).get("href")
+        if isinstance(href, str):
+            namespaces = parse_qs(urlsplit(href).query).get("namespace")
+            if namespaces:
+                return namespaces[0]
+    return None
+
+
+def _version_order(version: str) -> tuple[int, ...]:
+    """Order the versions of a namespace by the numbers of their game build."""
+    return tuple(int(number) for number in re.findall(r"\d+", version))
+
+
+class ResponseStore(ABC):
+    """Interface for response caches used by ``BaseApi._make_request``.
+
+    Holds the time-to-live policy shared by every cache. World of Warcraft
+    resources live in a ``static`` namespace (items, classes, ...: changes
+    with game patches), a ``dynamic`` namespace (realms, auctions, tokens,
+    ...: changes during the day) or a ``profile`` namespace (characters and
+    guilds). Each kind gets its own time-to-live; resources of the other
+    games, which have no namespace, use ``default_ttl``. A TTL of 0 disables
+    caching for that kind.
+
+    Subclass and implement ``get``, ``put`` and ``clear`` to keep responses
+    somewhere else.
+    """
+
+    DEFAULT_TTLS: Mapping[str, float] = {
+        "static": 6 * 60 * 60,
+        "dynamic": 5 * 60,
+        "profile": 60,
+    }
+    DEFAULT_TTL: float = 5 * 60
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        *,
+        default_ttl: Optional[float] = None,
+    ) -> None:
+        """Initialize the time-to-live policy.
+
+        Args:
+            ttls: Time-to-live in seconds per namespace kind (``static``,
+                ``dynamic``, ``profile``). Merged over ``DEFAULT_TTLS``.
+            default_ttl (keyword-only): Time-to-live in seconds of responses
+                requested outside of a namespace. Defaults to ``DEFAULT_TTL``.
+        """
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = self.DEFAULT_TTL if default_ttl is None else default_ttl
+
+    def ttl(self, namespace: Optional[str]) -> float:
+        """Get the time-to-live of responses requested in a namespace.
+
+        Args:
+            namespace: The ``namespace`` query parameter, or None.
+
+        Returns:
+            float: The time-to-live in seconds.
+        """
+        kind = namespace_kind(namespace)
+        if kind is None:
+            return self.default_ttl
+        return self.ttls.get(kind, self.default_ttl)
+
+    @abstractmethod
+    def get(self, key: RequestKey) -> Optional[Any]:
+        """Get a fresh response.
+
+        Args:
+            key: The request key, as built by ``request_key``.
+
+        Returns:
+            Any, optional: the decoded response body, or None if it is not
+            cached or has expired.
+        """
+
+    @abstractmethod
+    def put(
+        self,
+        key: RequestKey,
+        value: Any,
+        namespace: Optional[str],
+        size: int = 0,
+        version: Optional[str] = None,
+    ) -> None:
+        """Keep a response.
+
+        Args:
+            key: The request key, as built by ``request_key``.
+            value: The decoded response body.
+            namespace: The ``namespace`` query parameter of the request, or None.
+            size: The length of the encoded response body, in bytes.
+            version: The versioned namespace the response was served from, as
+                returned by ``namespace_version``.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget every kept response."""
+
+
+class ResponseCache(ResponseStore):
+    """Keeps decoded responses in memory for a namespace-dependent time.
+
+    The cache is bounded both by entry count and by the approximate memory of
+    the entries, measured as the length of their encoded bodies; the least
+    recently used entries are evicted first. Requests carrying a user OAuth
+    token are never cached.
+
+    Example:
+        ```python
+        context = ApiContext(response_cache=ResponseCache(ttls={"static": 86400}))
+        api = BlizzardApi("your_id", "your_secret", Region.US, context=context)
+        api.wow.game_data.get_playable_class(7)  # network
+        api.wow.game_data.get_playable_class(7)  # served from memory
+        ```
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        *,
+        default_ttl: Optional[float] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttls: Time-to-live in seconds per namespace kind (``static``,
+                ``dynamic``, ``profile``). Merged over ``DEFAULT_TTLS``.
+            default_ttl (keyword-only): Time-to-live in seconds of responses
+                requested outside of a namespace. Defaults to 5 minutes.
+            max_entries (keyword-only): The maximum number of responses kept.
+                Defaults to 1024.
+            max_bytes (keyword-only): The maximum total size of the kept
+                responses, in bytes of encoded body. Responses larger than this
+                are never kept. Defaults to 64 MiB.
+        """
+        super().__init__(ttls, default_ttl=default_ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[RequestKey, tuple[float, int, Any]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Get the approximate memory of the kept responses, in bytes."""
+        return self._bytes
+
+    def get(self, key: RequestKey) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, size, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._bytes -= size
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(
+        self,
+        key: RequestKey,
+        value: Any,
+        namespace: Optional[str],
+        size: int = 0,
+        version: Optional[str] = None,
+    ) -> None:
+        ttl = self.ttl(namespace)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteResponseCache(ResponseStore):
+    """Keeps decoded responses in a SQLite file that survives restarts.
+
+    Meant for the ``static`` namespace (items, spells, achievements, journal
+    data, ...), which only changes with game patches: by default only static
+    responses are kept, for a day. Pass ``default_ttl`` to also keep the
+    responses of the other games (e.g. Hearthstone cards).
+
+    Responses are keyed by resource URL (which carries the region), namespace,
+    locale and the remaining query parameters, and looked up through the
+    table's primary key. Each response records the versioned namespace it was
+    served from; when a response from a newer version of a namespace is
+    stored, every response from the older versions of that namespace is
+    dropped. A response from an older version than the latest one seen (e.g.
+    a delayed answer from a lagging CDN edge) is not kept and drops nothing.
+
+    The file may be shared by several processes.
+
+    Example:
+        ```python
+        cache = SqliteResponseCache("/var/cache/blizzardapi2/static.sqlite3")
+        api = BlizzardApi("your_id", "your_secret", Region.US,
+                          context=ApiContext(response_cache=cache))
+        api.wow.game_data.get_item(19019)  # network, once per patch
+        ```
+    """
+
+    DEFAULT_TTLS: Mapping[str, float] = {
+        "static": 24 * 60 * 60,
+        "dynamic": 0,
+        "profile": 0,
+    }
+    DEFAULT_TTL: float = 0
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            url TEXT NOT NULL,
+            namespace TEXT NOT NULL,
+            locale TEXT NOT NULL,
+            params TEXT NOT NULL,
+            version TEXT,
+            expires_at REAL NOT NULL,
+            body TEXT NOT NULL,
+            PRIMARY KEY (url, namespace, locale, params)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS responses_by_version
+            ON responses (namespace, version);
+        CREATE TABLE IF NOT EXISTS namespaces (
+            namespace TEXT PRIMARY KEY,
+            version TEXT NOT NULL
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        ttls: Optional[Mapping[str, float]] = None,
+        *,
+        default_ttl: Optional[float] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: The SQLite file. Created if it does not exist.
+            ttls: Time-to-live in seconds per namespace kind (``static``,
+                ``dynamic``, ``profile``). Merged over ``DEFAULT_TTLS``.
+            default_ttl (keyword-only): Time-to-live in seconds of responses
+                requested outside of a namespace. Defaults to 0 (not kept).
+        """
+        import sqlite3
+
+        super().__init__(ttls, default_ttl=default_ttl)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            os.fspath(path), timeout=30, check_same_thread=False
+        )
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(self._SCHEMA)
+
+    @staticmethod
+    def _columns(key: RequestKey) -> tuple[str, str, str, str]:
+        """Split a request key into the key columns of the table."""
+        url, params = key
+        namespace = locale = ""
+        others = []
+        for name, value in params:
+            if name == "namespace":
+                namespace = value
+            elif name == "locale":
+                locale = value
+            else:
+                others.append((name, value))
+        return url, namespace, locale, json.dumps(others, separators=(",", ":"))
+
+    def get(self, key: RequestKey) -> Optional[Any]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, expires_at FROM responses"
+                " WHERE url = ? AND namespace = ? AND locale = ? AND params = ?",
+                self._columns(key),
+            ).fetchone()
+        if row is None or time.time() >= row[1]:
+            return None
+        return json.loads(row[0])
+
+    def put(
+        self,
+        key: RequestKey,
+        value: Any,
+        namespace: Optional[str],
+        size: int = 0,
+        version: Optional[str] = None,
+    ) -> None:
+        ttl = self.ttl(namespace)
+        if ttl <= 0:
+            return
+        columns = self._columns(key)
+        body = json.dumps(value, separators=(",", ":"))
+        with self._lock, self._connection:
+            if version is not None and not self._observe_version(columns[1], version):
+                return
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*columns, version, time.time() + ttl, body),
+            )
+
+    def _observe_version(self, namespace: str, version: str) -> bool:
+        """Drop the responses of a namespace that predate ``version``.
+
+        Returns:
+            bool: False if ``version`` itself predates the latest version seen
+            (e.g. a response delayed by a lagging CDN edge), in which case
+            nothing is dropped and the response should not be kept.
+        """
+        row = self._connection.execute(
+            "SELECT version FROM namespaces WHERE namespace = ?", (namespace,)
+        ).fetchone()
+        if row is not None:
+            if row[0] == version:
+                return True
+            if _version_order(version) < _version_order(row[0]):
+                return False
+        stale = [
+            (namespace, stored)
+            for (stored,) in self._connection.execute(
+                "SELECT DISTINCT version FROM responses"
+                " WHERE namespace = ? AND version IS NOT NULL",
+                (namespace,),
+            ).fetchall()
+            if _version_order(stored) < _version_order(version)
+        ]
+        self._connection.executemany(
+            "DELETE FROM responses WHERE namespace = ? AND version = ?", stale
+        )
+        self._connection.execute(
+            "INSERT OR REPLACE INTO namespaces VALUES (?, ?)", (namespace, version)
+        )
+        return True
+
+    def version(self, namespace: str) -> Optional[str]:
+        """Get the latest version seen of a namespace.
+
+        Args:
+            namespace: The ``namespace`` query parameter (e.g. ``static-us``).
+
+        Returns:
+            str, optional: The versioned namespace, or None if no response of
+            that namespace named its version.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT version FROM namespaces WHERE namespace = ?", (namespace,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def purge_expired(self) -> int:
+        """Delete the expired responses from the file.
+
+        Returns:
+            int: The number of responses deleted.
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.execute("DELETE FROM namespaces")
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
@@ -0,0 +1,196 @@
+"""context.py file.
+
+Shared transport and credential state for a family of API clients.
+
+Every ``BaseApi`` instance talks to Blizzard through an ``ApiContext``. The
+facades (``BlizzardApi``, ``WowApi``, ...) create one context and hand it to
+each sub-client, so all of them reuse the same HTTP connection pool and the
+same client-credentials token instead of opening one of each per sub-client.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+import requests
+
+from .cache import ResponseStore, ValidatorCache
+from .hooks import RequestHooks
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .token_store import MemoryTokenStore, TokenStore
+
+if TYPE_CHECKING:
+    import asyncio
+
+    import httpx
+
+    from .http2 import Http2Session
+
+
+class ApiContext:
+    """Transport and credential state shared between API clients.
+
+    Client-credentials tokens are cached per OAuth authority (the OAuth host
+    that issued them), because a token from the global ``oauth.battle.net``
+    is not accepted by the CN gateway and vice versa. Each authority has its
+    own expiry and its own refresh lock, so clients that alternate between
+    regions never evict each other's token.
+
+    Attributes:
+        token_store (TokenStore): Where client tokens are kept and renewed.
+        validator_cache (ValidatorCache, optional): Remembered validators for
+            conditional GET revalidation.
+        response_cache (ResponseStore, optional): Decoded responses served
+            without a request while they are fresh.
+        rate_limiter (RateLimiter, optional): Throttles API requests to stay
+            within the client's quotas.
+        retry_policy (RetryPolicy, optional): Retries API requests that fail
+            for transient reasons.
+        decoder (Callable[[bytes], Any], optional): Decodes JSON response
+            bodies in place of ``response.json()``.
+        http2 (bool): Whether created sessions use HTTP/2.
+        single_flight (SingleFlight, optional): Coalesces identical in-flight
+            requests.
+        hooks (tuple[RequestHooks, ...]): Observers of the API requests.
+    """
+
+    def __init__(
+        self,
+        session: Optional["requests.Session | Http2Session"] = None,
+        *,
+        async_session: Optional["httpx.AsyncClient"] = None,
+        token_store: Optional[TokenStore] = None,
+        validator_cache: Optional[ValidatorCache] = None,
+        response_cache: Optional[ResponseStore] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
+        http2: bool = False,
+        single_flight: Optional[SingleFlight] = None,
+        hooks: Iterable[RequestHooks] = (),
+    ) -> None:
+        """Initialize the context.
+
+        Args:
+            session (requests.Session, optional): The session to send requests
+                through. Defaults to None, in which case a new session is
+                created on first use.
+            async_session (httpx.AsyncClient, optional, keyword-only): The async
+                client used by the async API clients. Defaults to None, in which
+                case a new client is created on first use.
+            token_store (TokenStore, optional, keyword-only): Where client tokens
+                are kept. Defaults to None, in which case tokens are kept in
+                memory. Pass a ``FileTokenStore`` to share tokens between the
+                processes of a host.
+            validator_cache (ValidatorCache, optional, keyword-only): Remembers
+                response validators so repeated requests are revalidated with
+                conditional GETs. Defaults to None (no revalidation).
+            response_cache (ResponseStore, optional, keyword-only): Keeps
+                decoded responses for a namespace-dependent time, in memory
+                (``ResponseCache``) or on disk (``SqliteResponseCache``).
+                Defaults to None (no caching).
+            rate_limiter (RateLimiter, optional, keyword-only): Throttles the
+                API requests of every client sharing this context. Defaults to
+                None (no throttling).
+            retry_policy (RetryPolicy, optional, keyword-only): Retries API
+                requests that fail with a 429, a 5xx or a connection error.
+                Defaults to None (no retries).
+            decoder (Callable[[bytes], Any], optional, keyword-only): Decodes
+                JSON response bodies, e.g. ``orjson.loads``. Defaults to None,
+                in which case ``response.json()`` is used.
+            http2 (bool, optional, keyword-only): Whether the sessions created
+                by this context multiplex requests over HTTP/2 (requires the
+                ``http2`` extra). Defaults to False.
+            single_flight (SingleFlight, optional, keyword-only): Coalesces
+                identical requests that are in flight at the same time.
+                Defaults to None (every call sends its own request).
+            hooks (Iterable[RequestHooks], optional, keyword-only): Observers
+                notified of every API request, response, failure, ``401``
+                retry and token renewal, e.g. a ``MetricsCollector``.
+                Defaults to no hooks.
+        """
+        self._session = session
+        self._lock = threading.Lock()
+        self.token_store = (
+            token_store if token_store is not None else MemoryTokenStore()
+        )
+        self.validator_cache = validator_cache
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.decoder = decoder
+        self.http2 = http2
+        self.single_flight = single_flight
+        self.hooks = tuple(hooks)
+        self._async_token_locks: dict[str, asyncio.Lock] = {}
+        self._async_session = async_session
+
+    @property
+    def session(self) -> "requests.Session | Http2Session":
+        """Get the HTTP session, creating it on first use.
+
+        Returns:
+            requests.Session or Http2Session: The pooled session shared by
+            every client using this context.
+        """
+        if self._session is None:
+            with self._lock:
+                if self._session is None and self.http2:
+                    from .http2 import Http2Session
+
+                    self._session = Http2Session()
+                elif self._session is None:
+                    self._session = requests.Session()
+        return self._session
+
+    def async_token_lock(self, key: str) -> "asyncio.Lock":
+        """Get the asyncio lock that serializes token refreshes in this process.
+
+        Coroutines wait on this lock before taking the token store's lock, so
+        they queue on the event loop instead of blocking it.
+
+        Args:
+            key: The token key, as built by ``token_key``.
+
+        Returns:
+            asyncio.Lock: The refresh lock for ``key``.
+        """
+        import asyncio
+
+        with self._lock:
+            return self._async_token_locks.setdefault(key, asyncio.Lock())
+
+    @property
+    def async_session(self) -> "httpx.AsyncClient":
+        """Get the asyncio HTTP client, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: The pooled async client shared by every async
+            client using this context.
+
+        Raises:
+            ImportError: If the optional ``httpx`` dependency is not installed.
+        """
+        if self._async_session is None:
+            try:
+                import httpx
+            except ImportError as exc:  # pragma: no cover - depends on extras
+                raise ImportError(
+                    "The async client requires httpx. "
+                    "Install it with `pip install blizzardapi2[async]`."
+                ) from exc
+            self._async_session = httpx.AsyncClient(http2=self.http2)
+        return self._async_session
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client and release pooled connections."""
+        if self._async_session is not None:
+            await self._async_session.aclose()
+            self._async_session = None
@@ -4,10 +4,7 @@ This module provides access to the Diablo III API endpoints,
 including game data and community information.
 """
 
-from blizzardapi2.endpoint import ApiEndpoint
-
-from .diablo3_community_api import Diablo3CommunityApi
-from .diablo3_game_data_api import Diablo3GameDataApi
+from blizzardapi2.endpoint import ApiEndpoint, SubClient
 
 
 class Diablo3Api(ApiEndpoint):
@@ -22,10 +19,10 @@ class Diablo3Api(ApiEndpoint):
         game_data: The game data API client.
     """
 
-    def extend_endpoint(self) -> None:
-        self.community = Diablo3CommunityApi(
-            self.client_id, self.client_secret, self.region, self.locale
-        )
-        self.game_data = Diablo3GameDataApi(
-            self.client_id, self.client_secret, self.region
-        )
+    community = SubClient(
+        "blizzardapi2.diablo3.diablo3_community_api:Diablo3CommunityApi"
+    )
+    game_data = SubClient(
+        "blizzardapi2.diablo3.diablo3_game_data_api:Diablo3GameDataApi",
+        localized=False,
+    )
@@ -1,11 +1,28 @@
 from typing import Any
 
 from ..api import LocaleApi
+from ..registry import path_templates
 from ..types import OptionalLocale, OptionalRegion
 
 """diablo3_community_api.py file."""
 
 
+@path_templates(
+    "/d3/data/act",
+    "/d3/data/act/{act_id}",
+    "/d3/data/artisan/{artisan_slug}",
+    "/d3/data/artisan/{artisan_slug}/recipe/{recipe_slug}",
+    "/d3/data/follower/{follower_slug}",
+    "/d3/data/hero/{class_slug}",
+    "/d3/data/hero/{class_slug}/skill/{skill_slug}",
+    "/d3/data/item-type",
+    "/d3/data/item-type/{item_type_slug}",
+    "/d3/data/item/{item_slug_id}",
+    "/d3/profile/{account_id}/",
+    "/d3/profile/{account_id}/hero/{hero_id}",
+    "/d3/profile/{account_id}/hero/{hero_id}/items",
+    "/d3/profile/{account_id}/hero/{hero_id}/follower-items",
+)
 class Diablo3CommunityApi(LocaleApi):
     """All Diablo 3 Community API methods.
 
@@ -1,11 +1,20 @@
 from typing import Any
 
 from ..api import BaseApi
+from ..registry import path_templates
 from ..types import OptionalRegion
 
 """diablo3_game_data_api.py file."""
 
 
+@path_templates(
+    "/data/d3/season/",
+    "/data/d3/season/{season_id}",
+    "/data/d3/season/{season_id}/leaderboard/{leaderboard_id}",
+    "/data/d3/era/",
+    "/data/d3/era/{era_id}",
+    "/data/d3/era/{era_id}/leaderboard/{leaderboard_id}",
+)
 class Diablo3GameDataApi(BaseApi):
     """All Diablo 3 Game Data API methods.
 
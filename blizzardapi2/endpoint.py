@@ -1,8 +1,70 @@
 """endpoint.py file."""
 
+import importlib
+import threading
+from typing import Any, Optional
+
+from .context import ApiContext
 from .types import OptionalLocale, OptionalRegion
 
 
+class SubClient:
+    """A sub-client of an endpoint, imported and created on first access.
+
+    The facades declare their sub-clients with this descriptor instead of
+    building them up front, so constructing ``BlizzardApi`` neither imports the
+    game modules nor instantiates their clients: a job that only uses
+    ``api.hearthstone`` never loads the World of Warcraft endpoints. The
+    sub-client shares its owner's credentials, defaults and context, and is
+    stored on the owner, so later accesses are plain attribute lookups.
+
+    Example:
+        ```python
+        class WowApi(ApiEndpoint):
+            game_data = SubClient("blizzardapi2.wow.wow_game_data_api:WowGameDataApi")
+        ```
+    """
+
+    def __init__(self, target: str, *, localized: bool = True) -> None:
+        """Initialize the descriptor.
+
+        Args:
+            target: The sub-client class, as ``"module:ClassName"``.
+            localized (bool, optional, keyword-only): Whether the sub-client
+                takes a default locale. Defaults to True.
+        """
+        self._module, _, self._class_name = target.partition(":")
+        self._localized = localized
+        self._lock = threading.Lock()
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    @property
+    def target(self) -> type:
+        """Import and get the sub-client class."""
+        return getattr(importlib.import_module(self._module), self._class_name)
+
+    def __get__(self, instance: Optional["ApiEndpoint"], owner: type) -> Any:
+        if instance is None:
+            return self
+        with self._lock:
+            # The instance attribute shadows this descriptor once it is set,
+            # but a thread that lost the race may still be waiting here.
+            if self._name in instance.__dict__:
+                return instance.__dict__[self._name]
+            defaults = (instance.region, instance.locale)
+            client = self.target(
+                instance.client_id,
+                instance.client_secret,
+                *(defaults if self._localized else defaults[:1]),
+                context=instance.context,
+            )
+            instance.__dict__[self._name] = client
+            return client
+
+
 class ApiEndpoint:
     """Base endpoint.
 
@@ -15,6 +77,8 @@ class ApiEndpoint:
         client_secret (str): The Blizzard API client secret.
         region (Region or str, optional): A default region to use for requests.
         locale (Locale or str, optional): A default locale to use for requests.
+        context (ApiContext): The transport and credential state shared with
+            every sub-client of this endpoint.
     """
 
     def __init__(
@@ -23,6 +87,8 @@ class ApiEndpoint:
         client_secret: str,
         region: OptionalRegion = None,
         locale: OptionalLocale = None,
+        *,
+        context: Optional[ApiContext] = None,
     ) -> None:
         """Initialize the API endpoint.
 
@@ -30,11 +96,16 @@ class ApiEndpoint:
             client_id: The Blizzard API client ID.
             client_secret: The Blizzard API client secret.
             region (Region or str, optional): A default region to use for requests.
+            locale (Locale or str, optional): A default locale to use for requests.
+            context (ApiContext, optional, keyword-only): The shared transport and
+                credential state. Defaults to None, in which case a new context is
+                created for this endpoint and its sub-clients.
         """
         self._client_id = client_id
         self._client_secret = client_secret
         self._region = region
         self._locale = locale
+        self._context = context if context is not None else ApiContext()
         self.extend_endpoint()
 
     def extend_endpoint(self) -> None:
@@ -62,6 +133,15 @@ class ApiEndpoint:
         """
         return self._client_secret
 
+    @property
+    def context(self) -> ApiContext:
+        """Get the shared transport and credential context.
+
+        Returns:
+            ApiContext: the context shared by this endpoint and its sub-clients
+        """
+        return self._context
+
     @property
     def region(self) -> OptionalRegion:
         """Get the default region
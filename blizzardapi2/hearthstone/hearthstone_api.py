@@ -6,8 +6,7 @@ game packages (`wow.game_data`, `diablo3.game_data`, etc.) so the public
 API surface stays consistent.
 """
 
-from ..endpoint import ApiEndpoint
-from .hearthstone_game_data_api import HearthstoneGameDataApi
+from ..endpoint import ApiEndpoint, SubClient
 
 
 class HearthstoneApi(ApiEndpoint):
@@ -31,8 +30,6 @@ class HearthstoneApi(ApiEndpoint):
         game_data: The Hearthstone game-data API client.
     """
 
-    def extend_endpoint(self) -> None:
-        """Add the Hearthstone game-data endpoint."""
-        self.game_data = HearthstoneGameDataApi(
-            self.client_id, self.client_secret, self.region, self.locale
-        )
+    game_data = SubClient(
+        "blizzardapi2.hearthstone.hearthstone_game_data_api:HearthstoneGameDataApi"
+    )
@@ -1,11 +1,21 @@
 from typing import Any, Optional
 
 from ..api import LocaleApi
+from ..registry import path_templates
 from ..types import OptionalLocale, OptionalRegion
 
 """hearthstone_game_data_api.py file."""
 
 
+@path_templates(
+    "/hearthstone/cards",
+    "/hearthstone/cards/{id_or_slug}",
+    "/hearthstone/cardbacks",
+    "/hearthstone/cardbacks/{id_or_slug}",
+    "/hearthstone/deck",
+    "/hearthstone/metadata",
+    "/hearthstone/metadata/{type_id}",
+)
 class HearthstoneGameDataApi(LocaleApi):
     """All Hearthstone Game Data API methods.
 
@@ -0,0 +1,298 @@
+"""hooks.py file.
+
+Request lifecycle hooks and per-endpoint metrics.
+
+Hooks passed to an ``ApiContext`` observe every API request sent by the
+clients sharing it. Each HTTP exchange is reported to ``before_request``,
+then to ``after_response`` or ``on_error``. That includes every attempt made
+by a ``RetryPolicy`` and the retry after a ``401 Unauthorized``. Token
+renewals and ``401`` retries are reported through hooks of their own.
+
+``MetricsCollector`` is a built-in hook that aggregates these events per
+endpoint template and region, ready to be exported to a monitoring system.
+
+Example:
+    ```python
+    metrics = MetricsCollector()
+    api = BlizzardApi("your_id", "your_secret", Region.US, context=ApiContext(hooks=[metrics]))
+    api.wow.game_data.get_item(19019)
+    for (endpoint, region), stats in metrics.snapshot().items():
+        print(endpoint, region, stats.requests, stats.statuses)
+    ```
+"""
+
+import bisect
+import copy
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Optional
+from urllib.parse import urlsplit
+
+from .registry import endpoint_template
+
+
+@dataclass(frozen=True)
+class RequestInfo:
+    """An API request, as reported to hooks.
+
+    Attributes:
+        url (str): The requested URL, without query string.
+        region (str): The region of the request.
+        params (Mapping[str, Any]): The query parameters, without any token.
+        attempt (int): 1 for the first attempt, 2 and above for the attempts
+            made by the context's retry policy.
+        stream (bool): Whether the response body is streamed.
+    """
+
+    url: str
+    region: str
+    params: Mapping[str, Any]
+    attempt: int = 1
+    stream: bool = False
+
+    @property
+    def endpoint(self) -> str:
+        """Get the path template of the request, e.g. ``/data/wow/item/{item_id}``."""
+        return endpoint_template(urlsplit(self.url).path)
+
+
+@dataclass(frozen=True)
+class ResponseInfo:
+    """An API response, as reported to hooks.
+
+    Attributes:
+        status_code (int): The HTTP status code.
+        headers (Mapping[str, str]): The response headers.
+        size (int): The length of the response body, in bytes. For streamed
+            responses, the announced ``Content-Length``, or 0.
+        elapsed (float): The time, in seconds, from sending the request to
+            receiving the response (the whole body, unless streamed).
+    """
+
+    status_code: int
+    headers: Mapping[str, str]
+    size: int
+    elapsed: float
+
+
+class RequestHooks:
+    """Callbacks invoked along the lifecycle of API requests.
+
+    Subclass and override the methods of the events to observe. Hooks run
+    synchronously on the thread (or event loop) sending the request, so they
+    should be quick; exceptions they raise propagate to the caller.
+    """
+
+    def before_request(self, request: RequestInfo) -> None:
+        """Called before a request is sent.
+
+        Args:
+            request: The request about to be sent.
+        """
+
+    def after_response(self, request: RequestInfo, response: ResponseInfo) -> None:
+        """Called when a response is received, whatever its status code.
+
+        Args:
+            request: The request that was sent.
+            response: The response received.
+        """
+
+    def on_error(
+        self, request: RequestInfo, error: BaseException, elapsed: float
+    ) -> None:
+        """Called when a request fails without a response.
+
+        Args:
+            request: The request that failed.
+            error: The connection error, timeout, ...
+            elapsed: The time, in seconds, until the failure.
+        """
+
+    def on_unauthorized_retry(self, request: RequestInfo) -> None:
+        """Called when a ``401`` answer leads to a token renewal and a retry.
+
+        Args:
+            request: The request that was rejected.
+        """
+
+    def on_token_refresh(self, region: str, elapsed: float) -> None:
+        """Called when a client-credentials token is fetched.
+
+        Args:
+            region: The region the token was fetched for.
+            elapsed: The duration of the token request, in seconds.
+        """
+
+
+class _Exchange:
+    """Reports one HTTP exchange to the hooks of a context."""
+
+    def __init__(self, hooks: tuple[RequestHooks, ...], request: RequestInfo):
+        self._hooks = hooks
+        self._request = request
+        self._start = 0.0
+
+    def __enter__(self) -> "_Exchange":
+        for hook in self._hooks:
+            hook.before_request(self._request)
+        self._start = time.perf_counter()
+        return self
+
+    def received(self, response: Any) -> None:
+        """Report a response of ``requests``, ``httpx`` or ``Http2Session``."""
+        elapsed = time.perf_counter() - self._start
+        if self._request.stream:
+            size = int(response.headers.get("Content-Length") or 0)
+        else:
+            size = len(response.content)
+        info = ResponseInfo(response.status_code, response.headers, size, elapsed)
+        for hook in self._hooks:
+            hook.after_response(self._request, info)
+
+    def __exit__(self, exc_type: Any, exc: Optional[BaseException], tb: Any) -> None:
+        if isinstance(exc, Exception):
+            elapsed = time.perf_counter() - self._start
+            for hook in self._hooks:
+                hook.on_error(self._request, exc, elapsed)
+
+
+def exchange(hooks: tuple[RequestHooks, ...], request: RequestInfo) -> _Exchange:
+    """Report an HTTP exchange to hooks.
+
+    Example:
+        ```python
+        with exchange(hooks, request) as observed:
+            response = session.get(request.url, params=request.params)
+            observed.received(response)
+        ```
+
+    Args:
+        hooks: The hooks to notify.
+        request: The request being sent.
+
+    Returns:
+        A context manager that reports the request when entered, and a
+        failure if its block raises.
+    """
+    return _Exchange(hooks, request)
+
+
+@dataclass
+class EndpointStats:
+    """Aggregated metrics of one endpoint template in one region.
+
+    Attributes:
+        requests (int): The number of HTTP exchanges, including retries.
+        errors (int): The number of exchanges that failed without a response.
+        statuses (dict[str, int]): Response counts per status class
+            (``"2xx"``, ``"3xx"``, ``"4xx"``, ``"5xx"``).
+        latency_counts (list[int]): Exchange counts per latency bucket; the
+            last count is for latencies above the highest bucket bound.
+        latency_sum (float): The total latency, in seconds.
+        response_bytes (int): The total size of the response bodies.
+        retries (int): The number of exchanges made by the retry policy.
+        unauthorized_retries (int): The number of ``401`` answers that led to
+            a token renewal and a retry.
+        token_refreshes (int): The number of client tokens fetched. Only set
+            for the ``/oauth/token`` endpoint.
+    """
+
+    requests: int = 0
+    errors: int = 0
+    statuses: dict[str, int] = field(default_factory=dict)
+    latency_counts: list[int] = field(default_factory=list)
+    latency_sum: float = 0.0
+    response_bytes: int = 0
+    retries: int = 0
+    unauthorized_retries: int = 0
+    token_refreshes: int = 0
+
+
+class MetricsCollector(RequestHooks):
+    """Aggregates request metrics per endpoint template and region.
+
+    The collector is thread-safe and cheap enough to leave on in production:
+    each exchange costs one lock acquisition and a few counter updates.
+
+    Attributes:
+        buckets (tuple[float, ...]): The upper bounds, in seconds, of the
+            latency histogram buckets.
+    """
+
+    DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    TOKEN_ENDPOINT = "/oauth/token"
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize an empty collector.
+
+        Args:
+            buckets: The upper bounds, in seconds, of the latency histogram
+                buckets. Defaults to 10 ms up to 10 s.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._stats: dict[tuple[str, str], EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, endpoint: str, region: str) -> EndpointStats:
+        key = (endpoint, str(region))
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = EndpointStats(latency_counts=[0] * (len(self.buckets) + 1))
+            self._stats[key] = stats
+        return stats
+
+    def _observe_latency(self, stats: EndpointStats, elapsed: float) -> None:
+        stats.latency_counts[bisect.bisect_left(self.buckets, elapsed)] += 1
+        stats.latency_sum += elapsed
+
+    def after_response(self, request: RequestInfo, response: ResponseInfo) -> None:
+        endpoint = request.endpoint
+        status_class = f"{response.status_code // 100}xx"
+        with self._lock:
+            stats = self._get(endpoint, request.region)
+            stats.requests += 1
+            if request.attempt > 1:
+                stats.retries += 1
+            stats.statuses[status_class] = stats.statuses.get(status_class, 0) + 1
+            stats.response_bytes += response.size
+            self._observe_latency(stats, response.elapsed)
+
+    def on_error(
+        self, request: RequestInfo, error: BaseException, elapsed: float
+    ) -> None:
+        endpoint = request.endpoint
+        with self._lock:
+            stats = self._get(endpoint, request.region)
+            stats.requests += 1
+            if request.attempt > 1:
+                stats.retries += 1
+            stats.errors += 1
+            self._observe_latency(stats, elapsed)
+
+    def on_unauthorized_retry(self, request: RequestInfo) -> None:
+        endpoint = request.endpoint
+        with self._lock:
+            self._get(endpoint, request.region).unauthorized_retries += 1
+
+    def on_token_refresh(self, region: str, elapsed: float) -> None:
+        with self._lock:
+            stats = self._get(self.TOKEN_ENDPOINT, region)
+            stats.token_refreshes += 1
+            self._observe_latency(stats, elapsed)
+
+    def snapshot(self) -> dict[tuple[str, str], EndpointStats]:
+        """Get a copy of the metrics collected so far.
+
+        Returns:
+            dict[tuple[str, str], EndpointStats]: The metrics, keyed by
+            ``(endpoint template, region)``.
+        """
+        with self._lock:
+            return copy.deepcopy(self._stats)
+
+    def reset(self) -> None:
+        """Discard the metrics collected so far."""
+        with self._lock:
+            self._stats.clear()
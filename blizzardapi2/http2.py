@@ -0,0 +1,173 @@
+"""http2.py file.
+
+An HTTP/2 transport for the synchronous clients (requires the ``http2`` extra).
+
+Every request of a region goes to a single host, so with HTTP/2 concurrent
+requests can share one multiplexed connection per host instead of one pooled
+socket (and TLS handshake) each. ``Http2Session`` exposes the small part of the
+``requests.Session`` interface that ``BaseApi`` uses on top of an
+``httpx.Client``, and translates ``httpx`` errors into the ``requests``
+exceptions the library raises everywhere else.
+"""
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Optional
+
+import requests
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as exc:  # pragma: no cover - depends on extras
+        raise ImportError(
+            "The HTTP/2 transport requires httpx and h2. "
+            "Install them with `pip install blizzardapi2[http2]`."
+        ) from exc
+    return httpx
+
+
+@contextmanager
+def _translate_errors() -> Iterator[None]:
+    """Re-raise ``httpx`` transport errors as ``requests`` exceptions."""
+    httpx = _import_httpx()
+    try:
+        yield
+    except httpx.TimeoutException as exc:
+        raise requests.Timeout(str(exc)) from exc
+    except httpx.TransportError as exc:
+        raise requests.ConnectionError(str(exc)) from exc
+
+
+class Http2Response:
+    """A ``requests.Response``-like view of an ``httpx.Response``."""
+
+    def __init__(self, response: "httpx.Response") -> None:
+        self._response = response
+
+    @property
+    def status_code(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._response.headers
+
+    @property
+    def url(self) -> str:
+        return str(self._response.url)
+
+    @property
+    def content(self) -> bytes:
+        with _translate_errors():
+            return self._response.read()
+
+    @property
+    def http_version(self) -> str:
+        """Get the negotiated protocol (``HTTP/2`` or ``HTTP/1.1``)."""
+        return self._response.http_version
+
+    def json(self, **kwargs: Any) -> Any:
+        with _translate_errors():
+            self._response.read()
+        return self._response.json(**kwargs)
+
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        with _translate_errors():
+            yield from self._response.iter_bytes(chunk_size)
+
+    def raise_for_status(self) -> None:
+        """Raise ``requests.HTTPError`` for a 4xx or 5xx status code."""
+        if 400 <= self.status_code < 600:
+            raise requests.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+    def close(self) -> None:
+        self._response.close()
+
+
+class Http2Session:
+    """Sends requests over HTTP/2, multiplexed on one connection per host.
+
+    Example:
+        ```python
+        context = ApiContext(session=Http2Session())
+        api = BlizzardApi("your_id", "your_secret", Region.US, context=context)
+        ```
+
+    ``ApiContext(http2=True)`` does the same, and also enables HTTP/2 for the
+    async client.
+    """
+
+    def __init__(self, client: Optional["httpx.Client"] = None) -> None:
+        """Initialize the session.
+
+        Args:
+            client: The ``httpx.Client`` to send requests through. Defaults to
+                None, in which case a client with HTTP/2 enabled is created.
+        """
+        if client is None:
+            client = _import_httpx().Client(http2=True)
+        self._client = client
+
+    @property
+    def client(self) -> "httpx.Client":
+        """Get the underlying ``httpx.Client``."""
+        return self._client
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> Http2Response:
+        """Send a GET request.
+
+        Args:
+            url: The complete URL to request.
+            params: The query parameters.
+            headers: The request headers.
+            timeout: The timeout in seconds.
+            stream: Whether to defer downloading the body until it is read.
+
+        Returns:
+            Http2Response: The response.
+        """
+        request = self._client.build_request(
+            "GET", url, params=params, headers=headers, timeout=timeout
+        )
+        with _translate_errors():
+            return Http2Response(self._client.send(request, stream=stream))
+
+    def post(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        auth: Optional[tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Http2Response:
+        """Send a POST request.
+
+        Args:
+            url: The complete URL to request.
+            params: The query parameters.
+            auth: HTTP Basic credentials.
+            timeout: The timeout in seconds.
+
+        Returns:
+            Http2Response: The response.
+        """
+        with _translate_errors():
+            return Http2Response(
+                self._client.post(url, params=params, auth=auth, timeout=timeout)
+            )
+
+    def close(self) -> None:
+        """Close the client and its connections."""
+        self._client.close()
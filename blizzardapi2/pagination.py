@@ -0,0 +1,92 @@
+"""pagination.py file.
+
+Iteration over every result of a paginated search endpoint.
+
+Search endpoints return one page of results at a time, along with the number
+of pages (``pageCount``). Once the first page has arrived, the remaining pages
+are known, so they are fetched concurrently, up to ``prefetch`` pages ahead of
+the caller, while results are yielded in page order.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator
+
+from .batch import ApiRequest
+
+DEFAULT_PREFETCH = 16
+
+
+def iter_search_results(
+    page_request: Callable[[int], ApiRequest],
+    first_page: int = 1,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> Iterator[Any]:
+    """Yield the results of every page of a search, prefetching pages.
+
+    Args:
+        page_request: Builds the request for a page number.
+        first_page: The page to start from. Defaults to 1.
+        prefetch: The maximum number of pages requested ahead of the caller.
+            Defaults to 16.
+
+    Yields:
+        Any: The results of each page, in order.
+    """
+    page = page_request(first_page).execute()
+    yield from page.get("results", [])
+    last_page = page.get("pageCount", first_page)
+    if last_page <= first_page:
+        return
+
+    next_page = first_page + 1
+    pending: deque[Future] = deque()
+    executor = ThreadPoolExecutor(
+        max_workers=prefetch, thread_name_prefix="blizzardapi2-search"
+    )
+    try:
+        while pending or next_page <= last_page:
+            while next_page <= last_page and len(pending) < prefetch:
+                pending.append(executor.submit(page_request(next_page).execute))
+                next_page += 1
+            yield from pending.popleft().result().get("results", [])
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def aiter_search_results(
+    page_request: Callable[[int], ApiRequest],
+    first_page: int = 1,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> AsyncIterator[Any]:
+    """Asynchronously yield the results of every page of a search.
+
+    Args:
+        page_request: Builds the request for a page number, for an async client.
+        first_page: The page to start from. Defaults to 1.
+        prefetch: The maximum number of pages requested ahead of the caller.
+            Defaults to 16.
+
+    Yields:
+        Any: The results of each page, in order.
+    """
+    import asyncio
+
+    page = await page_request(first_page).execute()
+    for result in page.get("results", []):
+        yield result
+    last_page = page.get("pageCount", first_page)
+
+    next_page = first_page + 1
+    pending: deque[asyncio.Future] = deque()
+    try:
+        while pending or next_page <= last_page:
+            while next_page <= last_page and len(pending) < prefetch:
+                pending.append(asyncio.ensure_future(page_request(next_page).execute()))
+                next_page += 1
+            page = await pending.popleft()
+            for result in page.get("results", []):
+                yield result
+    finally:
+        for task in pending:
+            task.cancel()
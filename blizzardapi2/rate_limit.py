@@ -0,0 +1,109 @@
+"""rate_limit.py file.
+
+Client-side throttling to stay within Blizzard's per-client quotas.
+
+Blizzard allows about 100 requests per second and 36,000 requests per hour per
+client ID, and answers requests beyond that with ``429 Too Many Requests``. A
+``RateLimiter`` on the ``ApiContext`` makes every client sharing the context
+wait for capacity before sending a request instead.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Iterable, Optional
+
+
+class SlidingWindow:
+    """A quota of ``limit`` requests in any ``period`` seconds.
+
+    The window keeps the send times of the last ``limit`` requests. The next
+    request may go out once the oldest of them is ``period`` seconds old, so
+    no interval of ``period`` seconds ever holds more than ``limit`` requests,
+    wherever it starts.
+
+    Attributes:
+        limit (int): The number of requests allowed per window.
+        period (float): The length of the window, in seconds.
+    """
+
+    def __init__(self, limit: int, period: float) -> None:
+        """Initialize an empty window.
+
+        Args:
+            limit: The number of requests allowed per window.
+            period: The length of the window, in seconds.
+        """
+        self.limit = limit
+        self.period = period
+        self._sent: deque[float] = deque(maxlen=limit)
+
+    def _earliest(self) -> float:
+        """Get the earliest time at which the next request may be sent."""
+        if len(self._sent) < self.limit:
+            return float("-inf")
+        return self._sent[0] + self.period
+
+    def _record(self, when: float) -> None:
+        self._sent.append(when)
+
+
+class RateLimiter:
+    """Spaces requests so that they never exceed any of a set of quotas.
+
+    Each call to ``acquire`` reserves a send time that fits in every quota's
+    sliding window and returns once that time has come. Reservations are
+    handed out in call order, so waiting callers are served first come, first
+    served, and the request rate stays at the tightest quota instead of
+    bursting into ``429`` answers.
+
+    The limiter is thread-safe and can be shared by sync and async clients
+    through an ``ApiContext``.
+
+    Example:
+        ```python
+        context = ApiContext(rate_limiter=RateLimiter())
+        api = BlizzardApi("your_id", "your_secret", Region.US, context=context)
+        ```
+    """
+
+    BLIZZARD_QUOTAS = ((100, 1.0), (36_000, 3600.0))
+
+    def __init__(self, quotas: Optional[Iterable[tuple[int, float]]] = None) -> None:
+        """Initialize the limiter.
+
+        Args:
+            quotas: ``(limit, period)`` pairs, each allowing ``limit`` requests
+                per ``period`` seconds. Defaults to None, in which case
+                Blizzard's quotas (100 per second and 36,000 per hour) are used.
+        """
+        quotas = self.BLIZZARD_QUOTAS if quotas is None else quotas
+        self.windows = [SlidingWindow(limit, period) for limit, period in quotas]
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Reserve a send time in every window.
+
+        Returns:
+            float: How many seconds the caller must wait before sending.
+        """
+        with self._lock:
+            now = time.monotonic()
+            when = max([now, *(window._earliest() for window in self.windows)])
+            for window in self.windows:
+                window._record(when)
+            return when - now
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        import asyncio
+
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
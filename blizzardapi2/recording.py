@@ -0,0 +1,334 @@
+"""recording.py file.
+
+Recording and deterministic replay of API traffic.
+
+``RecordingSession`` sends requests like a ``requests.Session`` and appends
+each GET response to an archive: the request key (URL and query parameters),
+the status code, the headers and the body. ``ReplaySession`` answers the same
+requests from that archive, without network and at full speed, so parsing and
+downstream pipelines can be profiled on production-shaped data.
+
+Archives are gzip-compressed JSON Lines, one response per line. Access tokens
+travel in headers, which are not recorded, and token responses are never
+written, so archives hold no credentials.
+
+Example:
+    ```python
+    with RecordingSession("traffic.jsonl.gz") as session:
+        api = BlizzardApi("your_id", "your_secret", Region.US, context=ApiContext(session))
+        api.wow.game_data.get_commodities()
+
+    replay = ReplaySession("traffic.jsonl.gz")
+    api = BlizzardApi("any_id", "any_secret", Region.US, context=ApiContext(replay))
+    api.wow.game_data.get_commodities()  # served from the archive
+    ```
+"""
+
+import base64
+import gzip
+import json
+import threading
+from collections import defaultdict
+from http import HTTPStatus
+from os import PathLike
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, NamedTuple, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .cache import RequestKey, request_key
+
+if TYPE_CHECKING:
+    import httpx
+
+# Headers that describe the encoding on the wire, not the recorded body.
+_WIRE_HEADERS = frozenset({"content-encoding", "transfer-encoding", "content-length"})
+
+REPLAY_TOKEN = {
+    "access_token": "replay",
+    "token_type": "bearer",
+    "expires_in": 86399,
+}
+
+
+class ReplayMiss(requests.RequestException):
+    """Raised when a replayed request is not in the archive."""
+
+
+class Recorded(NamedTuple):
+    """One recorded response.
+
+    Attributes:
+        url (str): The requested URL, without query string.
+        params (tuple[tuple[str, str], ...]): The query parameters, sorted.
+        status_code (int): The HTTP status code.
+        headers (dict[str, str]): The response headers.
+        content (bytes): The response body, decoded from any transfer
+            encoding.
+    """
+
+    url: str
+    params: tuple[tuple[str, str], ...]
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+
+    @property
+    def key(self) -> RequestKey:
+        """Get the request key of the response, as built by ``request_key``."""
+        return self.url, self.params
+
+    def to_json(self) -> str:
+        """Encode the response as one archive line."""
+        entry: dict[str, Any] = {
+            "url": self.url,
+            "params": self.params,
+            "status": self.status_code,
+            "headers": self.headers,
+        }
+        try:
+            entry["body"] = self.content.decode()
+        except UnicodeDecodeError:
+            entry["body_b64"] = base64.b64encode(self.content).decode()
+        return json.dumps(entry, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> "Recorded":
+        """Decode an archive line."""
+        entry = json.loads(line)
+        if "body_b64" in entry:
+            content = base64.b64decode(entry["body_b64"])
+        else:
+            content = entry["body"].encode()
+        params = tuple((name, value) for name, value in entry["params"])
+        return cls(entry["url"], params, entry["status"], entry["headers"], content)
+
+    def response(self) -> requests.Response:
+        """Build a ``requests.Response`` that replays this one."""
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.reason = _reason(self.status_code)
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.url = (
+            requests.Request("GET", self.url, params=self.params).prepare().url
+        )
+        response.encoding = "utf-8"
+        response._content = self.content
+        response._content_consumed = True
+        return response
+
+
+def _reason(status_code: int) -> str:
+    try:
+        return HTTPStatus(status_code).phrase
+    except ValueError:
+        return ""
+
+
+def read_archive(path: str | PathLike[str]) -> Iterator[Recorded]:
+    """Read the responses of an archive, in recording order.
+
+    Args:
+        path: The archive file.
+
+    Yields:
+        Recorded: The recorded responses.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as archive:
+        for line in archive:
+            if line.strip():
+                yield Recorded.from_json(line)
+
+
+class RecordingSession:
+    """Sends requests and records their responses to an archive.
+
+    The archive is appended to, so one archive can collect several runs.
+    Streamed responses are downloaded completely before being returned, so
+    recording does not keep the memory benefit of streaming.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        """Initialize the session and open the archive.
+
+        Args:
+            path: The archive file. Created if missing, appended to otherwise.
+            session: The session that sends the requests. Defaults to None, in
+                which case a new ``requests.Session`` is created.
+        """
+        self._session = session if session is not None else requests.Session()
+        self._archive = gzip.open(path, "at", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a GET request and record its response.
+
+        Args:
+            url: The complete URL to request.
+            params: The query parameters.
+            headers: The request headers. Not recorded.
+            timeout: The timeout in seconds.
+            stream: Whether the caller streams the body. Defaults to False.
+
+        Returns:
+            requests.Response: The response.
+        """
+        response = self._session.get(
+            url, params=params, headers=headers, timeout=timeout, stream=stream
+        )
+        url, query = request_key(url, params or {})
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _WIRE_HEADERS
+        }
+        headers["Content-Length"] = str(len(response.content))
+        line = Recorded(url, query, response.status_code, headers, response.content)
+        with self._lock:
+            self._archive.write(line.to_json() + "\n")
+        return response
+
+    def post(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        auth: Optional[tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """Send a POST request, without recording it.
+
+        Only token requests are POSTed, and their responses are credentials.
+        """
+        return self._session.post(url, params=params, auth=auth, timeout=timeout)
+
+    def close(self) -> None:
+        """Close the archive and the underlying session."""
+        with self._lock:
+            self._archive.close()
+        self._session.close()
+
+    def __enter__(self) -> "RecordingSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class ReplaySession:
+    """Answers requests from an archive, without network.
+
+    Responses recorded several times for the same request, such as hourly
+    auction snapshots, are replayed in recording order; once exhausted, the
+    last one is repeated. Token requests get a placeholder token.
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        """Load an archive.
+
+        Args:
+            path: The archive file, as written by ``RecordingSession``.
+        """
+        self._responses: dict[RequestKey, list[Recorded]] = defaultdict(list)
+        for recorded in read_archive(path):
+            self._responses[recorded.key].append(recorded)
+        self._served: dict[RequestKey, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._responses.values())
+
+    def _next(self, url: str, params: Optional[Mapping[str, Any]]) -> Recorded:
+        key = request_key(url, params or {})
+        responses = self._responses.get(key)
+        if not responses:
+            raise ReplayMiss(f"No recorded response for {url} with {dict(key[1])}")
+        with self._lock:
+            index = self._served[key]
+            self._served[key] = index + 1
+        return responses[min(index, len(responses) - 1)]
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Replay the response of a GET request.
+
+        Args:
+            url: The complete URL to request.
+            params: The query parameters.
+            headers: The request headers. Ignored.
+            timeout: The timeout in seconds. Ignored.
+            stream: Whether the caller streams the body. Ignored.
+
+        Returns:
+            requests.Response: The recorded response.
+
+        Raises:
+            ReplayMiss: If the request was not recorded.
+        """
+        return self._next(url, params).response()
+
+    def post(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        auth: Optional[tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """Answer a token request with a placeholder token."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = json.dumps(REPLAY_TOKEN).encode()
+        response._content_consumed = True
+        return response
+
+    def transport(self) -> "httpx.MockTransport":
+        """Get an ``httpx`` transport that replays the archive.
+
+        Example:
+            ```python
+            client = httpx.AsyncClient(transport=replay.transport())
+            api = AsyncBlizzardApi("id", "secret", context=ApiContext(async_session=client))
+            ```
+
+        Returns:
+            httpx.MockTransport: A transport for ``httpx.Client`` and
+            ``httpx.AsyncClient`` (requires the ``async`` extra). Requests
+            that were not recorded raise ``ReplayMiss``.
+        """
+        import httpx
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(200, json=REPLAY_TOKEN)
+            url = str(request.url.copy_with(query=None))
+            params = dict(request.url.params.multi_items())
+            # A miss propagates as ReplayMiss, not as an httpx transport
+            # error, so that a RetryPolicy does not retry it.
+            recorded = self._next(url, params)
+            return httpx.Response(
+                recorded.status_code,
+                headers=recorded.headers,
+                content=recorded.content,
+            )
+
+        return httpx.MockTransport(handle)
+
+    def close(self) -> None:
+        """Do nothing; replay holds no connections."""
@@ -0,0 +1,243 @@
+"""refresher.py file.
+
+Background renewal of client-credentials tokens.
+
+By default a token is refreshed on the request path: the first request that
+finds it within ``BaseApi.TOKEN_REFRESH_BUFFER`` of expiry pays for the OAuth
+POST. A refresher renews each token ahead of that window instead, so requests
+always find a valid token and never wait on the token endpoint.
+"""
+
+import logging
+import random
+import threading
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from .types import Region
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .aio.api import AsyncBaseApi
+    from .api import BaseApi
+
+logger = logging.getLogger(__name__)
+
+
+class _RefreshSchedule:
+    """Scheduling shared by the thread and asyncio refreshers."""
+
+    DEFAULT_LEAD = timedelta(minutes=5)
+    DEFAULT_JITTER = timedelta(minutes=2)
+    DEFAULT_RETRY_INTERVAL = timedelta(seconds=30)
+
+    def __init__(
+        self,
+        api: "BaseApi",
+        regions: Iterable[Region | str],
+        *,
+        lead: timedelta = DEFAULT_LEAD,
+        jitter: timedelta = DEFAULT_JITTER,
+        retry_interval: timedelta = DEFAULT_RETRY_INTERVAL,
+    ) -> None:
+        """Initialize the schedule.
+
+        Args:
+            api: The client whose context holds the tokens to renew.
+            regions: The regions whose tokens are kept fresh. Regions that share
+                an OAuth authority share a token, so only one is renewed.
+            lead: How long before the request path's refresh window a token is
+                renewed. Defaults to 5 minutes.
+            jitter: The upper bound of a random extra lead, so that many
+                processes started together do not renew at the same instant.
+                Defaults to 2 minutes.
+            retry_interval: How long to wait before retrying a failed renewal,
+                and the minimum delay between two renewals of one token.
+                Defaults to 30 seconds.
+
+        Raises:
+            ValueError: If ``regions`` is empty.
+        """
+        self._api = api
+        by_authority: dict[str, Region] = {}
+        for region in regions:
+            by_authority.setdefault(api._token_authority(region), Region(region))
+        if not by_authority:
+            raise ValueError("A token refresher needs at least one region")
+        self._regions = list(by_authority.values())
+        self.lead = lead
+        self.jitter = jitter
+        self.retry_interval = retry_interval
+
+    @property
+    def regions(self) -> list[Region]:
+        """Get one region per OAuth authority whose token is kept fresh."""
+        return list(self._regions)
+
+    def _next_refresh(self, region: Region) -> datetime:
+        """Compute when the token of ``region`` should next be renewed."""
+        now = datetime.now(UTC)
+        token = self._api._cached_token(region)
+        if token is None:
+            return now
+        jitter = timedelta(seconds=random.uniform(0, self.jitter.total_seconds()))
+        due = token.expires_at - self._api.TOKEN_REFRESH_BUFFER - self.lead - jitter
+        return max(due, now + self.retry_interval)
+
+    def _initial_schedule(self) -> dict[Region, datetime]:
+        """Schedule every region, renewing missing or stale tokens right away."""
+        now = datetime.now(UTC)
+        schedule = {}
+        for region in self._regions:
+            token = self._api._cached_token(region)
+            if token is None or token.expires_within(
+                self._api.TOKEN_REFRESH_BUFFER + self.lead
+            ):
+                schedule[region] = now
+            else:
+                schedule[region] = self._next_refresh(region)
+        return schedule
+
+
+class TokenRefresher(_RefreshSchedule):
+    """Renews client-credentials tokens from a daemon thread.
+
+    Example:
+        ```python
+        api = BlizzardApi("your_id", "your_secret", Region.US)
+        with api.start_token_refresher([Region.US, Region.CN]):
+            ...  # requests never wait on the token endpoint
+        ```
+    """
+
+    def __init__(self, api: "BaseApi", regions: Iterable[Region | str], **kwargs: Any):
+        super().__init__(api, regions, **kwargs)
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Check whether the refresher thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "TokenRefresher":
+        """Start the refresher thread.
+
+        Returns:
+            TokenRefresher: this refresher, for chaining.
+        """
+        if not self.running:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="blizzardapi2-token-refresher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the refresher thread and wait for it to exit.
+
+        Args:
+            timeout: Maximum number of seconds to wait. Defaults to None (wait
+                until the thread exits).
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        schedule = self._initial_schedule()
+        while not self._stopped.is_set():
+            region, due = min(schedule.items(), key=lambda item: item[1])
+            delay = (due - datetime.now(UTC)).total_seconds()
+            if delay > 0 and self._stopped.wait(delay):
+                break
+            try:
+                self._api._renew_token(region, self.lead)
+            except Exception:
+                logger.warning("Failed to renew the %s token", region, exc_info=True)
+                schedule[region] = datetime.now(UTC) + self.retry_interval
+            else:
+                schedule[region] = self._next_refresh(region)
+
+    def __enter__(self) -> "TokenRefresher":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+class AsyncTokenRefresher(_RefreshSchedule):
+    """Renews client-credentials tokens from an asyncio task.
+
+    Example:
+        ```python
+        async with AsyncBlizzardApi("your_id", "your_secret", Region.US) as api:
+            async with api.start_token_refresher():
+                ...
+        ```
+    """
+
+    _api: "AsyncBaseApi"
+
+    def __init__(
+        self, api: "AsyncBaseApi", regions: Iterable[Region | str], **kwargs: Any
+    ):
+        super().__init__(api, regions, **kwargs)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Check whether the refresher task is still running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> "AsyncTokenRefresher":
+        """Start the refresher task on the running event loop.
+
+        Returns:
+            AsyncTokenRefresher: this refresher, for chaining.
+        """
+        import asyncio
+
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="blizzardapi2-token-refresher"
+            )
+        return self
+
+    async def stop(self) -> None:
+        """Cancel the refresher task and wait for it to exit."""
+        import asyncio
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        import asyncio
+
+        schedule = self._initial_schedule()
+        while True:
+            region, due = min(schedule.items(), key=lambda item: item[1])
+            delay = (due - datetime.now(UTC)).total_seconds()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                await self._api._renew_token(region, self.lead)
+            except Exception:
+                logger.warning("Failed to renew the %s token", region, exc_info=True)
+                schedule[region] = datetime.now(UTC) + self.retry_interval
+            else:
+                schedule[region] = self._next_refresh(region)
+
+    async def __aenter__(self) -> "AsyncTokenRefresher":
+        return self.start()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
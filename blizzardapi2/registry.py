@@ -0,0 +1,295 @@
+"""registry.py file.
+
+Declarative endpoint tables.
+
+Most game-data and profile methods differ only in their path template and
+namespace. Instead of writing each one out, an API class lists its endpoints
+as ``Endpoint`` records and is decorated with ``endpoints``, which installs
+one method per record. A method's code is generated the first time it is
+looked up, with the same signature and docstring a hand-written method would
+have. The tables stay available at runtime through the class's ``endpoints``
+mapping, so caching, batching, rate or benchmarking policies can be applied
+per endpoint without listing methods by hand.
+
+Example:
+    ```python
+    for endpoint in WowGameDataApi.endpoints.values():
+        print(endpoint.name, endpoint.path, endpoint.namespace)
+    ```
+"""
+
+import functools
+import re
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, NamedTuple, Optional
+
+from .types import OptionalLocale, OptionalRegion
+
+if TYPE_CHECKING:
+    from .api import LocaleApi
+
+_REGION_DOC = "region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used."
+_LOCALE_DOC = "locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used."
+_CLASSIC_DOC = "is_classic (bool, optional): Whether to query for classic realms. Defaults to False."
+_SEARCH_DOC = "**query_params (Any): Additional search parameters (e.g., name.en_US, orderby, _page)."
+
+
+@functools.cache
+def _path_fields(path: str) -> frozenset[str]:
+    """Get the names of the fields of a path template."""
+    return frozenset(re.findall(r"{(\w+)}", path))
+
+
+class Endpoint(NamedTuple):
+    """One API endpoint, from which a client method is generated.
+
+    Endpoints are named tuples rather than dataclasses because a game's table
+    holds a couple of hundred of them, all built when its module is imported.
+
+    Attributes:
+        name (str): The name of the generated method.
+        path (str): The resource path template, e.g.
+            ``"/data/wow/item/{item_id}"``. Each field is filled in from the
+            method argument of the same name.
+        namespace (str): The namespace kind (``"static"``, ``"dynamic"``,
+            ``"profile"``, ...). The region is appended when the request is made.
+        summary (str): The first line of the method's docstring.
+        description (str): Further paragraphs of the method's docstring.
+        params (tuple[tuple[str, type, str], ...]): The positional parameters
+            of the method, as ``(name, type, description)``. Parameters that
+            are not fields of ``path`` are sent as query parameters.
+        returns (str): The description of the returned value.
+        classic (bool): Whether the method takes ``is_classic``, which selects
+            the classic variant of the namespace.
+        search (bool): Whether the method forwards ``**query_params``.
+        keyword_only (bool): Whether ``region`` and ``locale`` (and
+            ``is_classic``) are keyword-only.
+    """
+
+    name: str
+    path: str
+    namespace: str
+    summary: str
+    description: str = ""
+    params: tuple[tuple[str, type, str], ...] = ()
+    returns: str = "A dictionary containing the response."
+    classic: bool = False
+    search: bool = False
+    keyword_only: bool = True
+
+    @property
+    def query_fields(self) -> tuple[str, ...]:
+        """Get the names of the parameters that are sent as query parameters."""
+        path_fields = _path_fields(self.path)
+        return tuple(name for name, _, _ in self.params if name not in path_fields)
+
+    def request(
+        self,
+        api: "LocaleApi",
+        values: dict[str, Any],
+        region: OptionalRegion = None,
+        locale: OptionalLocale = None,
+        is_classic: bool = False,
+        query_params: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """Request this endpoint through an API client.
+
+        Args:
+            api: The client to send the request with.
+            values: The positional arguments of the method, by name.
+            region (Region, optional): the region to query. Defaults to None, in which case the default region of ``api`` is used.
+            locale (Locale, optional): the locale to use for the response. Defaults to None, in which case the default locale of ``api`` is used.
+            is_classic: Whether to use the classic variant of the namespace.
+                Defaults to False.
+            query_params: Additional query parameters. Defaults to None.
+
+        Returns:
+            The API response, or an awaitable of it with an async client.
+        """
+        namespace = f"{self.namespace}-classic" if is_classic else self.namespace
+        query = {
+            **(query_params or {}),
+            "namespace": f"{namespace}-{region or api.region}",
+        }
+        query.update((name, values[name]) for name in self.query_fields)
+        resource = self.path.format_map(values)
+        return api.get_resource(resource, region, query, locale=locale)
+
+    def docstring(self) -> str:
+        """Build the docstring of the generated method."""
+        lines = [f"{name} ({kind.__name__}): {doc}" for name, kind, doc in self.params]
+        lines += [_REGION_DOC, _LOCALE_DOC]
+        if self.classic:
+            lines.append(_CLASSIC_DOC)
+        if self.search:
+            lines.append(_SEARCH_DOC)
+        args = "\n".join(f"    {line}" for line in lines)
+        description = f"{self.description}\n\n" if self.description else ""
+        return (
+            f"{self.summary}\n\n{description}Args:\n{args}\n\n"
+            f"Returns:\n    Dict[str, Any]: {self.returns}"
+        )
+
+    def build(self) -> Callable[..., Any]:
+        """Generate the method's function.
+
+        The function is compiled from source, like the ``__init__`` of a
+        dataclass, so it has a real signature: wrong arguments fail with the
+        usual ``TypeError`` and calls cost no more than a hand-written method.
+
+        Returns:
+            The function, to be set on the API class.
+        """
+        names = [name for name, _, _ in self.params]
+        options = ["region=None", "locale=None"]
+        if self.classic:
+            options.append("is_classic=False")
+        parameters = ["self", *names]
+        parameters += ["*", *options] if self.keyword_only else options
+        if self.search:
+            parameters.append("**query_params")
+        values = ", ".join(f"{name!r}: {name}" for name in names)
+        source = (
+            f"def {self.name}({', '.join(parameters)}):\n"
+            f"    return _request(self, {{{values}}}, region, locale, "
+            f"{'is_classic' if self.classic else 'False'}, "
+            f"{'query_params' if self.search else 'None'})\n"
+        )
+        namespace: dict[str, Any] = {"_request": self.request}
+        exec(source, namespace)
+        function = namespace[self.name]
+        function.__doc__ = self.docstring()
+        function.__annotations__ = {
+            **{name: kind for name, kind, _ in self.params},
+            "region": OptionalRegion,
+            "locale": OptionalLocale,
+            **({"is_classic": bool} if self.classic else {}),
+            **({"query_params": Any} if self.search else {}),
+            "return": dict[str, Any],
+        }
+        return function
+
+
+class _TemplateIndex:
+    """Matches request paths against the path templates of every table.
+
+    The templates are kept in a trie of path segments. A literal segment is
+    preferred over a field, so ``/data/wow/item/index`` resolves to its own
+    template rather than to ``/data/wow/item/{item_id}``.
+    """
+
+    _FIELD = "{}"
+    _END = ""
+
+    def __init__(self) -> None:
+        self._root: dict[str, Any] = {}
+
+    def add(self, template: str) -> None:
+        node = self._root
+        for segment in template.strip("/").split("/"):
+            node = node.setdefault(self._FIELD if "{" in segment else segment, {})
+        node[self._END] = template
+
+    def match(self, path: str) -> Optional[str]:
+        return self._match(self._root, path.strip("/").split("/"), 0)
+
+    def _match(
+        self, node: dict[str, Any], segments: list[str], i: int
+    ) -> Optional[str]:
+        if i == len(segments):
+            return node.get(self._END)
+        for key in (segments[i], self._FIELD):
+            child = node.get(key)
+            if child is not None:
+                found = self._match(child, segments, i + 1)
+                if found is not None:
+                    return found
+        return None
+
+
+_templates = _TemplateIndex()
+
+
+def endpoint_template(path: str) -> str:
+    """Get the path template that a request path was built from.
+
+    Paths of the endpoints declared in a table or with ``path_templates``
+    resolve to their template. For other paths, such as those passed to
+    ``get_resource``, numeric segments are replaced with ``{id}``.
+
+    Args:
+        path: The path of a request URL, e.g. ``"/data/wow/item/19019"``.
+
+    Returns:
+        str: The template, e.g. ``"/data/wow/item/{item_id}"``.
+    """
+    template = _templates.match(path)
+    if template is not None:
+        return template
+    return "/".join("{id}" if part.isdigit() else part for part in path.split("/"))
+
+
+def path_templates(*templates: str) -> Callable[[type], type]:
+    """Declare the path templates of an API class's hand-written methods.
+
+    ``endpoint_template`` then resolves the paths of their requests to these
+    templates, so that slugs, battletags and other free-form path segments
+    do not each make a new template.
+
+    Args:
+        *templates: The path templates, e.g. ``"/hearthstone/cards/{id_or_slug}"``.
+
+    Returns:
+        A class decorator that registers the templates.
+    """
+
+    def register(cls: type) -> type:
+        for template in templates:
+            _templates.add(template)
+        return cls
+
+    return register
+
+
+class _EndpointMethod:
+    """Class attribute that generates an endpoint method on first lookup."""
+
+    def __init__(self, owner: type, endpoint: Endpoint) -> None:
+        self._owner = owner
+        self._endpoint = endpoint
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        function = self._endpoint.build()
+        function.__module__ = self._owner.__module__
+        function.__qualname__ = f"{self._owner.__qualname__}.{function.__name__}"
+        # Replace this descriptor, so later lookups find the plain function.
+        setattr(self._owner, function.__name__, function)
+        return function.__get__(instance, owner)
+
+
+def endpoints(table: Iterable[Endpoint]) -> Callable[[type], type]:
+    """Install the methods of an endpoint table on an API class.
+
+    Methods the class defines itself are kept, so an endpoint that needs
+    special handling can still be written out by hand. The class's
+    ``endpoints`` mapping includes the endpoints of its base classes.
+
+    Args:
+        table: The endpoints of the class.
+
+    Returns:
+        The class decorator.
+    """
+    table = tuple(table)
+
+    def decorate(cls: type) -> type:
+        registry: dict[str, Endpoint] = dict(getattr(cls, "endpoints", {}))
+        for endpoint in table:
+            registry[endpoint.name] = endpoint
+            _templates.add(endpoint.path)
+            if endpoint.name not in vars(cls):
+                setattr(cls, endpoint.name, _EndpointMethod(cls, endpoint))
+        cls.endpoints = MappingProxyType(registry)
+        return cls
+
+    return decorate
@@ -0,0 +1,205 @@
+"""retry.py file.
+
+Retries of idempotent API requests that fail for transient reasons.
+
+``BaseApi`` sends every API GET through the ``RetryPolicy`` of its context, if
+any. Rate-limited (``429``) and unavailable (``5xx``) answers and dropped
+connections are then retried after a capped, jittered exponential backoff, or
+after the delay the API asks for in ``Retry-After``. The OAuth token POST is
+never retried.
+"""
+
+import logging
+import random
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+class RetryPolicy:
+    """Decides whether and when a failed GET is sent again.
+
+    The n-th retry waits a random time between 0 and
+    ``min(max_backoff, backoff * 2 ** n)`` seconds ("full jitter"), so many
+    clients failing together do not retry in lockstep. When the response has
+    a ``Retry-After`` header, that delay is used instead.
+
+    Example:
+        ```python
+        context = ApiContext(retry_policy=RetryPolicy(max_retries=8))
+        api = BlizzardApi("your_id", "your_secret", Region.US, context=context)
+        ```
+
+    Attributes:
+        max_retries (int): The retry budget of one request.
+        backoff (float): The base delay, in seconds.
+        max_backoff (float): The cap of the computed delays, in seconds.
+        max_retry_after (float): The longest ``Retry-After`` delay honored, in
+            seconds. A response asking for a longer wait is returned as is.
+        statuses (frozenset[int]): The status codes that are retried.
+    """
+
+    DEFAULT_STATUSES = frozenset({429, 500, 502, 503, 504})
+    EXCEPTIONS: tuple[type[BaseException], ...] = (
+        requests.ConnectionError,
+        requests.Timeout,
+    )
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        *,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 120.0,
+        statuses: Optional[Iterable[int]] = None,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            max_retries: The retry budget of one request. Defaults to 5.
+            backoff (keyword-only): The base delay, in seconds. Defaults to 0.5.
+            max_backoff (keyword-only): The cap of the computed delays, in
+                seconds. Defaults to 30.
+            max_retry_after (keyword-only): The longest ``Retry-After`` delay
+                honored, in seconds. Defaults to 120.
+            statuses (keyword-only): The status codes that are retried.
+                Defaults to 429, 500, 502, 503 and 504.
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = (
+            self.DEFAULT_STATUSES if statuses is None else frozenset(statuses)
+        )
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Get a jittered delay before a retry.
+
+        Args:
+            attempt: The number of retries already made for the request.
+
+        Returns:
+            float: The delay, in seconds.
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+    @staticmethod
+    def retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a ``Retry-After`` header.
+
+        Args:
+            value: The header value: a number of seconds or an HTTP date.
+
+        Returns:
+            float, optional: The delay in seconds, or None if the header is
+            missing or malformed.
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+    def _response_delay(self, response: Any, attempt: int) -> Optional[float]:
+        """Get the delay before retrying a response, or None to return it."""
+        if attempt >= self.max_retries or response.status_code not in self.statuses:
+            return None
+        retry_after = self.retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return self.backoff_delay(attempt)
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after
+
+    def call(
+        self,
+        send: Callable[[], R],
+        exceptions: Optional[tuple[type[BaseException], ...]] = None,
+    ) -> R:
+        """Send a request, retrying it while the policy allows.
+
+        Args:
+            send: Sends the request and returns its response.
+            exceptions: The transport errors that are retried. Defaults to
+                ``EXCEPTIONS`` (``requests`` connection errors and timeouts).
+
+        Returns:
+            The last response. It may still be an error response once the
+            retry budget is spent. Responses that are retried are closed.
+        """
+        exceptions = self.EXCEPTIONS if exceptions is None else exceptions
+        attempt = 0
+        while True:
+            try:
+                response = send()
+            except exceptions as exc:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_delay(attempt)
+                logger.info("Retrying in %.2fs after %r", delay, exc)
+            else:
+                delay = self._response_delay(response, attempt)
+                if delay is None:
+                    return response
+                logger.info(
+                    "Retrying in %.2fs after status %s", delay, response.status_code
+                )
+                # Return the connection of a streamed response to the pool.
+                response.close()
+            attempt += 1
+            time.sleep(delay)
+
+    async def call_async(
+        self,
+        send: Callable[[], Awaitable[R]],
+        exceptions: tuple[type[BaseException], ...],
+    ) -> R:
+        """Send a request from a coroutine, retrying it while the policy allows.
+
+        Args:
+            send: Returns an awaitable that sends the request.
+            exceptions: The transport errors that are retried.
+
+        Returns:
+            The last response. It may still be an error response once the
+            retry budget is spent. Responses that are retried are closed with
+            ``aclose()``.
+        """
+        import asyncio
+
+        attempt = 0
+        while True:
+            try:
+                response = await send()
+            except exceptions as exc:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_delay(attempt)
+                logger.info("Retrying in %.2fs after %r", delay, exc)
+            else:
+                delay = self._response_delay(response, attempt)
+                if delay is None:
+                    return response
+                logger.info(
+                    "Retrying in %.2fs after status %s", delay, response.status_code
+                )
+                await response.aclose()
+            attempt += 1
+            await asyncio.sleep(delay)
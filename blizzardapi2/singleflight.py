@@ -0,0 +1,103 @@
+"""singleflight.py file.
+
+Coalescing of identical requests that are in flight at the same time.
+
+When many threads (or coroutines) ask for the same resource at once, only the
+first one sends the request; the others wait for it and share its result.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Awaitable, Callable, Hashable, TypeVar
+
+if TYPE_CHECKING:
+    import asyncio
+
+R = TypeVar("R")
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome.
+
+    Callers that arrive while a call for their key is running wait for it
+    and receive the same result (or exception) instead of starting their own.
+    Results are shared objects and must be treated as read-only.
+
+    Example:
+        ```python
+        context = ApiContext(single_flight=SingleFlight())
+        api = BlizzardApi("your_id", "your_secret", Region.US, context=context)
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, Future] = {}
+        self._async_calls: dict[Hashable, asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, call: Callable[[], R]) -> R:
+        """Run ``call``, or wait for the running call with the same key.
+
+        Args:
+            key: Identifies calls that may share a result.
+            call: Produces the result.
+
+        Returns:
+            The result of ``call`` or of the running call with the same key.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = call()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def do_async(self, key: Hashable, call: Callable[[], Awaitable[R]]) -> R:
+        """Await ``call()``, or wait for the running call with the same key.
+
+        Calls are only shared between coroutines of the same event loop. The
+        shared call runs in its own task, so cancelling one caller (even the
+        first) cancels only its wait; the call completes for the others.
+
+        Args:
+            key: Identifies calls that may share a result.
+            call: Returns an awaitable producing the result.
+
+        Returns:
+            The result of ``call()`` or of the running call with the same key.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        loop_key = (loop, key)
+        with self._lock:
+            task = self._async_calls.get(loop_key)
+            if task is None:
+                task = self._async_calls[loop_key] = loop.create_task(call())
+                task.add_done_callback(lambda done: self._forget_async(loop_key, done))
+        return await asyncio.shield(task)
+
+    def _forget_async(self, loop_key: Hashable, task: "asyncio.Task") -> None:
+        with self._lock:
+            if self._async_calls.get(loop_key) is task:
+                del self._async_calls[loop_key]
+        # Mark the exception as retrieved when no caller is waiting.
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._calls) + len(self._async_calls)
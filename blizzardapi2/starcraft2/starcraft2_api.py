@@ -1,6 +1,4 @@
-from ..endpoint import ApiEndpoint
-from .starcraft2_community_api import Starcraft2CommunityApi
-from .starcraft2_game_data_api import Starcraft2GameDataApi
+from ..endpoint import ApiEndpoint, SubClient
 
 """starcraft2_api.py file."""
 
@@ -17,11 +15,10 @@ class Starcraft2Api(ApiEndpoint):
         game_data: An instance of ``Starcraft2GameDataApi`` for accessing game data services.
     """
 
-    def extend_endpoint(self) -> None:
-        """Init Starcraft2."""
-        self.community: Starcraft2CommunityApi = Starcraft2CommunityApi(
-            self.client_id, self.client_secret, self.region, self.locale
-        )
-        self.game_data: Starcraft2GameDataApi = Starcraft2GameDataApi(
-            self.client_id, self.client_secret, self.region
-        )
+    community = SubClient(
+        "blizzardapi2.starcraft2.starcraft2_community_api:Starcraft2CommunityApi"
+    )
+    game_data = SubClient(
+        "blizzardapi2.starcraft2.starcraft2_game_data_api:Starcraft2GameDataApi",
+        localized=False,
+    )
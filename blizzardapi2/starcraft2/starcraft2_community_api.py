@@ -3,9 +3,20 @@
 from typing import Any
 
 from ..api import LocaleApi
+from ..registry import path_templates
 from ..types import OptionalLocale, OptionalRegion
 
 
+@path_templates(
+    "/sc2/static/profile/{region_id}",
+    "/sc2/metadata/profile/{region_id}/{realm_id}/{profile_id}",
+    "/sc2/profile/{region_id}/{realm_id}/{profile_id}",
+    "/sc2/profile/{region_id}/{realm_id}/{profile_id}/ladder/summary",
+    "/sc2/profile/{region_id}/{realm_id}/{profile_id}/ladder/{ladder_id}",
+    "/sc2/ladder/grandmaster/{region_id}",
+    "/sc2/ladder/season/{region_id}",
+    "/sc2/player/{account_id}",
+)
 class Starcraft2CommunityApi(LocaleApi):
     """All Starcraft 2 Community API methods.
 
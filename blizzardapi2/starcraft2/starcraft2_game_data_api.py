@@ -3,9 +3,11 @@
 from typing import Any
 
 from ..api import BaseApi
+from ..registry import path_templates
 from ..types import OptionalRegion
 
 
+@path_templates("/data/sc2/league/{season_id}/{queue_id}/{team_type}/{league_id}")
 class Starcraft2GameDataApi(BaseApi):
     """Starcraft2 Game Data API class.
 
@@ -0,0 +1,239 @@
+"""streaming.py file.
+
+Incremental parsing of large JSON responses.
+
+The auction endpoints return one JSON object whose ``auctions`` array may hold
+hundreds of thousands of entries. ``JsonArrayStream`` is fed the response body
+chunk by chunk and returns each element of that array as soon as it has been
+received, so only one chunk and the elements not yet consumed are held in
+memory at a time.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# What may follow the part of a number received so far, e.g. ``.5`` after
+# ``12`` or ``-3`` after ``1e``.
+_NUMBER_TAIL = re.compile(r"[-+.eE0-9]*")
+
+# Parser states.
+_START, _KEY, _COLON, _VALUE, _AFTER_VALUE, _ARRAY, _ITEM, _AFTER_ITEM, _DONE = range(9)
+
+
+class JsonArrayStream:
+    """Push parser yielding the elements of one array member of a JSON object.
+
+    Members of the top-level object other than ``key`` are parsed and
+    discarded. If the object has no ``key`` member, no element is returned.
+
+    Example:
+        ```python
+        stream = JsonArrayStream("auctions")
+        for chunk in response.iter_content(65536):
+            for auction in stream.feed(chunk):
+                ...
+        stream.close()
+        ```
+    """
+
+    def __init__(self, key: str) -> None:
+        """Initialize the parser.
+
+        Args:
+            key: The name of the array member to stream.
+        """
+        self.key = key
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._current_key = None
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Parse the next chunk of the body.
+
+        Args:
+            chunk: The next bytes of the body.
+
+        Returns:
+            list[Any]: The array elements completed by this chunk.
+        """
+        self._buffer = self._buffer[self._pos :] + self._text.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        """Finish parsing once the whole body has been fed.
+
+        Returns:
+            list[Any]: The array elements still buffered.
+
+        Raises:
+            ValueError: If the body is not a complete JSON object.
+        """
+        self._buffer = self._buffer[self._pos :] + self._text.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if self._state != _DONE:
+            raise ValueError("Truncated or malformed JSON response body")
+        return items
+
+    def _skip_whitespace(self) -> bool:
+        """Move past whitespace; return whether a character follows."""
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        return self._pos < len(self._buffer)
+
+    def _decode(self, final: bool) -> tuple[bool, Any]:
+        """Decode the JSON value at the current position, if complete."""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise ValueError("Malformed JSON response body") from None
+            return False, None
+        # A number at the end of the buffer may continue in the next chunk:
+        # ``raw_decode`` reads ``12.`` as ``12``, stopping before the ``.``.
+        if not final and (
+            end == len(self._buffer)
+            or (
+                isinstance(value, (int, float))
+                and _NUMBER_TAIL.match(self._buffer, end).end() == len(self._buffer)
+            )
+        ):
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _expect(self, char: str) -> None:
+        if self._buffer[self._pos] != char:
+            raise ValueError(
+                f"Unexpected {self._buffer[self._pos]!r} in JSON response body"
+            )
+        self._pos += 1
+
+    def _parse(self, final: bool) -> list[Any]:
+        items = []
+        while self._state != _DONE and self._skip_whitespace():
+            char = self._buffer[self._pos]
+            if self._state == _START:
+                self._expect("{")
+                self._state = _KEY
+            elif self._state == _KEY:
+                if char == "}":
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                complete, self._current_key = self._decode(final)
+                if not complete:
+                    break
+                self._state = _COLON
+            elif self._state == _COLON:
+                self._expect(":")
+                self._state = _ARRAY if self._current_key == self.key else _VALUE
+            elif self._state == _VALUE:
+                complete, _ = self._decode(final)
+                if not complete:
+                    break
+                self._state = _AFTER_VALUE
+            elif self._state == _AFTER_VALUE:
+                self._expect("," if char != "}" else "}")
+                self._state = _KEY if char == "," else _DONE
+            elif self._state == _ARRAY:
+                self._expect("[")
+                self._state = _ITEM
+            elif self._state == _ITEM:
+                if char == "]":
+                    self._pos += 1
+                    self._state = _AFTER_VALUE
+                    continue
+                complete, item = self._decode(final)
+                if not complete:
+                    break
+                items.append(item)
+                self._state = _AFTER_ITEM
+            elif self._state == _AFTER_ITEM:
+                self._expect("," if char != "]" else "]")
+                self._state = _ITEM if char == "," else _AFTER_VALUE
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """Yield the elements of an array member of a streamed JSON object.
+
+    Args:
+        chunks: The body of the JSON object, in chunks.
+        key: The name of the array member to stream.
+
+    Yields:
+        Any: The decoded elements of the array, one at a time.
+    """
+    stream = JsonArrayStream(key)
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    yield from stream.close()
+
+
+async def aiter_json_array(
+    chunks: AsyncIterable[bytes], key: str
+) -> AsyncIterator[Any]:
+    """Asynchronously yield the elements of an array member of a JSON object.
+
+    Args:
+        chunks: The body of the JSON object, in chunks.
+        key: The name of the array member to stream.
+
+    Yields:
+        Any: The decoded elements of the array, one at a time.
+    """
+    stream = JsonArrayStream(key)
+    async for chunk in chunks:
+        for item in stream.feed(chunk):
+            yield item
+    for item in stream.close():
+        yield item
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Group items into lists of ``size`` (the last one may be shorter).
+
+    Args:
+        items: The items to group.
+        size: The number of items per list.
+
+    Yields:
+        list: The next group of items.
+    """
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def abatched(items: AsyncIterable[T], size: int) -> AsyncIterator[list[T]]:
+    """Group asynchronously produced items into lists of ``size``.
+
+    Args:
+        items: The items to group.
+        size: The number of items per list.
+
+    Yields:
+        list: The next group of items.
+    """
+    batch = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,3 @@
+"""Test and benchmark helpers: a local stand-in for the Blizzard API."""
+
+from .server import FakeBlizzardServer, Faults, redirect  # noqa
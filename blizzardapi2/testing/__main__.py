@@ -0,0 +1,90 @@
+"""Run a fake Blizzard API server from the command line.
+
+Example:
+    ```
+    python -m blizzardapi2.testing --port 8080 --latency 0.05 --error-rate 0.01
+    ```
+
+Clients are pointed at the server by overriding the URLs of ``BaseApi``:
+
+    ```python
+    BaseApi.API_URLS = BaseApi.OAUTH_URLS = {"default": "http://127.0.0.1:8080"}
+    ```
+"""
+
+import argparse
+import sys
+from typing import Optional
+
+from .server import FakeBlizzardServer, Faults
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Parse the command line and serve until interrupted.
+
+    Args:
+        argv: The command-line arguments. Defaults to None, for ``sys.argv``.
+
+    Returns:
+        int: The exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m blizzardapi2.testing",
+        description="Serve a local stand-in for the Blizzard API and OAuth hosts.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    data = parser.add_argument_group("data")
+    data.add_argument("--fixtures", help="directory of JSON documents to serve")
+    data.add_argument("--auctions", type=int, default=20_000)
+    data.add_argument("--commodities", type=int, default=100_000)
+    data.add_argument("--search-results", type=int, default=5_000)
+    faults = parser.add_argument_group("faults")
+    faults.add_argument("--latency", type=float, default=0.0, help="seconds")
+    faults.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    faults.add_argument("--unauthorized-rate", type=float, default=0.0)
+    faults.add_argument("--throttle-rate", type=float, default=0.0)
+    faults.add_argument("--error-rate", type=float, default=0.0)
+    faults.add_argument(
+        "--error-statuses",
+        type=lambda value: tuple(int(code) for code in value.split(",")),
+        default=Faults.error_statuses,
+        help="comma-separated status codes (default: 500,502,503,504)",
+    )
+    faults.add_argument("--retry-after", type=float, help="seconds")
+    faults.add_argument("--rate-limit", type=int, help="requests per second")
+    faults.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    server = FakeBlizzardServer(
+        args.host,
+        args.port,
+        auctions=args.auctions,
+        commodities=args.commodities,
+        search_results=args.search_results,
+        fixtures=args.fixtures,
+        faults=Faults(
+            latency=args.latency,
+            jitter=args.jitter,
+            unauthorized_rate=args.unauthorized_rate,
+            throttle_rate=args.throttle_rate,
+            error_rate=args.error_rate,
+            error_statuses=args.error_statuses,
+            retry_after=args.retry_after,
+            rate_limit=args.rate_limit,
+            seed=args.seed,
+        ),
+    )
+    print(f"Serving the fake Blizzard API on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"{server.requests} requests: {dict(server.statuses)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,591 @@
+"""server.py file.
+
+A local stand-in for the Blizzard API and OAuth hosts.
+
+``FakeBlizzardServer`` answers the requests of this library on a loopback
+port, with synthetic payloads of realistic sizes: small static documents for
+most resources, auction house dumps of a configurable number of auctions, and
+paginated search results, or JSON files from a fixtures directory. It
+implements the client-credentials token flow and rejects API requests without
+a bearer token, so the whole request pipeline of a client runs unchanged
+against it.
+
+``Faults`` makes the server misbehave on purpose: added latency, revoked
+tokens (``401``), throttling (``429``) with an emulated request quota, server
+errors (``5xx``) and ``Retry-After`` headers, to load-test a service and its
+retry and rate limiting settings offline. The server can also be started from
+the command line, see ``python -m blizzardapi2.testing --help``.
+
+Example:
+    ```python
+    with FakeBlizzardServer() as server, server.redirect():
+        api = BlizzardApi("id", "secret", "us")
+        api.wow.game_data.get_item(19019)
+    ```
+"""
+
+import contextlib
+import json
+import math
+import random
+import secrets
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, ContextManager, Iterator, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from ..api import BaseApi
+
+TOKEN_LIFETIME = 86399
+MAX_PAGE_SIZE = 1000
+
+_TIME_LEFT = ("SHORT", "MEDIUM", "LONG", "VERY_LONG")
+
+
+def _encode(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _href(path: str, namespace: Optional[str] = None) -> str:
+    query = f"?namespace={namespace}" if namespace else ""
+    return f"https://us.api.blizzard.com{path}{query}"
+
+
+def _links(path: str, namespace: Optional[str] = None) -> dict[str, Any]:
+    return {"self": {"href": _href(path, namespace)}}
+
+
+def versioned(namespace: str, version: str) -> str:
+    """Insert a version into a namespace, as the API does in its answers.
+
+    Args:
+        namespace: The requested namespace, e.g. ``"static-us"``.
+        version: The game version, e.g. ``"11.0.2_56313"``.
+
+    Returns:
+        str: The versioned namespace, e.g. ``"static-11.0.2_56313-us"``.
+    """
+    kind, _, region = namespace.rpartition("-")
+    return f"{kind}-{version}-{region}" if kind else namespace
+
+
+def static_document(path: str, namespace: Optional[str] = None) -> dict[str, Any]:
+    """Build the document of a static or profile resource.
+
+    The document has the shape and size (about 1 KB) of a typical game data
+    response: links, an ID taken from the path, a localized name and a few
+    nested references.
+
+    Args:
+        path: The path of the resource.
+        namespace: The versioned namespace named in the links. Defaults to
+            None, for links without namespace.
+
+    Returns:
+        dict[str, Any]: The document.
+    """
+    numbers = [int(part) for part in path.split("/") if part.isdigit()]
+    item_id = numbers[-1] if numbers else 1
+    name = f"Resource {item_id}"
+    return {
+        "_links": _links(path, namespace),
+        "id": item_id,
+        "name": name,
+        "description": f"A synthetic document served for {path}.",
+        "quality": {"type": "EPIC", "name": "Epic"},
+        "level": 60 + item_id % 20,
+        "media": {"key": {"href": f"{path}/media"}, "id": item_id},
+        "preview": {
+            "stats": [
+                {"type": {"type": stat, "name": stat.title()}, "value": item_id % 97}
+                for stat in ("AGILITY", "STAMINA", "HASTE", "MASTERY")
+            ],
+            "sell_price": {"value": item_id * 100},
+        },
+        "purchase_price": item_id * 400,
+        "is_equippable": True,
+        "is_stackable": False,
+    }
+
+
+def index_document(
+    path: str, size: int, namespace: Optional[str] = None
+) -> dict[str, Any]:
+    """Build the document of an index, e.g. ``/data/wow/mount/index``.
+
+    Args:
+        path: The path of the index.
+        size: The number of resources listed.
+        namespace: The versioned namespace named in the links. Defaults to
+            None, for links without namespace.
+
+    Returns:
+        dict[str, Any]: The document, listing the resources as links to
+        ``{path without /index}/{id}``.
+    """
+    base = path.removesuffix("/index")
+    return {
+        "_links": _links(path, namespace),
+        f"{base.rsplit('/', 1)[-1]}s": [
+            {
+                "key": {"href": _href(f"{base}/{resource_id}", namespace)},
+                "name": f"Resource {resource_id}",
+                "id": resource_id,
+            }
+            for resource_id in range(1, size + 1)
+        ],
+    }
+
+
+def auction_house(count: int, seed: int = 0, commodities: bool = False) -> bytes:
+    """Build an auction house dump.
+
+    Args:
+        count: The number of auctions.
+        seed: The seed of the random prices and quantities. Defaults to 0.
+        commodities: Whether to build a commodities dump, whose auctions have
+            a unit price instead of a buyout and no item modifiers. Defaults
+            to False.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    rng = random.Random(seed)
+    auctions = []
+    for auction_id in range(1, count + 1):
+        auction: dict[str, Any] = {
+            "id": auction_id,
+            "item": {"id": rng.randrange(1, 200_000)},
+            "quantity": rng.randrange(1, 200) if commodities else 1,
+        }
+        if commodities:
+            auction["unit_price"] = rng.randrange(100, 10_000_000)
+        else:
+            auction["item"]["modifiers"] = [{"type": 28, "value": rng.randrange(1000)}]
+            auction["buyout"] = rng.randrange(100, 100_000_000)
+        auction["time_left"] = rng.choice(_TIME_LEFT)
+        auctions.append(auction)
+    path = "/data/wow/auctions/commodities"
+    return _encode({"_links": _links(path), "auctions": auctions})
+
+
+def search_page(path: str, total: int, page: int, page_size: int) -> dict[str, Any]:
+    """Build one page of search results.
+
+    Args:
+        path: The path of the search endpoint.
+        total: The number of results of the search.
+        page: The page number, starting at 1.
+        page_size: The number of results per page.
+
+    Returns:
+        dict[str, Any]: The page.
+    """
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    first = (page - 1) * page_size
+    results = [
+        {
+            "key": {"href": f"{path}/{result_id}"},
+            "data": {"id": result_id, "name": {"en_US": f"Result {result_id}"}},
+        }
+        for result_id in range(first + 1, min(first + page_size, total) + 1)
+    ]
+    return {
+        "page": page,
+        "pageSize": len(results),
+        "maxPageSize": MAX_PAGE_SIZE,
+        "pageCount": max(1, -(-total // page_size)),
+        "results": results,
+    }
+
+
+@contextlib.contextmanager
+def redirect(url: str, api_class: type[BaseApi] = BaseApi) -> Iterator[None]:
+    """Point an API class and its subclasses at another host.
+
+    ``API_URLS`` and ``OAUTH_URLS`` are replaced on ``api_class`` for the
+    duration of the block, then restored. Every region is sent to ``url``.
+
+    Args:
+        url: The base URL of the host, e.g. ``"http://127.0.0.1:8080"``.
+        api_class: The class to redirect. Defaults to ``BaseApi``, which
+            redirects every client.
+
+    Yields:
+        None
+    """
+    saved = {name: api_class.__dict__.get(name) for name in ("API_URLS", "OAUTH_URLS")}
+    api_class.API_URLS = {"default": url}
+    api_class.OAUTH_URLS = {"default": url}
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                delattr(api_class, name)
+            else:
+                setattr(api_class, name, value)
+
+
+@dataclass(frozen=True)
+class Faults:
+    """The misbehaviour of a ``FakeBlizzardServer``.
+
+    Rates are fractions of the API requests, drawn independently for each
+    request. The token endpoint is only affected by the latency.
+
+    Attributes:
+        latency (float): Seconds added to every response.
+        jitter (float): Up to this many seconds added at random on top of
+            ``latency``.
+        unauthorized_rate (float): Rate of requests whose token is revoked and
+            answered ``401``, as if it had expired early.
+        throttle_rate (float): Rate of requests answered ``429``.
+        error_rate (float): Rate of requests answered with one of
+            ``error_statuses``.
+        error_statuses (tuple[int, ...]): The server errors to inject.
+        retry_after (float, optional): The ``Retry-After`` header sent with
+            injected ``429`` and ``503`` answers, in seconds. None sends none.
+        rate_limit (int, optional): The number of API requests per second the
+            server accepts before answering ``429``, like Blizzard's quota.
+            The throttled answers carry a ``Retry-After`` header until the
+            next second. None disables the quota.
+        seed (int, optional): The seed of the random draws, for reproducible
+            runs. Only read when the server is created.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    unauthorized_rate: float = 0.0
+    throttle_rate: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (500, 502, 503, 504)
+    retry_after: Optional[float] = None
+    rate_limit: Optional[int] = None
+    seed: Optional[int] = None
+
+
+class FakeBlizzardServer:
+    """A local HTTP server that stands in for the Blizzard API and OAuth hosts.
+
+    The server runs on a background thread and serves one loopback port for
+    every region. Keep-alive is supported, so a client reuses its pooled
+    connections like it would with the real hosts.
+
+    Attributes:
+        auctions (int): The number of auctions of each connected realm.
+        commodities (int): The number of commodity auctions of a region.
+        search_results (int): The number of results of every search.
+        index_size (int): The number of resources listed by every index.
+        namespace_version (str): The game version named in the namespaces of
+            the answers. Change it to simulate a patch.
+        fixtures (Path, optional): A directory of JSON documents served in
+            place of the synthetic ones. The document of
+            ``/data/wow/item/19019`` is ``data/wow/item/19019.json``.
+        faults (Faults): The misbehaviour of the server. Can be replaced while
+            the server runs.
+        requests (int): The number of requests served so far.
+        tokens (int): The number of access tokens issued so far.
+        statuses (Counter[int]): The number of answers per status code.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        auctions: int = 20_000,
+        commodities: int = 100_000,
+        search_results: int = 5_000,
+        index_size: int = 100,
+        namespace_version: str = "11.0.2_56313",
+        fixtures: Optional[str | Path] = None,
+        faults: Optional[Faults] = None,
+    ) -> None:
+        """Initialize the server, without starting it.
+
+        Args:
+            host: The address to listen on. Defaults to the loopback address.
+            port: The port to listen on. Defaults to 0, for a free port.
+            auctions (keyword-only): The number of auctions of each connected
+                realm. Defaults to 20,000.
+            commodities (keyword-only): The number of commodity auctions.
+                Defaults to 100,000.
+            search_results (keyword-only): The number of results of every
+                search. Defaults to 5,000.
+            index_size (keyword-only): The number of resources listed by every
+                index. Defaults to 100.
+            namespace_version (keyword-only): The game version named in the
+                namespaces of the answers. Defaults to ``"11.0.2_56313"``.
+            fixtures (keyword-only): A directory of JSON documents served in
+                place of the synthetic ones. Defaults to None.
+            faults (keyword-only): The misbehaviour of the server. Defaults to
+                None, for a well-behaved server.
+        """
+        self.auctions = auctions
+        self.commodities = commodities
+        self.search_results = search_results
+        self.index_size = index_size
+        self.namespace_version = namespace_version
+        self.fixtures = Path(fixtures).resolve() if fixtures is not None else None
+        self.faults = faults or Faults()
+        self.requests = 0
+        self.tokens = 0
+        self.statuses: Counter[int] = Counter()
+        self._issued: set[str] = set()
+        self._lock = threading.Lock()
+        self._random = random.Random(self.faults.seed)
+        self._window = (0, 0)
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Get the base URL of the server, e.g. ``http://127.0.0.1:49152``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_urls(self) -> dict[str, str]:
+        """Get the ``API_URLS`` mapping that points every region at the server."""
+        return {"default": self.url}
+
+    @property
+    def oauth_urls(self) -> dict[str, str]:
+        """Get the ``OAUTH_URLS`` mapping that points every region at the server."""
+        return {"default": self.url}
+
+    def start(self) -> "FakeBlizzardServer":
+        """Start serving on a background thread.
+
+        Returns:
+            FakeBlizzardServer: The server itself.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                # Poll often, so that stop() returns promptly.
+                kwargs={"poll_interval": 0.05},
+                name="blizzardapi2-fake-server",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeBlizzardServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def redirect(self, api_class: type[BaseApi] = BaseApi) -> ContextManager[None]:
+        """Point an API class and its subclasses at the server.
+
+        Args:
+            api_class: The class to redirect. Defaults to ``BaseApi``, which
+                redirects every client.
+
+        Returns:
+            A context manager that redirects the class for its block.
+        """
+        return redirect(self.url, api_class)
+
+    def issue_token(self) -> dict[str, Any]:
+        """Issue a new access token, as the OAuth token endpoint does."""
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._issued.add(token)
+            self.tokens += 1
+        return {
+            "access_token": token,
+            "token_type": "bearer",
+            "expires_in": TOKEN_LIFETIME,
+            "sub": "fake-client",
+        }
+
+    def is_authorized(self, authorization: Optional[str]) -> bool:
+        """Check the ``Authorization`` header of an API request."""
+        scheme, _, token = (authorization or "").partition(" ")
+        return scheme.lower() == "bearer" and token in self._issued
+
+    def delay(self) -> float:
+        """Draw the latency of a response, in seconds."""
+        faults = self.faults
+        if not faults.jitter:
+            return faults.latency
+        with self._lock:
+            return faults.latency + self._random.uniform(0, faults.jitter)
+
+    def fault(self, authorization: str) -> Optional[tuple[int, dict[str, str]]]:
+        """Decide whether to fail an authorized API request.
+
+        Args:
+            authorization: The ``Authorization`` header of the request.
+
+        Returns:
+            The status code and headers of the failure, or None to serve the
+            request.
+        """
+        faults = self.faults
+        with self._lock:
+            if faults.rate_limit is not None:
+                second, count = self._window
+                now = time.time()
+                if int(now) != second:
+                    second, count = int(now), 0
+                self._window = (second, count + 1)
+                if count >= faults.rate_limit:
+                    wait = max(1, math.ceil(second + 1 - now))
+                    return 429, {"Retry-After": str(wait)}
+            draw = self._random.random()
+            error = self._random.choice(faults.error_statuses or (500,))
+        retry_after = (
+            {"Retry-After": f"{faults.retry_after:g}"}
+            if faults.retry_after is not None
+            else {}
+        )
+        if draw < faults.unauthorized_rate:
+            with self._lock:
+                self._issued.discard(authorization.partition(" ")[2])
+            return 401, {}
+        draw -= faults.unauthorized_rate
+        if draw < faults.throttle_rate:
+            return 429, retry_after
+        draw -= faults.throttle_rate
+        if draw < faults.error_rate:
+            return error, retry_after if error == 503 else {}
+        return None
+
+    def fixture(self, path: str) -> Optional[bytes]:
+        """Get the fixture document of a path, if there is one."""
+        if self.fixtures is None:
+            return None
+        file = (self.fixtures / f"{path.strip('/')}.json").resolve()
+        if not file.is_relative_to(self.fixtures) or not file.is_file():
+            return None
+        return file.read_bytes()
+
+    def document(self, path: str, query: dict[str, str]) -> bytes:
+        """Get the encoded body of the resource at a path.
+
+        Args:
+            path: The path of the request.
+            query: The query parameters of the request.
+
+        Returns:
+            bytes: The encoded JSON document.
+        """
+        fixture = self.fixture(path)
+        if fixture is not None:
+            return fixture
+        if path.endswith("/auctions/commodities"):
+            return _auction_house(self.commodities, commodities=True)
+        if path.endswith("/auctions"):
+            return _auction_house(self.auctions, commodities=False)
+        if "/search/" in path:
+            page = int(query.get("_page", 1))
+            page_size = int(query.get("_pageSize", 100))
+            return _encode(search_page(path, self.search_results, page, page_size))
+        namespace = self.namespace(query)
+        if path.endswith("/index"):
+            return _encode(index_document(path, self.index_size, namespace))
+        return _static_document(path, namespace)
+
+    def namespace(self, query: dict[str, str]) -> Optional[str]:
+        """Get the versioned namespace of a request, if it names one."""
+        namespace = query.get("namespace")
+        return versioned(namespace, self.namespace_version) if namespace else None
+
+
+@lru_cache(maxsize=8)
+def _auction_house(count: int, commodities: bool) -> bytes:
+    return auction_house(count, commodities=commodities)
+
+
+@lru_cache(maxsize=4096)
+def _static_document(path: str, namespace: Optional[str]) -> bytes:
+    return _encode(static_document(path, namespace))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "FakeBlizzard/1.0"
+    disable_nagle_algorithm = True
+
+    @property
+    def fake(self) -> FakeBlizzardServer:
+        return self.server.fake  # type: ignore[attr-defined]
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the console quiet; the server counts requests instead."""
+
+    def _reply(
+        self, status: int, body: bytes, headers: Optional[dict[str, str]] = None
+    ) -> None:
+        with self.fake._lock:
+            self.fake.statuses[status] += 1
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: int, headers: Optional[dict[str, str]] = None) -> None:
+        phrase = HTTPStatus(status).phrase
+        body = _encode({"code": status, "type": phrase, "detail": ""})
+        self._reply(status, body, headers)
+
+    def _begin(self) -> None:
+        with self.fake._lock:
+            self.fake.requests += 1
+        delay = self.fake.delay()
+        if delay:
+            time.sleep(delay)
+
+    def do_POST(self) -> None:
+        self._begin()
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if urlsplit(self.path).path != "/oauth/token":
+            self._error(HTTPStatus.NOT_FOUND)
+        elif not self.headers.get("Authorization", "").startswith("Basic "):
+            self._error(HTTPStatus.UNAUTHORIZED)
+        else:
+            self._reply(HTTPStatus.OK, _encode(self.fake.issue_token()))
+
+    def do_GET(self) -> None:
+        self._begin()
+        url = urlsplit(self.path)
+        authorization = self.headers.get("Authorization", "")
+        if not self.fake.is_authorized(authorization):
+            self._error(HTTPStatus.UNAUTHORIZED)
+            return
+        fault = self.fake.fault(authorization)
+        if fault is not None:
+            self._error(*fault)
+            return
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        namespace = self.fake.namespace(query)
+        headers = {"Battlenet-Namespace": namespace} if namespace else None
+        self._reply(HTTPStatus.OK, self.fake.document(url.path, query), headers)
@@ -0,0 +1,241 @@
+"""token_store.py file.
+
+Pluggable storage for client-credentials tokens.
+
+``BaseApi`` reads and writes client tokens through the ``TokenStore`` of its
+context, and renews them while holding the store's lock for that token. The
+default ``MemoryTokenStore`` keeps tokens in the process. ``FileTokenStore``
+keeps them on disk behind file locks, so every process on a host (for example
+pre-fork gunicorn or celery workers) shares one valid token per authority and
+only one of them renews it at a time.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import ContextManager, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+@dataclass(frozen=True)
+class ClientToken:
+    """A cached client-credentials token.
+
+    Attributes:
+        access_token (str): The bearer token.
+        expires_at (datetime): When the token stops being accepted.
+    """
+
+    access_token: str
+    expires_at: datetime
+
+    def expires_within(self, buffer: timedelta) -> bool:
+        """Check if the token expires within ``buffer`` from now.
+
+        Args:
+            buffer: The safety margin before the actual expiry.
+
+        Returns:
+            bool: True if the token should be refreshed.
+        """
+        return datetime.now(UTC) >= self.expires_at - buffer
+
+
+def token_key(client_id: str, authority: str) -> str:
+    """Build the store key of the token a client gets from an OAuth authority.
+
+    Args:
+        client_id: The Blizzard API client ID.
+        authority: The base URL of the OAuth authority.
+
+    Returns:
+        str: The key under which the token is stored.
+    """
+    return f"{client_id}@{authority}"
+
+
+class TokenStore(ABC):
+    """Interface for client-credentials token storage.
+
+    Subclass and implement ``get``, ``set`` and ``lock`` to keep tokens
+    somewhere else (e.g. Redis or memcached).
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[ClientToken]:
+        """Get the stored token for a key.
+
+        Args:
+            key: The token key, as built by ``token_key``.
+
+        Returns:
+            ClientToken, optional: the stored token, or None if there is none.
+        """
+
+    @abstractmethod
+    def set(self, key: str, token: ClientToken) -> None:
+        """Store a token.
+
+        Callers hold ``lock(key)`` while calling this method.
+
+        Args:
+            key: The token key, as built by ``token_key``.
+            token: The token to store.
+        """
+
+    @abstractmethod
+    def lock(self, key: str) -> ContextManager[None]:
+        """Get a lock that serializes renewals of one token.
+
+        Args:
+            key: The token key, as built by ``token_key``.
+
+        Returns:
+            ContextManager: held while a token is checked and renewed.
+        """
+
+
+class MemoryTokenStore(TokenStore):
+    """Keeps tokens in the memory of the current process."""
+
+    def __init__(self) -> None:
+        self._tokens: dict[str, ClientToken] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key: str) -> Optional[ClientToken]:
+        return self._tokens.get(key)
+
+    def set(self, key: str, token: ClientToken) -> None:
+        self._tokens[key] = token
+
+    def lock(self, key: str) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+
+class FileTokenStore(TokenStore):
+    """Keeps tokens in a directory shared by every process on a host.
+
+    Each token is one small JSON file, replaced atomically on renewal and
+    readable only by the current user. Renewals hold an exclusive lock on a
+    sibling ``.lock`` file, so when many processes find a token stale at the
+    same time, one of them renews it and the others pick up the new token
+    once the lock is released. Reads are served from memory until the file
+    changes on disk, so the request path only costs one ``stat`` call.
+
+    Example:
+        ```python
+        context = ApiContext(token_store=FileTokenStore("/var/run/blizzardapi2"))
+        api = BlizzardApi("your_id", "your_secret", Region.US, context=context)
+        ```
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: The directory holding the token files. Created with
+                owner-only permissions if it does not exist.
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._cache: dict[str, tuple[int, ClientToken]] = {}
+        self._thread_locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        """Get the directory holding the token files."""
+        return self._directory
+
+    def _path(self, key: str) -> Path:
+        """Get the token file of a key; keys are hashed into safe file names."""
+        return self._directory / (hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    def get(self, key: str) -> Optional[ClientToken]:
+        path = self._path(key)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            data = json.loads(path.read_text())
+            token = ClientToken(
+                access_token=data["access_token"],
+                expires_at=datetime.fromisoformat(data["expires_at"]),
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+        self._cache[key] = (mtime, token)
+        return token
+
+    def set(self, key: str, token: ClientToken) -> None:
+        path = self._path(key)
+        data = {
+            "access_token": token.access_token,
+            "expires_at": token.expires_at.isoformat(),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(data, tmp_file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._cache[key] = (path.stat().st_mtime_ns, token)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        # The thread lock keeps threads of this process from queueing on the
+        # file lock; the file lock coordinates with the other processes.
+        with self._guard:
+            thread_lock = self._thread_locks.setdefault(key, threading.Lock())
+        with thread_lock:
+            lock_path = self._path(key).with_suffix(".lock")
+            fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                _lock_file(fd)
+                try:
+                    yield
+                finally:
+                    _unlock_file(fd)
+            finally:
+                os.close(fd)
+
+
+def _lock_file(fd: int) -> None:
+    """Block until an exclusive lock on an open file is acquired."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:  # pragma: no cover - Windows
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(fd: int) -> None:
+    """Release a lock taken with ``_lock_file``."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,414 @@
+"""auctions.py file.
+
+Compact representations of auction house dumps.
+
+A ``get_commodities`` response holds hundreds of thousands of auctions, each
+decoded into dicts of its own. ``AuctionColumns`` decodes a dump into parallel
+NumPy arrays instead (auction id, item id, quantity, price and time left),
+which take a small fraction of the memory and support vectorised filters,
+aggregations and sorts. It requires the ``numpy`` extra.
+
+Polling ``get_auctions`` or ``get_commodities`` every hour and comparing
+consecutive dumps tells which listings are new, which were sold or expired,
+and which changed. ``AuctionSnapshot`` keeps only what that comparison needs,
+in compact arrays sorted by auction id: a million auctions take 24 MB instead
+of the gigabyte or so of their decoded dicts. ``diff_auctions`` then compares
+two snapshots, or two ``AuctionColumns``, over their ids.
+
+Example:
+    ```python
+    commodities = AuctionColumns.from_auctions(api.wow.game_data.iter_commodities())
+    cheap = commodities[commodities.prices < 10000].sort("item_ids", "prices")
+    per_item = commodities.aggregate("item_ids")
+
+    previous = AuctionSnapshot.from_auctions(api.wow.game_data.iter_commodities())
+    ...  # an hour later
+    current = AuctionSnapshot.from_auctions(api.wow.game_data.iter_commodities())
+    diff = diff_auctions(previous, current)
+    print(len(diff.added), len(diff.removed), len(diff.changed))
+    ```
+"""
+
+from array import array
+from dataclasses import dataclass, fields
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Union,
+)
+
+from ..streaming import batched
+
+if TYPE_CHECKING:
+    import numpy
+
+# Signed 64-bit integers: auction ids and prices in copper exceed 32 bits.
+_TYPECODE = "q"
+
+# The auctions decoded at a time by ``AuctionColumns``.
+_CHUNK_SIZE = 65536
+
+TIME_LEFT = ("SHORT", "MEDIUM", "LONG", "VERY_LONG")
+_TIME_LEFT_CODES = {name: code for code, name in enumerate(TIME_LEFT)}
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - depends on extras
+        raise ImportError(
+            "Columnar auctions require numpy. "
+            "Install it with `pip install blizzardapi2[numpy]`."
+        ) from exc
+    return numpy
+
+
+def _price(auction: Mapping[str, Any]) -> int:
+    """Get the price of an auction: unit price, buyout, or current bid."""
+    for field in ("unit_price", "buyout", "bid"):
+        price = auction.get(field)
+        if price is not None:
+            return price
+    return 0
+
+
+def _iter_auctions(auctions: Union[Mapping[str, Any], Iterable[Any]]) -> Iterator:
+    """Get the auctions of a response, or of a stream of auctions or batches."""
+    if isinstance(auctions, Mapping):
+        auctions = auctions.get("auctions", ())
+    for entry in auctions:
+        if isinstance(entry, list):
+            yield from entry
+        else:
+            yield entry
+
+
+def _is_sorted(values: array) -> bool:
+    return all(a < b for a, b in zip(values, islice(values, 1, None)))
+
+
+class AuctionSnapshot(NamedTuple):
+    """The ids, prices and quantities of the auctions of one dump.
+
+    The three arrays are parallel and sorted by auction id.
+
+    Attributes:
+        ids (array): The auction ids.
+        prices (array): The unit price of each commodity, or the buyout of
+            each auction (its current bid if it has no buyout), in copper.
+        quantities (array): The quantity of each auction.
+    """
+
+    ids: array
+    prices: array
+    quantities: array
+
+    @classmethod
+    def from_auctions(
+        cls, auctions: Union[Mapping[str, Any], Iterable[Any]]
+    ) -> "AuctionSnapshot":
+        """Build a snapshot from a dump.
+
+        Args:
+            auctions: A response of ``get_auctions`` or ``get_commodities``, or
+                the auctions (or batches of auctions) yielded by
+                ``iter_auctions`` or ``iter_commodities``.
+
+        Returns:
+            AuctionSnapshot: The snapshot.
+        """
+        ids, prices, quantities = (array(_TYPECODE) for _ in range(3))
+        for auction in _iter_auctions(auctions):
+            ids.append(auction["id"])
+            prices.append(_price(auction))
+            quantities.append(auction.get("quantity", 1))
+        if not _is_sorted(ids):
+            order = sorted(range(len(ids)), key=ids.__getitem__)
+            ids, prices, quantities = (
+                array(_TYPECODE, map(column.__getitem__, order))
+                for column in (ids, prices, quantities)
+            )
+        return cls(ids, prices, quantities)
+
+
+@dataclass(frozen=True, eq=False)
+class AuctionColumns:
+    """The auctions of a dump, as parallel NumPy arrays.
+
+    Selecting with a boolean mask, an array of positions or a slice gives the
+    selected auctions, e.g. ``columns[columns.item_ids == 2589]``.
+
+    Attributes:
+        ids (numpy.ndarray): The auction ids (int64).
+        item_ids (numpy.ndarray): The item ids (int64).
+        quantities (numpy.ndarray): The quantity of each auction (int64).
+        prices (numpy.ndarray): The unit price of each commodity, or the
+            buyout of each auction (its current bid if it has no buyout), in
+            copper (int64).
+        time_left (numpy.ndarray): The index of the time left of each auction
+            in ``TIME_LEFT``, or -1 if unknown (int8).
+    """
+
+    ids: "numpy.ndarray"
+    item_ids: "numpy.ndarray"
+    quantities: "numpy.ndarray"
+    prices: "numpy.ndarray"
+    time_left: "numpy.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, selection: Any) -> "AuctionColumns":
+        return AuctionColumns(*(column[selection] for column in self._columns()))
+
+    def _columns(self) -> tuple["numpy.ndarray", ...]:
+        return tuple(getattr(self, field.name) for field in fields(self))
+
+    @property
+    def nbytes(self) -> int:
+        """The memory used by the arrays, in bytes."""
+        return sum(column.nbytes for column in self._columns())
+
+    @staticmethod
+    def _decode(auctions: list[Any]) -> tuple["numpy.ndarray", ...]:
+        numpy = _import_numpy()
+        return (
+            numpy.array([auction["id"] for auction in auctions], numpy.int64),
+            numpy.array([auction["item"]["id"] for auction in auctions], numpy.int64),
+            numpy.array(
+                [auction.get("quantity", 1) for auction in auctions], numpy.int64
+            ),
+            numpy.array([_price(auction) for auction in auctions], numpy.int64),
+            numpy.array(
+                [
+                    _TIME_LEFT_CODES.get(auction.get("time_left"), -1)
+                    for auction in auctions
+                ],
+                numpy.int8,
+            ),
+        )
+
+    @classmethod
+    def _concatenate(
+        cls, chunks: list[tuple["numpy.ndarray", ...]]
+    ) -> "AuctionColumns":
+        if not chunks:
+            chunks = [cls._decode([])]
+        numpy = _import_numpy()
+        return cls(*(numpy.concatenate(columns) for columns in zip(*chunks)))
+
+    @classmethod
+    def from_auctions(
+        cls,
+        auctions: Union[Mapping[str, Any], Iterable[Any]],
+        chunk_size: int = _CHUNK_SIZE,
+    ) -> "AuctionColumns":
+        """Decode a dump into columns.
+
+        Streamed auctions are decoded ``chunk_size`` at a time, so with
+        ``iter_auctions`` or ``iter_commodities`` the dicts of at most one
+        chunk are held in memory.
+
+        Args:
+            auctions: A response of ``get_auctions`` or ``get_commodities``, or
+                the auctions (or batches of auctions) yielded by
+                ``iter_auctions`` or ``iter_commodities``.
+            chunk_size: The number of auctions decoded at a time. Defaults to
+                65536.
+
+        Returns:
+            AuctionColumns: The auctions, in the order of the dump.
+
+        Raises:
+            ImportError: If the optional ``numpy`` dependency is not installed.
+        """
+        chunks = [
+            cls._decode(chunk)
+            for chunk in batched(_iter_auctions(auctions), chunk_size)
+        ]
+        return cls._concatenate(chunks)
+
+    @classmethod
+    async def from_async_auctions(
+        cls, auctions: AsyncIterable[Any], chunk_size: int = _CHUNK_SIZE
+    ) -> "AuctionColumns":
+        """Decode the auctions streamed by the asyncio client into columns.
+
+        Args:
+            auctions: The auctions (or batches of auctions) yielded by the
+                asyncio ``iter_auctions`` or ``iter_commodities``.
+            chunk_size: The number of auctions decoded at a time. Defaults to
+                65536.
+
+        Returns:
+            AuctionColumns: The auctions, in the order of the stream.
+
+        Raises:
+            ImportError: If the optional ``numpy`` dependency is not installed.
+        """
+        chunks, chunk = [], []
+        async for entry in auctions:
+            if isinstance(entry, list):
+                chunk.extend(entry)
+            else:
+                chunk.append(entry)
+            if len(chunk) >= chunk_size:
+                chunks.append(cls._decode(chunk))
+                chunk = []
+        if chunk:
+            chunks.append(cls._decode(chunk))
+        return cls._concatenate(chunks)
+
+    def _field(self, name: str) -> "numpy.ndarray":
+        if name not in {field.name for field in fields(self)}:
+            raise ValueError(f"Unknown column: {name}")
+        return getattr(self, name)
+
+    def sort(self, *keys: str, descending: bool = False) -> "AuctionColumns":
+        """Sort the auctions.
+
+        Args:
+            *keys: The names of the columns to sort by, most significant
+                first, e.g. ``"item_ids", "prices"``. Defaults to the ids.
+            descending (keyword-only): Whether to sort in descending order.
+                Defaults to False.
+
+        Returns:
+            AuctionColumns: The sorted auctions.
+
+        Raises:
+            ValueError: If a key is not a column.
+        """
+        numpy = _import_numpy()
+        columns = [self._field(key) for key in reversed(keys or ("ids",))]
+        order = numpy.lexsort(columns)
+        return self[order[::-1] if descending else order]
+
+    def aggregate(self, by: str = "item_ids") -> dict[str, "numpy.ndarray"]:
+        """Aggregate the auctions of each value of a column.
+
+        Args:
+            by: The name of the column to group by. Defaults to the item ids.
+
+        Returns:
+            dict[str, numpy.ndarray]: Parallel arrays, sorted by group: the
+            values of the column (under its name), ``auctions`` (the number of
+            auctions), ``quantities`` (the total quantity), ``min_prices`` and
+            ``mean_prices`` (the mean price weighted by quantity).
+
+        Raises:
+            ValueError: If ``by`` is not a column.
+        """
+        numpy = _import_numpy()
+        keys, groups = numpy.unique(self._field(by), return_inverse=True)
+        count = len(keys)
+        quantities = numpy.bincount(groups, self.quantities, count)
+        spent = numpy.bincount(groups, self.prices * self.quantities, count)
+        min_prices = numpy.full(count, numpy.iinfo(numpy.int64).max)
+        numpy.minimum.at(min_prices, groups, self.prices)
+        return {
+            by: keys,
+            "auctions": numpy.bincount(groups, minlength=count),
+            "quantities": quantities.astype(numpy.int64),
+            "min_prices": min_prices,
+            "mean_prices": spent / numpy.maximum(quantities, 1),
+        }
+
+
+class AuctionDiff(NamedTuple):
+    """The differences between two auction house snapshots.
+
+    The ids are ``array`` objects, or NumPy arrays when ``AuctionColumns``
+    were compared.
+
+    Attributes:
+        added (array): The ids of the auctions listed since the first
+            snapshot, sorted.
+        removed (array): The ids of the auctions that were sold, expired or
+            cancelled since the first snapshot, sorted.
+        changed (array): The ids of the auctions present in both snapshots
+            whose price or quantity changed, e.g. commodities bought in part,
+            sorted.
+    """
+
+    added: Any
+    removed: Any
+    changed: Any
+
+
+_Snapshot = Union[AuctionSnapshot, AuctionColumns, Mapping[str, Any], Iterable[Any]]
+
+
+def _diff_columns(old: _Snapshot, new: _Snapshot) -> AuctionDiff:
+    """Compare two snapshots with NumPy set operations."""
+    numpy = _import_numpy()
+
+    def columns(snapshot: _Snapshot) -> tuple["numpy.ndarray", ...]:
+        if isinstance(snapshot, AuctionSnapshot):
+            return tuple(numpy.frombuffer(column, numpy.int64) for column in snapshot)
+        if not isinstance(snapshot, AuctionColumns):
+            snapshot = AuctionColumns.from_auctions(snapshot)
+        return snapshot.ids, snapshot.prices, snapshot.quantities
+
+    old_ids, old_prices, old_quantities = columns(old)
+    new_ids, new_prices, new_quantities = columns(new)
+    common, old_index, new_index = numpy.intersect1d(
+        old_ids, new_ids, assume_unique=True, return_indices=True
+    )
+    changed = (old_prices[old_index] != new_prices[new_index]) | (
+        old_quantities[old_index] != new_quantities[new_index]
+    )
+    return AuctionDiff(
+        numpy.sort(numpy.setdiff1d(new_ids, common, assume_unique=True)),
+        numpy.sort(numpy.setdiff1d(old_ids, common, assume_unique=True)),
+        common[changed],
+    )
+
+
+def diff_auctions(old: _Snapshot, new: _Snapshot) -> AuctionDiff:
+    """Compare two auction house snapshots.
+
+    ``AuctionColumns`` are compared with NumPy set operations, other snapshots
+    in one pass over their sorted ids.
+
+    Args:
+        old: The earlier snapshot: an ``AuctionSnapshot``, ``AuctionColumns``,
+            or a dump accepted by ``AuctionSnapshot.from_auctions``.
+        new: The later snapshot.
+
+    Returns:
+        AuctionDiff: The added, removed and changed auction ids.
+    """
+    if isinstance(old, AuctionColumns) or isinstance(new, AuctionColumns):
+        return _diff_columns(old, new)
+    if not isinstance(old, AuctionSnapshot):
+        old = AuctionSnapshot.from_auctions(old)
+    if not isinstance(new, AuctionSnapshot):
+        new = AuctionSnapshot.from_auctions(new)
+    old_ids, old_prices, old_quantities = old
+    new_ids, new_prices, new_quantities = new
+    added, removed, changed = (array(_TYPECODE) for _ in range(3))
+    i = j = 0
+    old_count, new_count = len(old_ids), len(new_ids)
+    while i < old_count and j < new_count:
+        old_id, new_id = old_ids[i], new_ids[j]
+        if old_id == new_id:
+            if old_prices[i] != new_prices[j] or old_quantities[i] != new_quantities[j]:
+                changed.append(old_id)
+            i += 1
+            j += 1
+        elif old_id < new_id:
+            removed.append(old_id)
+            i += 1
+        else:
+            added.append(new_id)
+            j += 1
+    removed.extend(old_ids[i:])
+    added.extend(new_ids[j:])
+    return AuctionDiff(added, removed, changed)
@@ -0,0 +1,307 @@
+"""crawler.py file.
+
+Mirroring of the World of Warcraft static game data catalog.
+
+Every static catalog (achievements, mounts, pets, toys, titles, journal
+instances and encounters, professions, ...) has an index listing its
+resources as links. ``CatalogCrawler`` requests the indexes, follows their
+links to the detail resources, and yields every document. Requests run
+concurrently on a thread pool, optionally under a rate limiter of their own.
+
+Progress is checkpointed to a JSON file. A crawl that stops, whether it
+crashes or is interrupted, resumes where it stopped. Each link names the
+versioned namespace of its resource (e.g. ``static-11.0.2_56313-us``), so a
+later crawl also skips the resources already fetched from the same namespace
+version, and only fetches what a game patch changed.
+
+Example:
+    ```python
+    api = BlizzardApi("your_id", "your_secret", Region.US, Locale.EN_US)
+    crawler = CatalogCrawler(api.wow.game_data, "catalog.checkpoint.json")
+    for resource in crawler.crawl():
+        store(resource.path, resource.data)
+    ```
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from os import PathLike
+from typing import Any, Iterable, Iterator, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from ..cache import namespace_version
+from ..rate_limit import RateLimiter
+from ..registry import endpoint_template
+from ..types import OptionalLocale, OptionalRegion
+from .wow_game_data_api import WowGameDataApi
+
+CHECKPOINT_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class CrawledResource:
+    """A document fetched by a ``CatalogCrawler``.
+
+    Attributes:
+        path (str): The path of the resource, e.g. ``/data/wow/mount/6``.
+        namespace (str, optional): The versioned namespace the document was
+            served from, if it names one.
+        data (dict[str, Any]): The document.
+    """
+
+    path: str
+    namespace: Optional[str]
+    data: dict[str, Any]
+
+
+def index_endpoints(api_class: type[WowGameDataApi] = WowGameDataApi) -> list[str]:
+    """Get the names of the static catalog indexes of a game data client.
+
+    Args:
+        api_class: The client class. Defaults to ``WowGameDataApi``.
+
+    Returns:
+        list[str]: The names of the endpoints that take no parameters and
+        list a static catalog, e.g. ``get_mounts_index``.
+    """
+    return [
+        endpoint.name
+        for endpoint in api_class.endpoints.values()
+        if endpoint.namespace == "static"
+        and endpoint.path.endswith("/index")
+        and not endpoint.params
+    ]
+
+
+def links(data: Any) -> Iterator[tuple[str, Optional[str]]]:
+    """Find the links to other resources in a document.
+
+    Links are the ``href`` of the ``key`` objects, which is how the API
+    references resources, e.g. ``{"key": {"href": ".../mount/6?namespace=..."}}``.
+
+    Args:
+        data: The document.
+
+    Yields:
+        tuple[str, str | None]: The path of each link and the namespace it
+        names, if any.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            key = value.get("key")
+            if isinstance(key, dict) and isinstance(key.get("href"), str):
+                url = urlsplit(key["href"])
+                namespace = parse_qs(url.query).get("namespace", [None])[0]
+                yield url.path, namespace
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+
+
+class CatalogCrawler:
+    """Fetches the static game data catalog, with checkpoints.
+
+    The crawl starts from index endpoints and follows the links of each
+    document up to ``depth`` levels, keeping only links to the client's static
+    endpoints. The indexes are always requested, since they tell which
+    namespace version each resource has now. A resource is skipped when the
+    checkpoint already holds it at the version its link names.
+
+    A resource counts as fetched once the caller asks for the next one, so a
+    resource whose processing is interrupted is fetched again on resume.
+    Resources whose request fails are reported in ``failed`` and retried by
+    the next crawl.
+
+    Attributes:
+        failed (dict[str, Exception]): The resources whose request failed
+            during the last crawl, by path.
+        skipped (int): The number of resources skipped during the last crawl.
+    """
+
+    def __init__(
+        self,
+        api: WowGameDataApi,
+        checkpoint: Optional[str | PathLike[str]] = None,
+        *,
+        indexes: Optional[Iterable[str]] = None,
+        depth: int = 1,
+        max_workers: int = 8,
+        rate_limiter: Optional[RateLimiter] = None,
+        region: OptionalRegion = None,
+        locale: OptionalLocale = None,
+        is_classic: bool = False,
+        save_every: int = 100,
+    ) -> None:
+        """Initialize the crawler.
+
+        Args:
+            api: The game data client to send requests with. Its context's
+                rate limiter and retry policy, if any, apply.
+            checkpoint: The file to keep progress in. Defaults to None, in
+                which case progress is only kept by this crawler instance.
+            indexes (keyword-only): The names of the index endpoints to start
+                from, e.g. ``["get_mounts_index", "get_toy_index"]``. Defaults
+                to None, for every static catalog index.
+            depth (keyword-only): How many levels of links to follow from the
+                indexes. Defaults to 1, for the resources the indexes list.
+                Deeper levels reach e.g. profession skill tiers.
+            max_workers (keyword-only): The maximum number of requests in
+                flight. Defaults to 8.
+            rate_limiter (keyword-only): A budget of the crawler's own, e.g.
+                ``RateLimiter([(50, 1.0)])`` to leave room for other traffic.
+                Defaults to None.
+            region (Region, optional, keyword-only): the region to crawl.
+                Defaults to None, in which case the client's region is used.
+            locale (Locale, optional, keyword-only): the locale of the
+                documents. Defaults to None, in which case the client's locale
+                is used.
+            is_classic (keyword-only): Whether to crawl the classic catalog.
+                Defaults to False.
+            save_every (keyword-only): How many resources to fetch between
+                checkpoint saves. Defaults to 100.
+
+        Raises:
+            ValueError: If an index is not a static index endpoint of ``api``.
+        """
+        self.api = api
+        self.checkpoint = checkpoint
+        endpoints = type(api).endpoints
+        names = index_endpoints(type(api)) if indexes is None else list(indexes)
+        unknown = [name for name in names if name not in index_endpoints(type(api))]
+        if unknown:
+            raise ValueError(f"Not static catalog indexes: {', '.join(unknown)}")
+        self.indexes = [endpoints[name].path for name in names]
+        self.depth = depth
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.region = region or api.region
+        self.locale = locale
+        kind = "static-classic" if is_classic else "static"
+        self.namespace = f"{kind}-{self.region}"
+        self.save_every = save_every
+        self.failed: dict[str, Exception] = {}
+        self.skipped = 0
+        self._templates = {
+            endpoint.path
+            for endpoint in endpoints.values()
+            if endpoint.namespace == "static"
+        }
+        self._done: dict[str, Optional[str]] = {}
+        self._pending: dict[str, tuple[Optional[str], int]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Read the checkpoint, if there is one."""
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return
+        with open(self.checkpoint, encoding="utf-8") as file:
+            state = json.load(file)
+        if state.get("namespace") != self.namespace:
+            raise ValueError(
+                f"The checkpoint {self.checkpoint} is for {state.get('namespace')}, "
+                f"not {self.namespace}"
+            )
+        self._done = state["done"]
+        self._pending = {
+            path: (version, level)
+            for path, (version, level) in state["pending"].items()
+        }
+
+    def save(self) -> None:
+        """Write the progress to the checkpoint file.
+
+        The file is replaced atomically, so a crash while saving leaves the
+        previous checkpoint intact.
+        """
+        if self.checkpoint is None:
+            return
+        state = {
+            "format": CHECKPOINT_FORMAT,
+            "namespace": self.namespace,
+            "done": self._done,
+            "pending": self._pending,
+        }
+        temporary = f"{os.fspath(self.checkpoint)}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(state, file, separators=(",", ":"))
+        os.replace(temporary, self.checkpoint)
+
+    def _fetch(self, path: str) -> dict[str, Any]:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return self.api.get_resource(
+            path, self.region, {"namespace": self.namespace}, locale=self.locale
+        )
+
+    def _follow(
+        self, data: Any, version: Optional[str]
+    ) -> Iterator[tuple[str, Optional[str]]]:
+        """Get the links of a document to static resources of the client."""
+        for path, link_version in links(data):
+            if endpoint_template(path) in self._templates:
+                yield path, link_version or version
+
+    def crawl(self) -> Iterator[CrawledResource]:
+        """Fetch the catalog.
+
+        Returns:
+            Iterator[CrawledResource]: The fetched documents, in completion
+            order. Requests start when iteration starts.
+        """
+        self.failed = {}
+        self.skipped = 0
+        queue: deque[tuple[str, Optional[str], int]] = deque(
+            (path, None, 0) for path in self.indexes
+        )
+        queue.extend(
+            (path, version, level) for path, (version, level) in self._pending.items()
+        )
+        seen = {path for path, _, _ in queue}
+        in_flight: dict[Future, tuple[str, int]] = {}
+        completed = 0
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="blizzardapi2-crawler"
+        )
+        try:
+            while queue or in_flight:
+                while queue and len(in_flight) < self.max_workers:
+                    path, version, level = queue.popleft()
+                    if version is not None and self._done.get(path) == version:
+                        self._pending.pop(path, None)
+                        self.skipped += 1
+                        continue
+                    in_flight[executor.submit(self._fetch, path)] = (path, level)
+                if not in_flight:
+                    continue
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    path, level = in_flight.pop(future)
+                    try:
+                        data = future.result()
+                    except requests.RequestException as exc:
+                        self.failed[path] = exc
+                        continue
+                    version = namespace_version({}, data)
+                    if level < self.depth:
+                        for link, link_version in self._follow(data, version):
+                            if link not in seen:
+                                seen.add(link)
+                                queue.append((link, link_version, level + 1))
+                                self._pending[link] = (link_version, level + 1)
+                    if self._done.get(path, ()) != version:
+                        yield CrawledResource(path, version, data)
+                    self._done[path] = version
+                    self._pending.pop(path, None)
+                    completed += 1
+                    if completed % self.save_every == 0:
+                        self.save()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.save()
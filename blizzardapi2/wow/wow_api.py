@@ -4,10 +4,7 @@ This module provides access to the World of Warcraft API endpoints,
 including game data and profile information.
 """
 
-from blizzardapi2.endpoint import ApiEndpoint
-
-from .wow_game_data_api import WowGameDataApi
-from .wow_profile_api import WowProfileApi
+from blizzardapi2.endpoint import ApiEndpoint, SubClient
 
 
 class WowApi(ApiEndpoint):
@@ -22,10 +19,5 @@ class WowApi(ApiEndpoint):
         profile: The profile API client.
     """
 
-    def extend_endpoint(self) -> None:
-        self.game_data = WowGameDataApi(
-            self.client_id, self.client_secret, self.region, self.locale
-        )
-        self.profile = WowProfileApi(
-            self.client_id, self.client_secret, self.region, self.locale
-        )
+    game_data = SubClient("blizzardapi2.wow.wow_game_data_api:WowGameDataApi")
+    profile = SubClient("blizzardapi2.wow.wow_profile_api:WowProfileApi")
@@ -1,1098 +1,457 @@
 """wow_profile_api.py file."""
 
-from typing import Any
-
 from ..api import LocaleApi
-from ..types import OptionalLocale, OptionalRegion
-
-
+from ..registry import Endpoint, endpoints
+
+ENDPOINTS = (
+    Endpoint(
+        "get_account_profile_summary",
+        "/profile/user/wow",
+        "profile",
+        "Return a profile summary for an account.",
+        params=(("access_token", str, "The access token for authorization."),),
+        returns="A dictionary containing the account profile summary.",
+    ),
+    Endpoint(
+        "get_protected_character_profile_summary",
+        "/profile/user/wow/protected-character/{realm_id}-{character_id}",
+        "profile",
+        "Return a protected profile summary for a character.",
+        params=(
+            ("access_token", str, "The access token for authorization."),
+            ("realm_id", int, "The ID of the realm."),
+            ("character_id", int, "The ID of the character."),
+        ),
+        returns="A dictionary containing the protected character profile summary.",
+    ),
+    Endpoint(
+        "get_account_collections_index",
+        "/profile/user/wow/collections",
+        "profile",
+        "Return an index of collection types for an account.",
+        params=(("access_token", str, "The access token for authorization."),),
+        returns="A dictionary containing the index of collection types.",
+    ),
+    Endpoint(
+        "get_account_heirlooms_collection_summary",
+        "/profile/user/wow/collections/heirlooms",
+        "profile",
+        "Return a summary of the heirlooms an account has obtained.",
+        params=(("access_token", str, "The access token for authorization."),),
+        returns="A dictionary containing the heirlooms collection summary.",
+    ),
+    Endpoint(
+        "get_account_mounts_collection_summary",
+        "/profile/user/wow/collections/mounts",
+        "profile",
+        "Return a summary of the mounts an account has obtained.",
+        params=(("access_token", str, "The access token for authorization."),),
+        returns="A dictionary containing the mounts collection summary.",
+    ),
+    Endpoint(
+        "get_account_pets_collection_summary",
+        "/profile/user/wow/collections/pets",
+        "profile",
+        "Return a summary of the battle pets an account has obtained.",
+        params=(("access_token", str, "The access token for authorization."),),
+        returns="A dictionary containing the pets collection summary.",
+    ),
+    Endpoint(
+        "get_account_toys_collection_summary",
+        "/profile/user/wow/collections/toys",
+        "profile",
+        "Return a summary of the toys an account has obtained.",
+        params=(("access_token", str, "The access token for authorization."),),
+        returns="A dictionary containing the toys collection summary.",
+    ),
+    Endpoint(
+        "get_account_transmog_collection_summary",
+        "/profile/user/wow/collections/transmogs",
+        "profile",
+        "Return a summary of the transmog appearances an account has obtained.",
+        params=(("access_token", str, "The access token for authorization."),),
+        returns="A dictionary containing the transmog collection summary.",
+    ),
+    Endpoint(
+        "get_character_achievements_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/achievements",
+        "profile",
+        "Return a summary of the achievements a character has completed.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's achievements summary.",
+    ),
+    Endpoint(
+        "get_character_achievement_statistics",
+        "/profile/wow/character/{realm_slug}/{character_name}/achievements/statistics",
+        "profile",
+        "Return a character's statistics as they pertain to achievements.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's achievement statistics.",
+    ),
+    Endpoint(
+        "get_character_appearance_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/appearance",
+        "profile",
+        "Return a summary of a character's appearance settings.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's appearance summary.",
+    ),
+    Endpoint(
+        "get_character_collections_index",
+        "/profile/wow/character/{realm_slug}/{character_name}/collections",
+        "profile",
+        "Return an index of collection types for a character.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the index of collection types for the character.",
+        keyword_only=False,
+    ),
+    Endpoint(
+        "get_character_heirlooms_collection_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/collections/heirlooms",
+        "profile",
+        "Return a summary of the heirlooms a character has obtained.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's heirlooms collection summary.",
+    ),
+    Endpoint(
+        "get_character_mounts_collection_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/collections/mounts",
+        "profile",
+        "Return a summary of the mounts a character has obtained.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's mounts collection summary.",
+    ),
+    Endpoint(
+        "get_character_pets_collection_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/collections/pets",
+        "profile",
+        "Return a summary of the battle pets a character has obtained.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's pets collection summary.",
+    ),
+    Endpoint(
+        "get_character_toys_collection_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/collections/toys",
+        "profile",
+        "Return a summary of the toys a character has obtained.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's toys collection summary.",
+    ),
+    Endpoint(
+        "get_character_transmog_collection_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/collections/transmogs",
+        "profile",
+        "Return a summary of the transmog appearances a character has obtained.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's transmog collection summary.",
+    ),
+    Endpoint(
+        "get_character_encounters_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/encounters",
+        "profile",
+        "Return a summary of a character's encounters.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's encounters summary.",
+    ),
+    Endpoint(
+        "get_character_dungeons",
+        "/profile/wow/character/{realm_slug}/{character_name}/encounters/dungeons",
+        "profile",
+        "Return a summary of a character's completed dungeons.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's dungeons summary.",
+    ),
+    Endpoint(
+        "get_character_raids",
+        "/profile/wow/character/{realm_slug}/{character_name}/encounters/raids",
+        "profile",
+        "Return a summary of a character's completed raids.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's raids summary.",
+    ),
+    Endpoint(
+        "get_character_equipment_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/equipment",
+        "profile",
+        "Return a summary of the items equipped by a character.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's equipment summary.",
+    ),
+    Endpoint(
+        "get_character_hunter_pets_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/hunter-pets",
+        "profile",
+        "If the character is a hunter, return a summary of the character's hunter pets.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the hunter pets summary.",
+    ),
+    Endpoint(
+        "get_character_media_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/character-media",
+        "profile",
+        "Return a summary of the media assets available for a character (such as an avatar render).",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the media assets summary.",
+    ),
+    Endpoint(
+        "get_character_mythic_keystone_profile_index",
+        "/profile/wow/character/{realm_slug}/{character_name}/mythic-keystone-profile",
+        "profile",
+        "Return the Mythic Keystone profile index for a character.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the Mythic Keystone profile index.",
+    ),
+    Endpoint(
+        "get_character_mythic_keystone_profile_season_details",
+        "/profile/wow/character/{realm_slug}/{character_name}/mythic-keystone-profile/season/{season_id}",
+        "profile",
+        "Return the Mythic Keystone season details for a character.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+            ("season_id", int, "The ID of the season."),
+        ),
+        returns="A dictionary containing the Mythic Keystone season details.",
+    ),
+    Endpoint(
+        "get_character_professions_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/professions",
+        "profile",
+        "Return a summary of professions for a character.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's professions summary.",
+    ),
+    Endpoint(
+        "get_character_profile_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}",
+        "profile",
+        "Return a profile summary for a character.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's profile summary.",
+    ),
+    Endpoint(
+        "get_character_profile_status",
+        "/profile/wow/character/{realm_slug}/{character_name}/status",
+        "profile",
+        "Return the status and a unique ID for a character.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's status and unique ID.",
+    ),
+    Endpoint(
+        "get_character_pvp_bracket_statistics",
+        "/profile/wow/character/{realm_slug}/{character_name}/pvp-bracket/{pvp_bracket}",
+        "profile",
+        "Return the PvP bracket statistics for a character.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+            ("pvp_bracket", str, 'The PvP bracket (e.g., "2v2", "3v3").'),
+        ),
+        returns="A dictionary containing the character's PvP bracket statistics.",
+    ),
+    Endpoint(
+        "get_character_pvp_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/pvp-summary",
+        "profile",
+        "Return a PvP summary for a character.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's PvP summary.",
+    ),
+    Endpoint(
+        "get_character_quests",
+        "/profile/wow/character/{realm_slug}/{character_name}/quests",
+        "profile",
+        "Return a character's active quests as well as a link to the character's completed quests.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's active quests and a link to completed quests.",
+    ),
+    Endpoint(
+        "get_character_completed_quests",
+        "/profile/wow/character/{realm_slug}/{character_name}/quests/completed",
+        "profile",
+        "Return a list of quests that a character has completed.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's completed quests.",
+    ),
+    Endpoint(
+        "get_character_reputations_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/reputations",
+        "profile",
+        "Return a summary of a character's reputations.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's reputations summary.",
+    ),
+    Endpoint(
+        "get_character_soulbinds",
+        "/profile/wow/character/{realm_slug}/{character_name}/soulbinds",
+        "profile",
+        "Return a summary of a character's soulbinds.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's soulbinds summary.",
+    ),
+    Endpoint(
+        "get_character_specializations_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/specializations",
+        "profile",
+        "Return a summary of a character's specializations.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's specializations summary.",
+    ),
+    Endpoint(
+        "get_character_statistics_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/statistics",
+        "profile",
+        "Return a statistics summary for a character.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's statistics summary.",
+    ),
+    Endpoint(
+        "get_character_titles_summary",
+        "/profile/wow/character/{realm_slug}/{character_name}/titles",
+        "profile",
+        "Return a summary of titles a character has obtained.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("character_name", str, "The name of the character."),
+        ),
+        returns="A dictionary containing the character's titles summary.",
+    ),
+    Endpoint(
+        "get_guild",
+        "/data/wow/guild/{realm_slug}/{name_slug}",
+        "profile",
+        "Return a single guild by its name and realm.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("name_slug", str, "The slug of the guild name."),
+        ),
+        returns="A dictionary containing the guild details.",
+    ),
+    Endpoint(
+        "get_guild_activity",
+        "/data/wow/guild/{realm_slug}/{name_slug}/activity",
+        "profile",
+        "Return a single guild's activity by name and realm.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("name_slug", str, "The slug of the guild name."),
+        ),
+        returns="A dictionary containing the guild's activity details.",
+    ),
+    Endpoint(
+        "get_guild_achievements",
+        "/data/wow/guild/{realm_slug}/{name_slug}/achievements",
+        "profile",
+        "Return a single guild's achievements by name and realm.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("name_slug", str, "The slug of the guild name."),
+        ),
+        returns="A dictionary containing the guild's achievements.",
+    ),
+    Endpoint(
+        "get_guild_roster",
+        "/data/wow/guild/{realm_slug}/{name_slug}/roster",
+        "profile",
+        "Return a single guild's roster by its name and realm.",
+        params=(
+            ("realm_slug", str, "The slug of the realm."),
+            ("name_slug", str, "The slug of the guild name."),
+        ),
+        returns="A dictionary containing the guild's roster.",
+    ),
+)
+
+
+@endpoints(ENDPOINTS)
 class WowProfileApi(LocaleApi):
     """All Wow Profile API methods.
 
+    The ``get_*`` and ``search_*`` methods are generated from ``ENDPOINTS``
+    (see ``blizzardapi2.registry``); ``endpoints`` maps their names to their
+    table entries.
+
     Attributes:
         client_id (str): A string client ID supplied by Blizzard.
         client_secret (str): A string client secret supplied by Blizzard.
         region (Region, optional): A default region to use for requests.
         locale (Locale, optional): A default locale to use for requests.
     """
-
-    def get_account_profile_summary(
-        self,
-        access_token: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a profile summary for an account.
-
-        Args:
-            access_token (str): The access token for authorization.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the account profile summary.
-        """
-        resource = "/profile/user/wow"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-            "access_token": access_token,
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_protected_character_profile_summary(
-        self,
-        access_token: str,
-        realm_id: int,
-        character_id: int,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a protected profile summary for a character.
-
-        Args:
-            access_token (str): The access token for authorization.
-            realm_id (int): The ID of the realm.
-            character_id (int): The ID of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the protected character profile summary.
-        """
-        resource = f"/profile/user/wow/protected-character/{realm_id}-{character_id}"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-            "access_token": access_token,
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_account_collections_index(
-        self,
-        access_token: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return an index of collection types for an account.
-
-        Args:
-            access_token (str): The access token for authorization.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the index of collection types.
-        """
-        resource = "/profile/user/wow/collections"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-            "access_token": access_token,
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_account_heirlooms_collection_summary(
-        self,
-        access_token: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the heirlooms an account has obtained.
-
-        Args:
-            access_token (str): The access token for authorization.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the heirlooms collection summary.
-        """
-        resource = "/profile/user/wow/collections/heirlooms"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-            "access_token": access_token,
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_account_mounts_collection_summary(
-        self,
-        access_token: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the mounts an account has obtained.
-
-        Args:
-            access_token (str): The access token for authorization.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the mounts collection summary.
-        """
-        resource = "/profile/user/wow/collections/mounts"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-            "access_token": access_token,
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_account_pets_collection_summary(
-        self,
-        access_token: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the battle pets an account has obtained.
-
-        Args:
-            access_token (str): The access token for authorization.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the pets collection summary.
-        """
-        resource = "/profile/user/wow/collections/pets"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-            "access_token": access_token,
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_account_toys_collection_summary(
-        self,
-        access_token: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the toys an account has obtained.
-
-        Args:
-            access_token (str): The access token for authorization.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the toys collection summary.
-        """
-        resource = "/profile/user/wow/collections/toys"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-            "access_token": access_token,
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_account_transmog_collection_summary(
-        self,
-        access_token: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the transmog appearances an account has obtained.
-
-        Args:
-            access_token (str): The access token for authorization.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the transmog collection summary.
-        """
-        resource = "/profile/user/wow/collections/transmogs"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-            "access_token": access_token,
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_achievements_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the achievements a character has completed.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's achievements summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/achievements"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_achievement_statistics(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a character's statistics as they pertain to achievements.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's achievement statistics.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/achievements/statistics"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_appearance_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of a character's appearance settings.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's appearance summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/appearance"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_collections_index(
-        self,
-        realm_slug: str,
-        character_name: str,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return an index of collection types for a character.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the index of collection types for the character.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/collections"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_heirlooms_collection_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the heirlooms a character has obtained.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's heirlooms collection summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/collections/heirlooms"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_mounts_collection_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the mounts a character has obtained.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's mounts collection summary.
-        """
-        resource = (
-            f"/profile/wow/character/{realm_slug}/{character_name}/collections/mounts"
-        )
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_pets_collection_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the battle pets a character has obtained.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's pets collection summary.
-        """
-        resource = (
-            f"/profile/wow/character/{realm_slug}/{character_name}/collections/pets"
-        )
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_toys_collection_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the toys a character has obtained.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's toys collection summary.
-        """
-        resource = (
-            f"/profile/wow/character/{realm_slug}/{character_name}/collections/toys"
-        )
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_transmog_collection_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the transmog appearances a character has obtained.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's transmog collection summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/collections/transmogs"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_encounters_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of a character's encounters.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's encounters summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/encounters"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_dungeons(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of a character's completed dungeons.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's dungeons summary.
-        """
-        resource = (
-            f"/profile/wow/character/{realm_slug}/{character_name}/encounters/dungeons"
-        )
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_raids(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of a character's completed raids.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's raids summary.
-        """
-        resource = (
-            f"/profile/wow/character/{realm_slug}/{character_name}/encounters/raids"
-        )
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_equipment_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the items equipped by a character.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's equipment summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/equipment"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_hunter_pets_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        If the character is a hunter, return a summary of the character's hunter pets.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the hunter pets summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/hunter-pets"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_media_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of the media assets available for a character (such as an avatar render).
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the media assets summary.
-        """
-        resource = (
-            f"/profile/wow/character/{realm_slug}/{character_name}/character-media"
-        )
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_mythic_keystone_profile_index(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return the Mythic Keystone profile index for a character.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the Mythic Keystone profile index.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/mythic-keystone-profile"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_mythic_keystone_profile_season_details(
-        self,
-        realm_slug: str,
-        character_name: str,
-        season_id: int,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return the Mythic Keystone season details for a character.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            season_id (int): The ID of the season.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the Mythic Keystone season details.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/mythic-keystone-profile/season/{season_id}"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_professions_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of professions for a character.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's professions summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/professions"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_profile_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a profile summary for a character.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's profile summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_profile_status(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return the status and a unique ID for a character.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's status and unique ID.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/status"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_pvp_bracket_statistics(
-        self,
-        realm_slug: str,
-        character_name: str,
-        pvp_bracket: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return the PvP bracket statistics for a character.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            pvp_bracket (str): The PvP bracket (e.g., "2v2", "3v3").
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's PvP bracket statistics.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/pvp-bracket/{pvp_bracket}"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_pvp_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a PvP summary for a character.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's PvP summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/pvp-summary"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_quests(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a character's active quests as well as a link to the character's completed quests.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's active quests and a link to completed quests.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/quests"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_completed_quests(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a list of quests that a character has completed.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's completed quests.
-        """
-        resource = (
-            f"/profile/wow/character/{realm_slug}/{character_name}/quests/completed"
-        )
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_reputations_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of a character's reputations.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's reputations summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/reputations"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_soulbinds(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of a character's soulbinds.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's soulbinds summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/soulbinds"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_specializations_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of a character's specializations.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's specializations summary.
-        """
-        resource = (
-            f"/profile/wow/character/{realm_slug}/{character_name}/specializations"
-        )
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_statistics_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a statistics summary for a character.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's statistics summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/statistics"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_character_titles_summary(
-        self,
-        realm_slug: str,
-        character_name: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a summary of titles a character has obtained.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            character_name (str): The name of the character.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the character's titles summary.
-        """
-        resource = f"/profile/wow/character/{realm_slug}/{character_name}/titles"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_guild(
-        self,
-        realm_slug: str,
-        name_slug: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a single guild by its name and realm.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            name_slug (str): The slug of the guild name.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the guild details.
-        """
-        resource = f"/data/wow/guild/{realm_slug}/{name_slug}"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_guild_activity(
-        self,
-        realm_slug: str,
-        name_slug: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a single guild's activity by name and realm.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            name_slug (str): The slug of the guild name.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the guild's activity details.
-        """
-        resource = f"/data/wow/guild/{realm_slug}/{name_slug}/activity"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_guild_achievements(
-        self,
-        realm_slug: str,
-        name_slug: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a single guild's achievements by name and realm.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            name_slug (str): The slug of the guild name.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the guild's achievements.
-        """
-        resource = f"/data/wow/guild/{realm_slug}/{name_slug}/achievements"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
-
-    def get_guild_roster(
-        self,
-        realm_slug: str,
-        name_slug: str,
-        *,
-        region: OptionalRegion = None,
-        locale: OptionalLocale = None,
-    ) -> dict[str, Any]:
-        """
-        Return a single guild's roster by its name and realm.
-
-        Args:
-            realm_slug (str): The slug of the realm.
-            name_slug (str): The slug of the guild name.
-            region (Region, optional): the region to query (e.g., Region.US, Region.EU). Defaults to None, in which case the default region provided at instantiation is used.
-            locale (Locale, optional): the locale to use for the response (e.g., Locale.ES_MX, Locale.DE_DE). Defaults to None, in which case the default locale provided at instantiation is used.
-
-        Returns:
-            Dict[str, Any]: A dictionary containing the guild's roster.
-        """
-        resource = f"/data/wow/guild/{realm_slug}/{name_slug}/roster"
-        query_params = {
-            "namespace": f"profile-{region or self.region}",
-        }
-        return super().get_resource(resource, region, query_params, locale=locale)
@@ -9,10 +9,13 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from blizzardapi2.api import BaseApi
+from blizzardapi2.token_store import ClientToken, token_key
+
 CLIENT_ID = "test_client_id"
 CLIENT_SECRET = "test_client_secret"
 FAKE_TOKEN = "fake_access_token"
@@ -56,9 +59,40 @@ def mock_post(mocker) -> MagicMock:
 def prime_token(
     api_instance: Any, token: str = FAKE_TOKEN, expires_in: int = 86400
 ) -> None:
-    """Pre-populate an API instance with a non-expired client-credentials token.
+    """Pre-populate an API instance with non-expired client-credentials tokens.
 
-    Lets tests skip the token POST when they only care about the GET request.
+    Every OAuth authority (global and CN) is primed, so tests can skip the
+    token POST whichever region they query and only care about the GET.
     """
-    api_instance._access_token = token
-    api_instance._token_expires_at = datetime.now(UTC) + timedelta(seconds=expires_in)
+    expires_at = datetime.now(UTC) + timedelta(seconds=expires_in)
+    for authority in set(BaseApi.OAUTH_URLS.values()):
+        api_instance.context.token_store.set(
+            token_key(api_instance.client_id, authority),
+            ClientToken(token, expires_at),
+        )
+
+
+@pytest.fixture
+def mock_async_get(mocker) -> MagicMock:
+    """Patch `httpx.AsyncClient.get` with a 200 + empty-dict response.
+
+    The async counterpart of `mock_get`: the patched coroutine resolves to a
+    response whose `json()` returns `{}` unless overridden per-test.
+    """
+    mock = mocker.patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    mock.return_value = MagicMock(status_code=200)
+    mock.return_value.json.return_value = {}
+    return mock
+
+
+@pytest.fixture
+def mock_async_post(mocker) -> MagicMock:
+    """Patch `httpx.AsyncClient.post` to return a fake OAuth token response."""
+    mock = mocker.patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    mock.return_value = MagicMock(status_code=200)
+    mock.return_value.json.return_value = {
+        "access_token": FAKE_TOKEN,
+        "token_type": "bearer",
+        "expires_in": 86400,
+    }
+    return mock
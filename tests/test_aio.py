@@ -0,0 +1,211 @@
+"""Tests for the asyncio clients in `blizzardapi2.aio`.
+
+The async clients reuse every endpoint method of the synchronous classes and
+only swap the request seam (`_make_request` and the token helpers) for
+coroutines. These tests patch `httpx.AsyncClient` and verify that the same
+URL, query-param and Authorization-header invariants hold, plus the async
+specifics: a single token fetch under concurrency and context sharing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import requests
+
+from blizzardapi2.aio import AsyncBlizzardApi
+from blizzardapi2.aio.api import AsyncBaseApi
+from blizzardapi2.aio.wow import AsyncWowGameDataApi
+from blizzardapi2.context import ApiContext
+from blizzardapi2.types import Locale, Region
+from blizzardapi2.wow.wow_game_data_api import WowGameDataApi
+from tests.conftest import FAKE_TOKEN, prime_token
+
+
+@pytest.fixture
+def api(fake_credentials) -> AsyncBlizzardApi:
+    client_id, client_secret = fake_credentials
+    return AsyncBlizzardApi(client_id, client_secret, Region.US, Locale.EN_US)
+
+
+def test_async_clients_subclass_sync_clients(api: AsyncBlizzardApi) -> None:
+    """Async endpoint classes keep every method of their sync counterparts."""
+    assert isinstance(api.wow.game_data, WowGameDataApi)
+    assert isinstance(api.wow.game_data, AsyncBaseApi)
+    assert all(
+        isinstance(client, AsyncBaseApi)
+        for client in [
+            api.wow.profile,
+            api.diablo3.community,
+            api.diablo3.game_data,
+            api.hearthstone.game_data,
+            api.starcraft2.community,
+            api.starcraft2.game_data,
+            api.battlenet.oauth,
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_endpoint_method_is_awaitable(
+    api: AsyncBlizzardApi, mock_async_get
+) -> None:
+    """Awaiting an endpoint method issues the same GET as the sync client."""
+    prime_token(api.wow.game_data)
+    mock_async_get.return_value.json.return_value = {"id": 42}
+
+    result = await api.wow.game_data.get_achievement(42)
+
+    assert result == {"id": 42}
+    args, kwargs = mock_async_get.call_args
+    assert args[0] == "https://us.api.blizzard.com/data/wow/achievement/42"
+    assert kwargs["params"] == {"namespace": "static-us", "locale": "en_US"}
+    assert kwargs["headers"] == {"Authorization": f"Bearer {FAKE_TOKEN}"}
+    assert kwargs["timeout"] == AsyncBaseApi.DEFAULT_GET_TIMEOUT
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_start_fetches_one_token(
+    api: AsyncBlizzardApi, mock_async_get, mock_async_post
+) -> None:
+    """Many concurrent requests on a cold context trigger a single token POST."""
+    await asyncio.gather(
+        *(api.wow.game_data.get_item(item_id) for item_id in range(20)),
+        api.hearthstone.game_data.get_metadata(),
+    )
+
+    assert mock_async_get.call_count == 21
+    assert mock_async_post.call_count == 1
+    assert mock_async_post.call_args.kwargs["auth"] == (
+        api.client_id,
+        api.client_secret,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cancelled_token_waiter_releases_store_lock(
+    api: AsyncBlizzardApi, mock_async_get, mock_async_post
+) -> None:
+    """A coroutine cancelled while waiting for the store lock does not leak it."""
+    game_data = api.wow.game_data
+    store_lock = game_data._context.token_store.lock(game_data._token_key("us"))
+    store_lock.acquire()  # held by another thread, e.g. a sync refresh
+    waiter = asyncio.create_task(game_data._ensure_valid_token("us"))
+    await asyncio.sleep(0.05)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    store_lock.release()
+    for _ in range(100):
+        if not store_lock.locked():
+            break
+        await asyncio.sleep(0.01)
+
+    assert not store_lock.locked()
+    assert await game_data.get_item(1) == {}
+    assert mock_async_post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_user_token_goes_to_header(
+    api: AsyncBlizzardApi, mock_async_get, mock_async_post
+) -> None:
+    """User OAuth tokens stay out of the query string in the async client too."""
+    await api.battlenet.oauth.get_user_info("user_token")
+
+    args, kwargs = mock_async_get.call_args
+    assert args[0] == "https://oauth.battle.net/oauth/userinfo"
+    assert kwargs["params"] == {}
+    assert kwargs["headers"] == {"Authorization": "Bearer user_token"}
+    assert mock_async_post.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_401_refreshes_and_retries(
+    api: AsyncBlizzardApi, mock_async_get, mock_async_post
+) -> None:
+    """A 401 on a client-credentials call triggers one refresh and one retry."""
+    prime_token(api.wow.game_data, token="stale")
+    stale = type(mock_async_get.return_value)(status_code=401)
+    fresh = type(mock_async_get.return_value)(status_code=200)
+    fresh.json.return_value = {"ok": True}
+    mock_async_get.side_effect = [stale, fresh]
+
+    result = await api.wow.game_data.get_achievements_index()
+
+    assert result == {"ok": True}
+    assert mock_async_post.call_count == 1
+    retry_headers = mock_async_get.call_args_list[1].kwargs["headers"]
+    assert retry_headers == {"Authorization": f"Bearer {FAKE_TOKEN}"}
+
+
+@pytest.mark.asyncio
+async def test_error_status_raises_requests_http_error(
+    api: AsyncBlizzardApi, mock_async_get
+) -> None:
+    """Async clients surface the same exception type as the sync clients."""
+    prime_token(api.wow.game_data)
+    mock_async_get.return_value.status_code = 404
+
+    with pytest.raises(requests.HTTPError):
+        await api.wow.game_data.get_item(1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (httpx.ConnectError("refused"), requests.ConnectionError),
+        (httpx.ReadTimeout("slow"), requests.Timeout),
+    ],
+)
+async def test_transport_errors_raise_requests_exceptions(
+    api: AsyncBlizzardApi, mock_async_get, mock_async_post, error, expected
+) -> None:
+    """Async network failures surface as the sync clients' exceptions."""
+    mock_async_post.side_effect = error
+    with pytest.raises(expected):
+        await api.wow.game_data.get_item(1)
+
+    mock_async_post.side_effect = None
+    mock_async_get.side_effect = error
+    with pytest.raises(expected):
+        await api.wow.game_data.get_item(1)
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager_closes_shared_client(fake_credentials) -> None:
+    """Leaving the `async with` block closes the pooled async client."""
+    client_id, client_secret = fake_credentials
+    async with AsyncBlizzardApi(client_id, client_secret) as api:
+        session = api.context.async_session
+        assert api.wow.game_data._async_session is session
+
+    assert session.is_closed
+
+
+def test_standalone_async_client(fake_credentials) -> None:
+    """Async endpoint classes can be used without the facade."""
+    client_id, client_secret = fake_credentials
+    client = AsyncWowGameDataApi(client_id, client_secret, Region.EU, Locale.EN_GB)
+    assert client.region == Region.EU
+
+
+@pytest.mark.asyncio
+async def test_raw_view_and_decoder(fake_credentials, mock_async_get) -> None:
+    context = ApiContext(decoder=lambda content: {"decoded": content.decode()})
+    async with AsyncBlizzardApi(
+        *fake_credentials, "us", "en_US", context=context
+    ) as api:
+        prime_token(api.wow.game_data)
+        mock_async_get.return_value.content = b"body"
+        mock_async_get.return_value.headers = {"ETag": '"1"'}
+
+        assert await api.wow.game_data.get_token_index() == {"decoded": "body"}
+        raw = await api.wow.game_data.raw.get_token_index()
+
+    assert raw.content == b"body"
+    assert raw.headers == {"ETag": '"1"'}
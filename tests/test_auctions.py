@@ -0,0 +1,148 @@
+"""Tests for the auction snapshot diff in blizzardapi2.wow.auctions."""
+
+from __future__ import annotations
+
+import json
+from array import array
+
+import pytest
+
+from blizzardapi2.blizzard_api import BlizzardApi
+from blizzardapi2.testing import FakeBlizzardServer
+from blizzardapi2.testing.server import auction_house
+from blizzardapi2.wow.auctions import AuctionColumns, AuctionSnapshot, diff_auctions
+
+
+def auction(auction_id: int, quantity: int = 1, **prices: int) -> dict:
+    return {"id": auction_id, "item": {"id": 2589}, "quantity": quantity, **prices}
+
+
+@pytest.fixture
+def numpy():
+    return pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def columns(numpy):
+    return AuctionColumns.from_auctions(
+        [
+            {"id": 7, "item": {"id": 2}, "quantity": 5, "unit_price": 30},
+            {"id": 3, "item": {"id": 1}, "buyout": 900, "time_left": "SHORT"},
+            {"id": 9, "item": {"id": 2}, "quantity": 15, "unit_price": 10},
+            {"id": 4, "item": {"id": 2}, "bid": 50, "time_left": "VERY_LONG"},
+        ]
+    )
+
+
+OLD = [
+    auction(5, 20, unit_price=100),
+    auction(1, 1, buyout=5000),
+    auction(3, 1, bid=10),
+    auction(4),
+]
+NEW = [
+    auction(1, 1, buyout=5000),
+    auction(3, 1, bid=12),  # outbid
+    auction(5, 12, unit_price=100),  # bought in part
+    auction(9, 1, unit_price=7),
+]
+
+
+def test_snapshot_is_sorted_by_id() -> None:
+    snapshot = AuctionSnapshot.from_auctions({"auctions": OLD})
+
+    assert snapshot.ids == array("q", [1, 3, 4, 5])
+    assert snapshot.prices == array("q", [5000, 10, 0, 100])
+    assert snapshot.quantities == array("q", [1, 1, 1, 20])
+
+
+def test_snapshot_from_streamed_batches() -> None:
+    batches = [OLD[:3], OLD[3:]]
+
+    assert AuctionSnapshot.from_auctions(batches) == AuctionSnapshot.from_auctions(
+        iter(OLD)
+    )
+
+
+def test_diff() -> None:
+    diff = diff_auctions(
+        AuctionSnapshot.from_auctions(OLD), AuctionSnapshot.from_auctions(NEW)
+    )
+
+    assert diff.added == array("q", [9])
+    assert diff.removed == array("q", [4])
+    assert diff.changed == array("q", [3, 5])
+
+
+def test_diff_of_dumps() -> None:
+    dump = json.loads(auction_house(500, seed=3))
+
+    assert not any(diff_auctions(dump, dump))
+    diff = diff_auctions({"auctions": []}, dump)
+    assert list(diff.added) == sorted(entry["id"] for entry in dump["auctions"])
+    assert list(diff_auctions(dump, {}).removed) == list(diff.added)
+
+
+def test_columns(numpy, columns) -> None:
+    assert len(columns) == 4
+    assert columns.ids.tolist() == [7, 3, 9, 4]
+    assert columns.item_ids.tolist() == [2, 1, 2, 2]
+    assert columns.quantities.tolist() == [5, 1, 15, 1]
+    assert columns.prices.tolist() == [30, 900, 10, 50]
+    assert columns.time_left.tolist() == [-1, 0, -1, 3]
+    assert columns.time_left.dtype == numpy.int8
+    assert columns.nbytes == 4 * (8 * 4 + 1)
+
+
+def test_columns_filter_sort_and_aggregate(columns) -> None:
+    cheap = columns[columns.prices < 100]
+    by_price = columns.sort("item_ids", "prices", descending=True)
+    per_item = columns.aggregate()
+
+    assert cheap.ids.tolist() == [7, 9, 4]
+    assert by_price.ids.tolist() == [4, 7, 9, 3]
+    assert per_item["item_ids"].tolist() == [1, 2]
+    assert per_item["auctions"].tolist() == [1, 3]
+    assert per_item["quantities"].tolist() == [1, 21]
+    assert per_item["min_prices"].tolist() == [900, 10]
+    assert per_item["mean_prices"].tolist() == pytest.approx([900, 350 / 21])
+    assert columns.aggregate("time_left")["time_left"].tolist() == [-1, 0, 3]
+    with pytest.raises(ValueError, match="buyout"):
+        columns.sort("buyout")
+
+
+def test_columns_are_streamed(numpy) -> None:
+    with FakeBlizzardServer(commodities=1000) as server, server.redirect():
+        game_data = BlizzardApi("id", "secret", "us", "en_US").wow.game_data
+        streamed = AuctionColumns.from_auctions(
+            game_data.iter_commodities(batch_size=300), chunk_size=256
+        )
+        decoded = AuctionColumns.from_auctions(game_data.get_commodities())
+
+    assert len(streamed) == 1000
+    for name in ("ids", "item_ids", "quantities", "prices", "time_left"):
+        assert numpy.array_equal(getattr(streamed, name), getattr(decoded, name))
+
+
+@pytest.mark.asyncio
+async def test_columns_from_async_stream(numpy) -> None:
+    async def stream():
+        yield OLD[:3]
+        yield OLD[3]
+
+    columns = await AuctionColumns.from_async_auctions(stream(), chunk_size=2)
+
+    assert columns.ids.tolist() == [5, 1, 3, 4]
+
+
+def test_diff_of_columns(numpy) -> None:
+    old, new = AuctionColumns.from_auctions(OLD), AuctionColumns.from_auctions(NEW)
+    expected = diff_auctions(OLD, NEW)
+
+    for diff in (
+        diff_auctions(old, new),
+        diff_auctions(AuctionSnapshot.from_auctions(OLD), new),
+        diff_auctions(old, NEW),
+    ):
+        assert [ids.tolist() for ids in diff] == [ids.tolist() for ids in expected]
+    assert len(diff_auctions(old, AuctionColumns.from_auctions([])).removed) == 4
@@ -12,8 +12,12 @@ from __future__ import annotations
 from datetime import UTC, datetime, timedelta
 
 import pytest
+from requests import HTTPError
 
 from blizzardapi2.api import BaseApi, LocaleApi
+from blizzardapi2.blizzard_api import BlizzardApi
+from blizzardapi2.context import ApiContext
+from blizzardapi2.token_store import ClientToken
 from blizzardapi2.types import Locale, Region
 from tests.conftest import CLIENT_ID, CLIENT_SECRET, FAKE_TOKEN, prime_token
 
@@ -63,22 +67,21 @@ def test_build_oauth_url_cn_uses_china_gateway(api: BaseApi) -> None:
 
 def test_is_token_expired_true_when_no_token(api: BaseApi) -> None:
     """A never-fetched token is treated as expired."""
-    assert api._token_expires_at is None
-    assert api._is_token_expired() is True
+    assert api._cached_token("us") is None
+    assert api._is_token_expired("us") is True
 
 
 def test_is_token_expired_false_when_fresh(api: BaseApi) -> None:
     """A token comfortably outside the refresh buffer is not expired."""
     prime_token(api, expires_in=86400)
-    assert api._is_token_expired() is False
+    assert api._is_token_expired("us") is False
 
 
 def test_is_token_expired_true_within_refresh_buffer(api: BaseApi) -> None:
     """A token expiring within TOKEN_REFRESH_BUFFER is treated as expired."""
-    api._access_token = FAKE_TOKEN
     # Expires in 4 minutes — inside the 5-minute refresh window.
-    api._token_expires_at = datetime.now(UTC) + timedelta(minutes=4)
-    assert api._is_token_expired() is True
+    prime_token(api, expires_in=4 * 60)
+    assert api._is_token_expired("us") is True
 
 
 # ---------------------------------------------------------------------------
@@ -88,10 +91,9 @@ def test_is_token_expired_true_within_refresh_buffer(api: BaseApi) -> None:
 
 def test_ensure_valid_token_fetches_when_missing(api: BaseApi, mock_post) -> None:
     """First call lazily POSTs to /oauth/token."""
-    api._ensure_valid_token("us")
+    assert api._ensure_valid_token("us") == FAKE_TOKEN
     assert mock_post.call_count == 1
-    assert api._access_token == FAKE_TOKEN
-    assert api._token_expires_at is not None
+    assert api._cached_token("us").access_token == FAKE_TOKEN
 
 
 def test_ensure_valid_token_noop_when_fresh(api: BaseApi, mock_post) -> None:
@@ -121,17 +123,17 @@ def test_get_client_token_uses_basic_auth_and_grant_type(
 
 
 def test_get_client_token_stores_token_and_expiry(api: BaseApi, mock_post) -> None:
-    """Response is parsed into _access_token and _token_expires_at."""
+    """Response is parsed into a cached ClientToken with its expiry."""
     before = datetime.now(UTC)
     api._get_client_token("us")
     after = datetime.now(UTC)
 
-    assert api._access_token == FAKE_TOKEN
-    assert api._token_expires_at is not None
+    token = api._cached_token("us")
+    assert token.access_token == FAKE_TOKEN
     # expires_in is 86400 in the fixture; expiry should sit roughly there.
     expected_min = before + timedelta(seconds=86400)
     expected_max = after + timedelta(seconds=86400)
-    assert expected_min <= api._token_expires_at <= expected_max
+    assert expected_min <= token.expires_at <= expected_max
 
 
 def test_get_client_token_uses_cn_oauth_url(api: BaseApi, mock_post) -> None:
@@ -143,6 +145,65 @@ def test_get_client_token_uses_cn_oauth_url(api: BaseApi, mock_post) -> None:
     )
 
 
+# ---------------------------------------------------------------------------
+# Per-authority token cache
+# ---------------------------------------------------------------------------
+
+
+def test_non_cn_regions_share_one_token(api: BaseApi, mock_post) -> None:
+    """Every region served by oauth.battle.net reuses the same token."""
+    for region in ["us", "eu", "kr", "tw"]:
+        api._ensure_valid_token(region)
+    assert mock_post.call_count == 1
+
+
+def test_cn_and_global_tokens_are_cached_independently(
+    api: BaseApi, mock_get, mock_post
+) -> None:
+    """Alternating CN and US requests never evicts either token."""
+    mock_post.return_value.json.side_effect = [
+        {"access_token": "global_token", "expires_in": 86400},
+        {"access_token": "cn_token", "expires_in": 86400},
+    ]
+
+    for _ in range(3):
+        api._make_request("https://us.api.blizzard.com/x", "us")
+        assert mock_get.call_args.kwargs["headers"] == {
+            "Authorization": "Bearer global_token"
+        }
+        api._make_request("https://gateway.battlenet.com.cn/x", "cn")
+        assert mock_get.call_args.kwargs["headers"] == {
+            "Authorization": "Bearer cn_token"
+        }
+
+    assert mock_post.call_count == 2
+    assert mock_get.call_count == 6
+
+
+def test_token_expiry_is_tracked_per_authority(api: BaseApi, mock_post) -> None:
+    """An expiring CN token does not force a refresh of the global token."""
+    prime_token(api)
+    api.context.token_store.set(
+        api._token_key("cn"),
+        ClientToken("old_cn_token", datetime.now(UTC) + timedelta(minutes=1)),
+    )
+
+    assert api._is_token_expired("us") is False
+    assert api._is_token_expired("cn") is True
+    api._ensure_valid_token("us")
+    assert mock_post.call_count == 0
+
+
+def test_401_does_not_refetch_a_token_already_replaced(
+    api: BaseApi, mock_get, mock_post
+) -> None:
+    """A 401 for a token another caller already replaced reuses the new one."""
+    prime_token(api, token="newer_token")
+
+    assert api._refresh_rejected_token("us", "older_token") == "newer_token"
+    assert mock_post.call_count == 0
+
+
 # ---------------------------------------------------------------------------
 # _make_request — happy path
 # ---------------------------------------------------------------------------
@@ -545,3 +606,127 @@ def test_get_resource_with_locale_in_query_params(
         mock_get.call_args.args[0] == "https://eu.api.blizzard.com/data/wow/realm/index"
     )
     assert mock_get.call_args.kwargs["params"] == {"locale": "my_stuff"}
+
+
+# ---------------------------------------------------------------------------
+# Shared context
+# ---------------------------------------------------------------------------
+
+
+def test_blizzard_api_shares_one_context_across_subclients(fake_credentials) -> None:
+    """Every sub-client of one BlizzardApi reuses the same session and token."""
+    client_id, client_secret = fake_credentials
+    api = BlizzardApi(client_id, client_secret)
+    clients = [
+        api.wow.game_data,
+        api.wow.profile,
+        api.diablo3.community,
+        api.diablo3.game_data,
+        api.hearthstone.game_data,
+        api.starcraft2.community,
+        api.starcraft2.game_data,
+        api.battlenet.oauth,
+    ]
+
+    assert all(client.context is api.context for client in clients)
+    assert len({id(client._session) for client in clients}) == 1
+
+
+def test_shared_context_fetches_one_token_for_all_subclients(
+    fake_credentials, mock_get, mock_post
+) -> None:
+    """A cold start costs a single OAuth POST no matter how many games are hit."""
+    client_id, client_secret = fake_credentials
+    api = BlizzardApi(client_id, client_secret, Region.US, Locale.EN_US)
+
+    api.wow.game_data.get_achievements_index()
+    api.hearthstone.game_data.get_metadata()
+    api.diablo3.game_data.get_season_index()
+
+    assert mock_get.call_count == 3
+    assert mock_post.call_count == 1
+
+
+def test_standalone_clients_get_their_own_context(fake_credentials) -> None:
+    """Clients created without a context do not share state with each other."""
+    client_id, client_secret = fake_credentials
+    first = BaseApi(client_id, client_secret)
+    second = BaseApi(client_id, client_secret)
+    assert first.context is not second.context
+
+
+def test_explicit_context_is_reused(fake_credentials) -> None:
+    """A caller-supplied context is shared by every client it is passed to."""
+    client_id, client_secret = fake_credentials
+    context = ApiContext()
+    first = BaseApi(client_id, client_secret, context=context)
+    second = LocaleApi(client_id, client_secret, context=context)
+
+    prime_token(first)
+
+    assert second.context is context
+    assert second._cached_token("us").access_token == FAKE_TOKEN
+
+
+# ---------------------------------------------------------------------------
+# Decoder hook and raw responses
+# ---------------------------------------------------------------------------
+
+
+def test_default_decoder_is_response_json(api: BaseApi, mock_get) -> None:
+    prime_token(api)
+    mock_get.return_value.json.return_value = {"decoded": "json"}
+    assert api._make_request("https://us.api.blizzard.com/x", "us") == {
+        "decoded": "json"
+    }
+
+
+def test_context_decoder_decodes_body_bytes(fake_credentials, mock_get) -> None:
+    seen = []
+
+    def decoder(content: bytes) -> dict:
+        seen.append(content)
+        return {"fast": True}
+
+    api = BaseApi(*fake_credentials, context=ApiContext(decoder=decoder))
+    prime_token(api)
+    mock_get.return_value.content = b'{"fast": true}'
+    mock_get.return_value.json.side_effect = AssertionError("json() called")
+
+    assert api._make_request("https://us.api.blizzard.com/x", "us") == {"fast": True}
+    assert seen == [b'{"fast": true}']
+
+
+def test_raw_view_returns_body_and_headers(fake_credentials, mock_get) -> None:
+    api = BlizzardApi(*fake_credentials, Region.US, Locale.EN_US)
+    prime_token(api.wow.game_data)
+    mock_get.return_value.content = b'{"auctions": []}'
+    mock_get.return_value.headers = {"Last-Modified": "yesterday"}
+    mock_get.return_value.url = "https://us.api.blizzard.com/data/wow/auctions"
+    mock_get.return_value.json.side_effect = AssertionError("json() called")
+
+    response = api.wow.game_data.raw.get_commodities()
+
+    assert response.content == b'{"auctions": []}'
+    assert response.headers["Last-Modified"] == "yesterday"
+    assert response.status_code == 200
+    assert mock_get.call_args.kwargs["params"] == {
+        "namespace": "dynamic-us",
+        "locale": "en_US",
+    }
+
+
+def test_raw_view_raises_for_errors(api: BaseApi, mock_get) -> None:
+    prime_token(api)
+    mock_get.return_value.raise_for_status.side_effect = HTTPError("404")
+    with pytest.raises(HTTPError):
+        api.raw.get_resource("/data/wow/missing", region="us")
+
+
+def test_raw_view_keeps_user_token_out_of_url(api: BaseApi, mock_get) -> None:
+    api.raw.get_oauth_resource(
+        "/oauth/userinfo", region="us", query_params={"access_token": "u"}
+    )
+    kwargs = mock_get.call_args.kwargs
+    assert "access_token" not in kwargs["params"]
+    assert kwargs["headers"]["Authorization"] == "Bearer u"
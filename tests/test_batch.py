@@ -0,0 +1,173 @@
+"""Tests for deferred requests and batch execution (`blizzardapi2.batch`).
+
+Deferred views must describe exactly the request the live method would send,
+and the executors must run many of them with bounded concurrency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from blizzardapi2 import aio
+from blizzardapi2.aio import AsyncBlizzardApi
+from blizzardapi2.batch import ApiRequest, get_many, iter_completed
+from blizzardapi2.blizzard_api import BlizzardApi
+from tests.conftest import prime_token
+
+
+@pytest.fixture
+def api(fake_credentials) -> BlizzardApi:
+    api = BlizzardApi(*fake_credentials, "us", "en_US")
+    prime_token(api.wow.game_data)
+    return api
+
+
+def item_response(url: str, **kwargs) -> MagicMock:
+    response = MagicMock(status_code=200, headers={})
+    response.json.return_value = {"id": int(url.rsplit("/", 1)[1])}
+    return response
+
+
+def test_deferred_describes_request_without_sending(api, mock_get) -> None:
+    request = api.wow.game_data.deferred.get_item(19019, locale="de_DE")
+    mock_get.assert_not_called()
+    assert isinstance(request, ApiRequest)
+    assert request.url == "https://us.api.blizzard.com/data/wow/item/19019"
+    assert request.region == "us"
+    assert request.query_params == {"namespace": "static-us", "locale": "de_DE"}
+
+
+def test_deferred_request_matches_live_call(api, mock_get) -> None:
+    request = api.wow.profile.deferred.get_character_equipment_summary(
+        "stormrage", "thrall"
+    )
+    request.execute()
+    api.wow.profile.get_character_equipment_summary("stormrage", "thrall")
+    first, second = mock_get.call_args_list
+    assert first == second
+
+
+def test_deferred_view_does_not_change_client(api, mock_get) -> None:
+    api.wow.game_data.deferred
+    assert api.wow.game_data.get_item(19019) == {}
+    mock_get.assert_called_once()
+
+
+def test_get_many_returns_results_in_order(api, mock_get) -> None:
+    mock_get.side_effect = item_response
+    item_ids = list(range(1, 51))
+    results = get_many(
+        [api.wow.game_data.deferred.get_item(item_id) for item_id in item_ids],
+        max_workers=4,
+    )
+    assert results == [{"id": item_id} for item_id in item_ids]
+
+
+def test_get_many_bounds_concurrency(api, mock_get) -> None:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow(url: str, **kwargs) -> MagicMock:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return item_response(url)
+
+    mock_get.side_effect = slow
+    get_many([api.wow.game_data.deferred.get_item(i) for i in range(20)], max_workers=3)
+    assert 1 < peak <= 3
+
+
+def test_get_many_collects_errors(api, mock_get) -> None:
+    def flaky(url: str, **kwargs) -> MagicMock:
+        response = item_response(url)
+        if url.endswith("/2"):
+            response.raise_for_status.side_effect = requests.HTTPError("404")
+        return response
+
+    mock_get.side_effect = flaky
+    batch = [api.wow.game_data.deferred.get_item(i) for i in (1, 2, 3)]
+    results = get_many(batch, return_exceptions=True)
+    assert results[0] == {"id": 1}
+    assert isinstance(results[1], requests.HTTPError)
+    assert results[2] == {"id": 3}
+
+    with pytest.raises(requests.HTTPError):
+        get_many(batch)
+
+
+def test_iter_completed_yields_every_index(api, mock_get) -> None:
+    mock_get.side_effect = item_response
+    batch = [api.wow.game_data.deferred.get_item(i) for i in range(10)]
+    results = dict(iter_completed(batch, max_workers=4))
+    assert results == {i: {"id": i} for i in range(10)}
+
+
+def test_deferred_requests_mix_clients(api, mock_get) -> None:
+    batch = [
+        api.wow.game_data.deferred.get_token_index(),
+        api.hearthstone.game_data.deferred.get_card_back(155),
+    ]
+    assert len(get_many(batch)) == 2
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_get_many(fake_credentials, mock_async_get) -> None:
+    mock_async_get.side_effect = item_response
+    async with AsyncBlizzardApi(*fake_credentials, "us", "en_US") as api:
+        prime_token(api.wow.game_data)
+        batch = [api.wow.game_data.deferred.get_item(i) for i in range(1, 21)]
+        results = await aio.get_many(batch, max_concurrency=5)
+    assert results == [{"id": i} for i in range(1, 21)]
+
+
+@pytest.mark.asyncio
+async def test_async_bounds_concurrency(fake_credentials, mock_async_get) -> None:
+    active = 0
+    peak = 0
+
+    async def slow(url: str, **kwargs) -> MagicMock:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return item_response(url)
+
+    mock_async_get.side_effect = slow
+    async with AsyncBlizzardApi(*fake_credentials, "us", "en_US") as api:
+        prime_token(api.wow.game_data)
+        batch = [api.wow.game_data.deferred.get_item(i) for i in range(20)]
+        results = [
+            result async for result in aio.iter_completed(batch, max_concurrency=4)
+        ]
+    assert peak == 4
+    assert sorted(index for index, _ in results) == list(range(20))
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_collects_errors(fake_credentials, mock_async_get) -> None:
+    def flaky(url: str, **kwargs) -> MagicMock:
+        response = item_response(url)
+        response.status_code = 404 if url.endswith("/2") else 200
+        return response
+
+    mock_async_get.side_effect = flaky
+    async with AsyncBlizzardApi(*fake_credentials, "us", "en_US") as api:
+        prime_token(api.wow.game_data)
+        batch = [api.wow.game_data.deferred.get_item(i) for i in (1, 2)]
+        results = await aio.get_many(batch, return_exceptions=True)
+    assert results[0] == {"id": 1}
+    assert isinstance(results[1], requests.HTTPError)
@@ -151,8 +151,7 @@ def test_get_user_info_uses_user_token_verbatim_and_skips_client_credentials(
     assert FAKE_TOKEN not in headers["Authorization"]
 
     # The instance never cached a client token.
-    assert oauth_api._access_token is None
-    assert oauth_api._token_expires_at is None
+    assert len(oauth_api.context.token_store) == 0
 
 
 def test_get_user_info_returns_session_get_json_payload(
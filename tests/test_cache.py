@@ -0,0 +1,437 @@
+"""Tests for response reuse (`blizzardapi2.cache`).
+
+With a `ValidatorCache` on the context, `_make_request` remembers the
+`Last-Modified`/`ETag` validators of each response and revalidates repeated
+requests with a conditional GET, serving `304 Not Modified` answers from the
+remembered body. With a `ResponseCache`, fresh responses are served from
+memory (or a SQLite file, with `SqliteResponseCache`) without any request.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+from requests import HTTPError
+
+from blizzardapi2.aio.api import AsyncBaseApi
+from blizzardapi2.api import BaseApi
+from blizzardapi2.cache import (
+    ResponseCache,
+    ResponseStore,
+    SqliteResponseCache,
+    ValidatorCache,
+    namespace_version,
+    request_key,
+)
+from blizzardapi2.context import ApiContext
+from blizzardapi2.wow.wow_game_data_api import WowGameDataApi
+from tests.conftest import prime_token
+
+URL = "https://us.api.blizzard.com/data/wow/token/index"
+LAST_MODIFIED = "Wed, 14 Oct 2026 10:00:00 GMT"
+
+
+@pytest.fixture
+def api(fake_credentials) -> BaseApi:
+    context = ApiContext(validator_cache=ValidatorCache())
+    api = BaseApi(*fake_credentials, context=context)
+    prime_token(api)
+    return api
+
+
+def test_request_key_ignores_param_order() -> None:
+    assert request_key(URL, {"a": 1, "b": "x"}) == request_key(URL, {"b": "x", "a": 1})
+
+
+def test_not_modified_is_served_from_cache(api, mock_get) -> None:
+    mock_get.return_value.headers = {"Last-Modified": LAST_MODIFIED}
+    mock_get.return_value.json.return_value = {"price": 1}
+    first = api._make_request(URL, "us", {"namespace": "dynamic-us"})
+
+    mock_get.return_value.status_code = 304
+    mock_get.return_value.json.side_effect = AssertionError("body decoded")
+    second = api._make_request(URL, "us", {"namespace": "dynamic-us"})
+
+    assert second == first == {"price": 1}
+    headers = mock_get.call_args.kwargs["headers"]
+    assert headers["If-Modified-Since"] == LAST_MODIFIED
+    assert headers["Authorization"].startswith("Bearer ")
+
+
+def test_etag_is_sent_as_if_none_match(api, mock_get) -> None:
+    mock_get.return_value.headers = {"ETag": '"abc"'}
+    api._make_request(URL, "us")
+    api._make_request(URL, "us")
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+
+def test_modified_response_replaces_entry(api, mock_get) -> None:
+    mock_get.return_value.headers = {"Last-Modified": LAST_MODIFIED}
+    mock_get.return_value.json.return_value = {"price": 1}
+    api._make_request(URL, "us")
+    mock_get.return_value.json.return_value = {"price": 2}
+    assert api._make_request(URL, "us") == {"price": 2}
+    assert api.context.validator_cache.get(request_key(URL, {})).value == {"price": 2}
+
+
+def test_response_without_validators_is_not_remembered(api, mock_get) -> None:
+    mock_get.return_value.headers = {}
+    api._make_request(URL, "us")
+    api._make_request(URL, "us")
+    assert len(api.context.validator_cache) == 0
+    assert "If-Modified-Since" not in mock_get.call_args.kwargs["headers"]
+
+
+def test_user_token_requests_bypass_cache(api, mock_get) -> None:
+    mock_get.return_value.headers = {"Last-Modified": LAST_MODIFIED}
+    api._make_request(URL, "us", {"access_token": "user"})
+    api._make_request(URL, "us", {"access_token": "user"})
+    assert len(api.context.validator_cache) == 0
+    assert mock_get.call_args.kwargs["headers"] == {"Authorization": "Bearer user"}
+
+
+def test_no_cache_sends_unconditional_requests(fake_credentials, mock_get) -> None:
+    api = BaseApi(*fake_credentials)
+    prime_token(api)
+    mock_get.return_value.headers = {"Last-Modified": LAST_MODIFIED}
+    api._make_request(URL, "us")
+    api._make_request(URL, "us")
+    assert "If-Modified-Since" not in mock_get.call_args.kwargs["headers"]
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = ValidatorCache(max_entries=2)
+    headers = {"Last-Modified": LAST_MODIFIED}
+    cache.remember(request_key("a", {}), headers, 1)
+    cache.remember(request_key("b", {}), headers, 2)
+    cache.get(request_key("a", {}))
+    cache.remember(request_key("c", {}), headers, 3)
+    assert cache.get(request_key("b", {})) is None
+    assert cache.get(request_key("a", {})).value == 1
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_validators_are_evicted_by_bytes() -> None:
+    cache = ValidatorCache(max_bytes=100)
+    headers = {"ETag": '"v1"'}
+    cache.remember(request_key("a", {}), headers, "a", size=60)
+    cache.remember(request_key("b", {}), headers, "b", size=30)
+    cache.get(request_key("a", {}))
+    cache.remember(request_key("c", {}), headers, "c", size=30)
+    assert cache.get(request_key("b", {})) is None
+    assert cache.get(request_key("a", {})).value == "a"
+    assert cache.size == 90
+    cache.remember(request_key("a", {}), headers, "huge", size=101)
+    assert cache.get(request_key("a", {})) is None
+    assert cache.size == 30
+
+
+@pytest.mark.asyncio
+async def test_async_not_modified_is_served_from_cache(
+    fake_credentials, mock_async_get
+) -> None:
+    context = ApiContext(validator_cache=ValidatorCache())
+    api = AsyncBaseApi(*fake_credentials, context=context)
+    prime_token(api)
+    mock_async_get.return_value.headers = {"Last-Modified": LAST_MODIFIED}
+    mock_async_get.return_value.json.return_value = {"price": 1}
+    await api._make_request(URL, "us")
+
+    mock_async_get.return_value.status_code = 304
+    assert await api._make_request(URL, "us") == {"price": 1}
+    headers = mock_async_get.call_args.kwargs["headers"]
+    assert headers["If-Modified-Since"] == LAST_MODIFIED
+    await context.aclose()
+
+
+# ResponseCache
+
+
+@pytest.fixture
+def cached_api(fake_credentials) -> BaseApi:
+    context = ApiContext(response_cache=ResponseCache())
+    api = BaseApi(*fake_credentials, context=context)
+    prime_token(api)
+    return api
+
+
+def test_fresh_response_is_served_without_request(cached_api, mock_get) -> None:
+    mock_get.return_value.json.return_value = {"id": 7}
+    params = {"namespace": "static-us", "locale": "en_US"}
+    assert cached_api._make_request(URL, "us", params) == {"id": 7}
+    assert cached_api._make_request(URL, "us", dict(params)) == {"id": 7}
+    assert mock_get.call_count == 1
+
+
+def test_different_params_are_cached_separately(cached_api, mock_get) -> None:
+    cached_api._make_request(URL, "us", {"namespace": "static-us"})
+    cached_api._make_request(URL, "us", {"namespace": "static-eu"})
+    assert mock_get.call_count == 2
+
+
+def test_user_token_requests_are_not_cached(cached_api, mock_get) -> None:
+    cached_api._make_request(URL, "us", {"access_token": "user"})
+    cached_api._make_request(URL, "us", {"access_token": "user"})
+    assert mock_get.call_count == 2
+    assert len(cached_api.context.response_cache) == 0
+
+
+def test_errors_are_not_cached(cached_api, mock_get) -> None:
+    mock_get.return_value.raise_for_status.side_effect = HTTPError("boom")
+    with pytest.raises(HTTPError):
+        cached_api._make_request(URL, "us")
+    assert len(cached_api.context.response_cache) == 0
+
+
+def test_incomplete_store_cannot_be_created() -> None:
+    class NoClearStore(ResponseStore):
+        def get(self, key):
+            return None
+
+        def put(self, key, value, namespace, size=0, version=None):
+            pass
+
+    with pytest.raises(TypeError, match="clear"):
+        NoClearStore()
+
+
+@pytest.mark.parametrize(
+    ("namespace", "ttl"),
+    [
+        ("static-us", 6 * 60 * 60),
+        ("static-classic-eu", 6 * 60 * 60),
+        ("dynamic-us", 5 * 60),
+        ("profile-kr", 60),
+        (None, 5 * 60),
+    ],
+)
+def test_ttl_depends_on_namespace_kind(namespace, ttl) -> None:
+    assert ResponseCache().ttl(namespace) == ttl
+
+
+def test_ttls_override_defaults() -> None:
+    cache = ResponseCache({"dynamic": 30}, default_ttl=10)
+    assert cache.ttl("dynamic-us") == 30
+    assert cache.ttl("static-us") == 6 * 60 * 60
+    assert cache.ttl(None) == 10
+
+
+def test_entries_expire(mocker) -> None:
+    clock = mocker.patch("blizzardapi2.cache.time.monotonic", return_value=1000.0)
+    cache = ResponseCache({"dynamic": 60})
+    key = request_key(URL, {"namespace": "dynamic-us"})
+    cache.put(key, {"a": 1}, "dynamic-us", size=10)
+    clock.return_value = 1059.0
+    assert cache.get(key) == {"a": 1}
+    clock.return_value = 1060.0
+    assert cache.get(key) is None
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_zero_ttl_disables_caching() -> None:
+    cache = ResponseCache({"profile": 0})
+    cache.put(request_key(URL, {}), {}, "profile-us")
+    assert len(cache) == 0
+
+
+def test_eviction_by_entry_count() -> None:
+    cache = ResponseCache(max_entries=2)
+    for name in "abc":
+        cache.put(request_key(name, {}), name, "static-us")
+    assert cache.get(request_key("a", {})) is None
+    assert len(cache) == 2
+
+
+def test_eviction_by_bytes() -> None:
+    cache = ResponseCache(max_bytes=100)
+    cache.put(request_key("a", {}), "a", "static-us", size=60)
+    cache.put(request_key("b", {}), "b", "static-us", size=30)
+    cache.get(request_key("a", {}))
+    cache.put(request_key("c", {}), "c", "static-us", size=30)
+    assert cache.get(request_key("b", {})) is None
+    assert cache.get(request_key("a", {})) == "a"
+    assert cache.size == 90
+    cache.put(request_key("huge", {}), "huge", "static-us", size=101)
+    assert cache.get(request_key("huge", {})) is None
+    assert cache.size == 90
+
+
+def test_replacing_entry_updates_size() -> None:
+    cache = ResponseCache()
+    cache.put(request_key("a", {}), 1, None, size=10)
+    cache.put(request_key("a", {}), 2, None, size=4)
+    assert cache.size == 4
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_response_size_is_body_length(cached_api, mock_get) -> None:
+    mock_get.return_value.content = b"x" * 42
+    cached_api._make_request(URL, "us", {"namespace": "static-us"})
+    assert cached_api.context.response_cache.size == 42
+
+
+def test_expired_response_is_revalidated(fake_credentials, mock_get, mocker) -> None:
+    clock = mocker.patch("blizzardapi2.cache.time.monotonic", return_value=0.0)
+    context = ApiContext(
+        response_cache=ResponseCache({"dynamic": 60}),
+        validator_cache=ValidatorCache(),
+    )
+    api = BaseApi(*fake_credentials, context=context)
+    prime_token(api)
+    mock_get.return_value.headers = {"Last-Modified": LAST_MODIFIED}
+    mock_get.return_value.json.return_value = {"a": 1}
+    api._make_request(URL, "us", {"namespace": "dynamic-us"})
+
+    clock.return_value = 120.0
+    mock_get.return_value.status_code = 304
+    assert api._make_request(URL, "us", {"namespace": "dynamic-us"}) == {"a": 1}
+    assert mock_get.call_count == 2
+    # The revalidated body is fresh again.
+    assert api._make_request(URL, "us", {"namespace": "dynamic-us"}) == {"a": 1}
+    assert mock_get.call_count == 2
+
+
+def test_game_data_methods_use_cache(fake_credentials, mock_get) -> None:
+    context = ApiContext(response_cache=ResponseCache())
+    api = WowGameDataApi(*fake_credentials, "us", "en_US", context=context)
+    prime_token(api)
+    api.get_playable_class(7)
+    api.get_playable_class(7)
+    api.get_playable_class(8)
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_fresh_response_is_served_without_request(
+    fake_credentials, mock_async_get
+) -> None:
+    context = ApiContext(response_cache=ResponseCache())
+    api = AsyncBaseApi(*fake_credentials, context=context)
+    prime_token(api)
+    mock_async_get.return_value.content = b"{}"
+    await api._make_request(URL, "us", {"namespace": "static-us"})
+    await api._make_request(URL, "us", {"namespace": "static-us"})
+    assert mock_async_get.call_count == 1
+    await context.aclose()
+
+
+# SqliteResponseCache
+
+ITEM_URL = "https://us.api.blizzard.com/data/wow/item/19019"
+STATIC = {"namespace": "static-us", "locale": "en_US"}
+
+
+def item_body(version: str = "static-11.0.2_56313-us") -> dict:
+    return {
+        "_links": {"self": {"href": f"{ITEM_URL}?namespace={version}"}},
+        "id": 19019,
+    }
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path) -> Iterator[SqliteResponseCache]:
+    cache = SqliteResponseCache(tmp_path / "cache.sqlite3")
+    yield cache
+    cache.close()
+
+
+def test_sqlite_round_trip(sqlite_cache) -> None:
+    key = request_key(ITEM_URL, STATIC)
+    sqlite_cache.put(key, item_body(), "static-us")
+    assert sqlite_cache.get(key) == item_body()
+    assert (
+        sqlite_cache.get(request_key(ITEM_URL, {**STATIC, "locale": "de_DE"})) is None
+    )
+    assert len(sqlite_cache) == 1
+
+
+def test_sqlite_survives_restarts(tmp_path) -> None:
+    key = request_key(ITEM_URL, STATIC)
+    first = SqliteResponseCache(tmp_path / "cache.sqlite3")
+    first.put(key, item_body(), "static-us")
+    first.close()
+    second = SqliteResponseCache(tmp_path / "cache.sqlite3")
+    assert second.get(key) == item_body()
+    second.close()
+
+
+def test_sqlite_keeps_only_static_by_default(sqlite_cache) -> None:
+    sqlite_cache.put(request_key("a", {}), {}, "dynamic-us")
+    sqlite_cache.put(request_key("b", {}), {}, "profile-us")
+    sqlite_cache.put(request_key("c", {}), {}, None)
+    assert len(sqlite_cache) == 0
+
+
+def test_sqlite_entries_expire(sqlite_cache, mocker) -> None:
+    clock = mocker.patch("blizzardapi2.cache.time.time", return_value=1000.0)
+    key = request_key(ITEM_URL, STATIC)
+    sqlite_cache.put(key, item_body(), "static-us")
+    clock.return_value = 1000.0 + 24 * 60 * 60
+    assert sqlite_cache.get(key) is None
+    assert sqlite_cache.purge_expired() == 1
+    assert len(sqlite_cache) == 0
+
+
+def test_sqlite_older_namespace_version_drops_nothing(sqlite_cache) -> None:
+    old = "static-11.0.2_56313-us"
+    new = "static-11.0.5_57171-us"
+    item = request_key(ITEM_URL, STATIC)
+    spell = request_key("https://us.api.blizzard.com/data/wow/spell/1", STATIC)
+    sqlite_cache.put(spell, {"id": 1}, "static-us", version=new)
+    sqlite_cache.put(item, item_body(old), "static-us", version=old)
+
+    assert sqlite_cache.version("static-us") == new
+    assert sqlite_cache.get(spell) == {"id": 1}
+    assert sqlite_cache.get(item) is None
+
+
+def test_sqlite_new_namespace_version_invalidates_older(sqlite_cache) -> None:
+    old = "static-11.0.2_56313-us"
+    new = "static-11.0.5_57171-us"
+    item = request_key(ITEM_URL, STATIC)
+    spell = request_key("https://us.api.blizzard.com/data/wow/spell/1", STATIC)
+    other_region = request_key(ITEM_URL, {**STATIC, "namespace": "static-eu"})
+    sqlite_cache.put(item, item_body(old), "static-us", version=old)
+    sqlite_cache.put(other_region, {}, "static-eu", version="static-11.0.2_56313-eu")
+    sqlite_cache.put(spell, {"id": 1}, "static-us", version=new)
+
+    assert sqlite_cache.version("static-us") == new
+    assert sqlite_cache.get(item) is None
+    assert sqlite_cache.get(spell) == {"id": 1}
+    assert sqlite_cache.get(other_region) == {}
+
+
+@pytest.mark.parametrize(
+    ("headers", "body", "expected"),
+    [
+        ({"Battlenet-Namespace": "static-1_2-us"}, {}, "static-1_2-us"),
+        ({}, item_body("static-3_4-us"), "static-3_4-us"),
+        ({}, {"id": 1}, None),
+        ({}, [], None),
+    ],
+)
+def test_namespace_version(headers, body, expected) -> None:
+    assert namespace_version(headers, body) == expected
+
+
+def test_game_data_served_from_sqlite(fake_credentials, mock_get, tmp_path) -> None:
+    path = tmp_path / "cache.sqlite3"
+    mock_get.return_value.headers = {}
+    mock_get.return_value.json.return_value = item_body()
+    for _ in range(2):
+        cache = SqliteResponseCache(path)
+        api = WowGameDataApi(
+            *fake_credentials,
+            "us",
+            "en_US",
+            context=ApiContext(response_cache=cache),
+        )
+        prime_token(api)
+        assert api.get_item(19019) == item_body()
+        cache.close()
+    assert mock_get.call_count == 1
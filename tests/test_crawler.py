@@ -0,0 +1,158 @@
+"""Tests for the static catalog crawler, run against a ``FakeBlizzardServer``."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from blizzardapi2.blizzard_api import BlizzardApi
+from blizzardapi2.testing import FakeBlizzardServer
+from blizzardapi2.wow.crawler import CatalogCrawler, index_endpoints, links
+
+INDEXES = ["get_mounts_index", "get_toy_index"]
+
+
+@pytest.fixture
+def server():
+    with FakeBlizzardServer(index_size=5) as fake, fake.redirect():
+        yield fake
+
+
+@pytest.fixture
+def game_data(server, fake_credentials):
+    return BlizzardApi(*fake_credentials, "us", "en_US").wow.game_data
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    return tmp_path / "catalog.json"
+
+
+def paths(resources) -> set[str]:
+    return {resource.path for resource in resources}
+
+
+def test_index_endpoints() -> None:
+    names = index_endpoints()
+
+    assert "get_mounts_index" in names
+    assert "get_journal_encounters_index" in names
+    assert "get_connected_realms_index" not in names  # dynamic
+    assert "get_profession_skill_tier" not in names
+
+
+def test_links() -> None:
+    document = {
+        "mounts": [
+            {"key": {"href": "https://x/data/wow/mount/6?namespace=static-1-us"}},
+            {"key": {"href": "https://x/data/wow/mount/7"}},
+        ],
+        "key": "not a link",
+    }
+
+    assert sorted(links(document)) == [
+        ("/data/wow/mount/6", "static-1-us"),
+        ("/data/wow/mount/7", None),
+    ]
+
+
+def test_crawl(game_data, checkpoint) -> None:
+    crawler = CatalogCrawler(game_data, checkpoint, indexes=INDEXES)
+
+    resources = list(crawler.crawl())
+
+    assert len(resources) == 12
+    assert "/data/wow/mount/3" in paths(resources)
+    assert resources[0].namespace == "static-11.0.2_56313-us"
+    state = json.loads(checkpoint.read_text())
+    assert len(state["done"]) == 12
+    assert state["pending"] == {}
+
+
+def test_resume_after_interruption(game_data, checkpoint) -> None:
+    crawler = CatalogCrawler(game_data, checkpoint, indexes=INDEXES, max_workers=1)
+    crawl = crawler.crawl()
+    first = [next(crawl) for _ in range(4)]
+    crawl.close()
+
+    resumed = list(CatalogCrawler(game_data, checkpoint, indexes=INDEXES).crawl())
+
+    # The fourth resource was not acknowledged, so it is fetched again.
+    assert paths(first) & paths(resumed) == {first[3].path}
+    assert paths(first) | paths(resumed) == paths(
+        CatalogCrawler(game_data, indexes=INDEXES).crawl()
+    )
+
+
+def test_unchanged_resources_are_skipped(server, game_data, checkpoint) -> None:
+    list(CatalogCrawler(game_data, checkpoint, indexes=INDEXES).crawl())
+
+    crawler = CatalogCrawler(game_data, checkpoint, indexes=INDEXES)
+    assert list(crawler.crawl()) == []
+    assert crawler.skipped == 10
+
+    server.namespace_version = "11.0.5_57171"
+    crawler = CatalogCrawler(game_data, checkpoint, indexes=INDEXES)
+    assert len(list(crawler.crawl())) == 12
+    assert crawler.skipped == 0
+
+
+def test_failed_resources_are_retried(game_data, checkpoint, monkeypatch) -> None:
+    get_resource = game_data.get_resource
+
+    def flaky(path, *args, **kwargs):
+        if path == "/data/wow/toy/2":
+            raise requests.HTTPError("503 Server Error")
+        return get_resource(path, *args, **kwargs)
+
+    monkeypatch.setattr(game_data, "get_resource", flaky)
+    crawler = CatalogCrawler(game_data, checkpoint, indexes=INDEXES)
+    assert len(list(crawler.crawl())) == 11
+    assert list(crawler.failed) == ["/data/wow/toy/2"]
+
+    monkeypatch.setattr(game_data, "get_resource", get_resource)
+    crawler = CatalogCrawler(game_data, checkpoint, indexes=INDEXES)
+    assert paths(crawler.crawl()) == {"/data/wow/toy/2"}
+    assert crawler.failed == {}
+
+
+def test_depth(server, game_data, tmp_path) -> None:
+    mount = tmp_path / "data" / "wow" / "mount"
+    mount.mkdir(parents=True)
+    document = {
+        "creature_displays": [{"key": {"href": "/data/wow/media/creature-display/9"}}],
+        "source": {"key": {"href": "/data/wow/mount/1/unknown"}},
+    }
+    (mount / "1.json").write_text(json.dumps(document))
+    server.fixtures = tmp_path
+    server.index_size = 1
+
+    shallow = CatalogCrawler(game_data, indexes=["get_mounts_index"])
+    deep = CatalogCrawler(game_data, indexes=["get_mounts_index"], depth=2)
+
+    assert paths(shallow.crawl()) == {"/data/wow/mount/index", "/data/wow/mount/1"}
+    assert paths(deep.crawl()) == {
+        "/data/wow/mount/index",
+        "/data/wow/mount/1",
+        "/data/wow/media/creature-display/9",
+    }
+
+
+def test_rate_limiter(game_data) -> None:
+    limiter = MagicMock()
+
+    list(CatalogCrawler(game_data, indexes=INDEXES, rate_limiter=limiter).crawl())
+
+    assert limiter.acquire.call_count == 12
+
+
+def test_invalid_arguments(game_data, checkpoint) -> None:
+    with pytest.raises(ValueError, match="get_item"):
+        CatalogCrawler(game_data, indexes=["get_item"])
+
+    CatalogCrawler(game_data, checkpoint, indexes=INDEXES).save()
+    with pytest.raises(ValueError, match="static-us"):
+        CatalogCrawler(game_data, checkpoint, region="eu")
@@ -0,0 +1,100 @@
+"""Tests for the lazily created sub-clients of the API facades.
+
+``SubClient`` defers importing and building each game client until the
+attribute is first read, so these tests check both when sub-clients come into
+existence and that the lazily built ones are wired exactly like the eager ones
+used to be.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+
+import requests
+
+import blizzardapi2
+from blizzardapi2.aio import AsyncBlizzardApi
+from blizzardapi2.aio.wow import AsyncWowGameDataApi
+from blizzardapi2.blizzard_api import BlizzardApi
+from blizzardapi2.endpoint import SubClient
+from blizzardapi2.wow.wow_game_data_api import WowGameDataApi
+
+GAMES = ("wow", "diablo3", "hearthstone", "starcraft2", "battlenet")
+
+
+def test_construction_creates_no_sub_clients(fake_credentials) -> None:
+    api = BlizzardApi(*fake_credentials)
+
+    assert not set(GAMES) & set(vars(api))
+
+
+def test_sub_client_is_created_once_with_owner_defaults(fake_credentials) -> None:
+    api = BlizzardApi(*fake_credentials, "eu", "en_GB")
+
+    game_data = api.wow.game_data
+
+    assert api.wow.game_data is game_data
+    assert isinstance(game_data, WowGameDataApi)
+    assert (game_data.region, game_data.locale) == ("eu", "en_GB")
+    assert game_data.context is api.context
+    assert game_data.client_id == api.client_id
+
+
+def test_unlocalized_sub_client_gets_no_locale(fake_credentials) -> None:
+    api = BlizzardApi(*fake_credentials, "kr", "ko_KR")
+
+    assert api.battlenet.oauth.region == "kr"
+    assert api.diablo3.game_data.region == "kr"
+    assert api.starcraft2.community.locale == "ko_KR"
+
+
+def test_concurrent_first_access_builds_one_sub_client(fake_credentials) -> None:
+    api = BlizzardApi(*fake_credentials)
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def access() -> None:
+        barrier.wait()
+        seen.append(api.hearthstone)
+
+    threads = [threading.Thread(target=access) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in seen}) == 1
+
+
+def test_class_access_returns_descriptor() -> None:
+    assert isinstance(BlizzardApi.wow, SubClient)
+    assert BlizzardApi.wow.target.__name__ == "WowApi"
+
+
+def test_async_facade_builds_async_sub_clients(fake_credentials) -> None:
+    api = AsyncBlizzardApi(*fake_credentials, "us")
+
+    assert isinstance(api.wow.game_data, AsyncWowGameDataApi)
+    assert api.wow.game_data.context is api.context
+
+
+def test_game_modules_are_imported_on_first_access() -> None:
+    script = (
+        "import sys\n"
+        "from blizzardapi2 import BlizzardApi\n"
+        "api = BlizzardApi('id', 'secret')\n"
+        "assert 'blizzardapi2.wow.wow_game_data_api' not in sys.modules\n"
+        "assert 'blizzardapi2.aio' not in sys.modules\n"
+        "api.hearthstone.game_data\n"
+        "assert 'blizzardapi2.hearthstone.hearthstone_game_data_api' in sys.modules\n"
+        "assert 'blizzardapi2.wow.wow_api' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_lazy_package_exports() -> None:
+    assert blizzardapi2.HTTPError is requests.HTTPError
+    assert blizzardapi2.AsyncBlizzardApi is AsyncBlizzardApi
+    assert "ConnectionError" in dir(blizzardapi2)
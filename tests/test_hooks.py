@@ -0,0 +1,189 @@
+"""Tests for request lifecycle hooks and the metrics collector.
+
+HTTP is patched at the session boundary; the tests check which hook events a
+request produces and how ``MetricsCollector`` aggregates them.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from blizzardapi2.aio.api import AsyncBaseApi
+from blizzardapi2.api import BaseApi
+from blizzardapi2.blizzard_api import BlizzardApi
+from blizzardapi2.context import ApiContext
+from blizzardapi2.hooks import MetricsCollector, RequestHooks, RequestInfo
+from blizzardapi2.retry import RetryPolicy
+from tests.conftest import prime_token
+
+URL = "https://us.api.blizzard.com/data/wow/item/19019"
+TEMPLATE = "/data/wow/item/{item_id}"
+
+
+def response(status_code: int = 200, content: bytes = b'{"id": 1}') -> MagicMock:
+    mock = MagicMock(status_code=status_code, content=content, headers={})
+    mock.json.return_value = {"status": status_code}
+    return mock
+
+
+class Recorder(RequestHooks):
+    def __init__(self) -> None:
+        self.events: list[tuple] = []
+
+    def before_request(self, request):
+        self.events.append(("before", request.attempt))
+
+    def after_response(self, request, response):
+        self.events.append(("after", response.status_code, response.size))
+
+    def on_error(self, request, error, elapsed):
+        self.events.append(("error", type(error).__name__))
+
+    def on_unauthorized_retry(self, request):
+        self.events.append(("401", request.endpoint))
+
+    def on_token_refresh(self, region, elapsed):
+        self.events.append(("token", region))
+
+
+@pytest.fixture
+def metrics() -> MetricsCollector:
+    return MetricsCollector()
+
+
+@pytest.fixture
+def recorder() -> Recorder:
+    return Recorder()
+
+
+@pytest.fixture
+def api(fake_credentials, metrics, recorder) -> BaseApi:
+    api = BaseApi(*fake_credentials, context=ApiContext(hooks=[metrics, recorder]))
+    prime_token(api)
+    return api
+
+
+def test_request_info_resolves_endpoint_template() -> None:
+    import blizzardapi2.wow.wow_game_data_api  # noqa: F401 - registers the table
+
+    assert RequestInfo(URL, "us", {}).endpoint == TEMPLATE
+
+
+def test_successful_request_is_recorded(api, mock_get, metrics, recorder) -> None:
+    mock_get.return_value = response()
+
+    api._make_request(URL, "us")
+
+    assert recorder.events == [("before", 1), ("after", 200, 9)]
+    stats = metrics.snapshot()[(TEMPLATE, "us")]
+    assert stats.requests == 1
+    assert stats.statuses == {"2xx": 1}
+    assert stats.response_bytes == 9
+    assert sum(stats.latency_counts) == 1
+    assert len(stats.latency_counts) == len(metrics.buckets) + 1
+
+
+def test_401_retry_and_token_refresh_are_recorded(
+    api, mock_get, mock_post, metrics, recorder
+) -> None:
+    mock_get.side_effect = [response(401), response(200)]
+
+    api._make_request(URL, "us")
+
+    assert recorder.events == [
+        ("before", 1),
+        ("after", 401, 9),
+        ("401", TEMPLATE),
+        ("token", "us"),
+        ("before", 1),
+        ("after", 200, 9),
+    ]
+    snapshot = metrics.snapshot()
+    assert snapshot[(TEMPLATE, "us")].unauthorized_retries == 1
+    assert snapshot[(TEMPLATE, "us")].statuses == {"4xx": 1, "2xx": 1}
+    assert snapshot[("/oauth/token", "us")].token_refreshes == 1
+
+
+def test_connection_error_is_recorded(api, mock_get, metrics, recorder) -> None:
+    mock_get.side_effect = requests.ConnectionError("down")
+
+    with pytest.raises(requests.ConnectionError):
+        api._make_request(URL, "us")
+
+    assert recorder.events == [("before", 1), ("error", "ConnectionError")]
+    assert metrics.snapshot()[(TEMPLATE, "us")].errors == 1
+
+
+def test_retry_policy_attempts_are_recorded(
+    fake_credentials, mock_get, mocker, metrics
+) -> None:
+    mocker.patch("blizzardapi2.retry.time.sleep")
+    context = ApiContext(retry_policy=RetryPolicy(), hooks=[metrics])
+    api = BaseApi(*fake_credentials, context=context)
+    prime_token(api)
+    mock_get.side_effect = [response(503), response(200)]
+
+    api._make_request(URL, "eu")
+
+    stats = metrics.snapshot()[(TEMPLATE, "eu")]
+    assert (stats.requests, stats.retries) == (2, 1)
+    assert stats.statuses == {"5xx": 1, "2xx": 1}
+
+
+def test_snapshot_is_a_copy_and_reset_clears(api, mock_get, metrics) -> None:
+    mock_get.return_value = response()
+    api._make_request(URL, "us")
+
+    snapshot = metrics.snapshot()
+    snapshot[(TEMPLATE, "us")].requests = 100
+    assert metrics.snapshot()[(TEMPLATE, "us")].requests == 1
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_free_form_path_segments_share_a_key(fake_credentials, mock_get) -> None:
+    metrics = MetricsCollector()
+    context = ApiContext(hooks=[metrics])
+    client = BlizzardApi(*fake_credentials, "us", "en_US", context=context)
+    prime_token(client.hearthstone.game_data)
+    mock_get.return_value = response()
+
+    for slug in ("52119-arch-villain-rafaam", "678-ragnaros"):
+        client.hearthstone.game_data.get_card(slug)
+        client.diablo3.community.get_api_hero(f"{slug}-1234", 7)
+
+    assert set(metrics.snapshot()) == {
+        ("/hearthstone/cards/{id_or_slug}", "us"),
+        ("/d3/profile/{account_id}/hero/{hero_id}", "us"),
+    }
+
+
+def test_latency_buckets() -> None:
+    collector = MetricsCollector(buckets=[1.0, 0.1])
+    request = RequestInfo(URL, "us", {})
+    for elapsed in (0.05, 0.5, 5.0):
+        collector.on_error(request, OSError(), elapsed)
+
+    assert collector.buckets == (0.1, 1.0)
+    stats = collector.snapshot()[(request.endpoint, "us")]
+    assert stats.latency_counts == [1, 1, 1]
+    assert stats.latency_sum == pytest.approx(5.55)
+
+
+@pytest.mark.asyncio
+async def test_async_requests_are_recorded(
+    fake_credentials, mock_async_get, metrics
+) -> None:
+    api = AsyncBaseApi(*fake_credentials, context=ApiContext(hooks=[metrics]))
+    prime_token(api)
+    mock_async_get.return_value = response()
+
+    await api._make_request(URL, "kr")
+
+    stats = metrics.snapshot()[(TEMPLATE, "kr")]
+    assert stats.requests == 1
+    assert stats.statuses == {"2xx": 1}
@@ -0,0 +1,121 @@
+"""Tests for the HTTP/2 transport (`blizzardapi2.http2`).
+
+`Http2Session` wraps an `httpx.Client`; these tests give it a client backed
+by `httpx.MockTransport` and drive it through `BaseApi`, so the whole request
+path (token POST, authenticated GET, streaming, errors) runs against the
+requests-compatible surface it exposes.
+"""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+import requests
+
+from blizzardapi2.api import BaseApi
+from blizzardapi2.context import ApiContext
+from blizzardapi2.http2 import Http2Session
+from blizzardapi2.retry import RetryPolicy
+from blizzardapi2.wow.wow_game_data_api import WowGameDataApi
+from tests.conftest import FAKE_TOKEN
+
+TOKEN_BODY = {"access_token": FAKE_TOKEN, "token_type": "bearer", "expires_in": 86400}
+
+
+def make_session(handler) -> Http2Session:
+    return Http2Session(httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def blizzard(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/oauth/token":
+        return httpx.Response(200, json=TOKEN_BODY)
+    if request.url.path.endswith("/missing"):
+        return httpx.Response(404)
+    if request.url.path.endswith("/commodities"):
+        body = {"auctions": [{"id": i} for i in range(3)]}
+        return httpx.Response(200, content=json.dumps(body).encode())
+    return httpx.Response(
+        200,
+        json={
+            "path": request.url.path,
+            "params": dict(request.url.params),
+            "authorization": request.headers["Authorization"],
+        },
+    )
+
+
+@pytest.fixture
+def api(fake_credentials) -> WowGameDataApi:
+    context = ApiContext(session=make_session(blizzard))
+    return WowGameDataApi(*fake_credentials, "us", "en_US", context=context)
+
+
+def test_requests_go_through_httpx(api) -> None:
+    data = api.get_item(19019)
+    assert data == {
+        "path": "/data/wow/item/19019",
+        "params": {"namespace": "static-us", "locale": "en_US"},
+        "authorization": f"Bearer {FAKE_TOKEN}",
+    }
+
+
+def test_token_post_uses_basic_auth(fake_credentials) -> None:
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return blizzard(request)
+
+    api = BaseApi(*fake_credentials, context=ApiContext(session=make_session(handler)))
+    api._ensure_valid_token("us")
+    assert seen[0].url.params["grant_type"] == "client_credentials"
+    assert seen[0].headers["Authorization"].startswith("Basic ")
+
+
+def test_error_status_raises_requests_http_error(api) -> None:
+    with pytest.raises(requests.HTTPError) as excinfo:
+        api.get_resource("/data/wow/missing", region="us")
+    assert excinfo.value.response.status_code == 404
+
+
+def test_streaming_reads_incrementally(api) -> None:
+    assert list(api.iter_commodities()) == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (httpx.ConnectError("refused"), requests.ConnectionError),
+        (httpx.ReadTimeout("slow"), requests.Timeout),
+        (httpx.RemoteProtocolError("reset"), requests.ConnectionError),
+    ],
+)
+def test_transport_errors_become_requests_exceptions(error, expected) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise error
+
+    with pytest.raises(expected):
+        make_session(handler).get("https://us.api.blizzard.com/x")
+
+
+def test_transport_errors_are_retried(fake_credentials, mocker) -> None:
+    mocker.patch("blizzardapi2.retry.time.sleep")
+    failures = [httpx.ConnectError("refused")]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path != "/oauth/token" and failures:
+            raise failures.pop()
+        return blizzard(request)
+
+    context = ApiContext(session=make_session(handler), retry_policy=RetryPolicy())
+    api = WowGameDataApi(*fake_credentials, "us", "en_US", context=context)
+    assert api.get_token_index()["path"] == "/data/wow/token/index"
+
+
+def test_context_http2_flag_creates_http2_session() -> None:
+    context = ApiContext(http2=True)
+    assert isinstance(context.session, Http2Session)
+    context.close()
+    assert isinstance(ApiContext().session, requests.Session)
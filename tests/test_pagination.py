@@ -0,0 +1,141 @@
+"""Tests for the auto-paginating search iterators (`blizzardapi2.pagination`).
+
+A fake search endpoint serves `pageCount` pages of `pageSize` results. The
+iterators must yield every result exactly once and in page order, while
+fetching later pages concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from blizzardapi2.aio import AsyncBlizzardApi
+from blizzardapi2.wow.wow_game_data_api import WowGameDataApi
+from tests.conftest import prime_token
+
+PAGE_SIZE = 3
+
+
+def search_page(page: int, page_count: int) -> dict:
+    return {
+        "page": page,
+        "pageSize": PAGE_SIZE,
+        "pageCount": page_count,
+        "results": [
+            {"data": {"id": (page - 1) * PAGE_SIZE + i}} for i in range(PAGE_SIZE)
+        ],
+    }
+
+
+def ids(results) -> list[int]:
+    return [result["data"]["id"] for result in results]
+
+
+@pytest.fixture
+def api(fake_credentials) -> WowGameDataApi:
+    api = WowGameDataApi(*fake_credentials, "us", "en_US")
+    prime_token(api)
+    return api
+
+
+def serve_pages(mock_get, page_count: int, delay: float = 0.0) -> list[int]:
+    """Answer search GETs with pages; return the list of requested pages."""
+    requested = []
+    lock = threading.Lock()
+
+    def get(url, params=None, **kwargs):
+        with lock:
+            requested.append(params["_page"])
+        if delay and params["_page"] != 1:
+            time.sleep(delay)
+        response = MagicMock(status_code=200, headers={})
+        response.json.return_value = search_page(params["_page"], page_count)
+        return response
+
+    mock_get.side_effect = get
+    return requested
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "iter_search_decor",
+        "iter_search_fixture",
+        "iter_search_fixture_hook",
+        "iter_search_room",
+    ],
+)
+def test_iterators_yield_every_result_in_order(api, mock_get, method) -> None:
+    requested = serve_pages(mock_get, page_count=5)
+    results = list(getattr(api, method)(orderby="id"))
+    assert ids(results) == list(range(5 * PAGE_SIZE))
+    assert sorted(requested) == [1, 2, 3, 4, 5]
+    resource = method.removeprefix("iter_search_").replace("_", "-")
+    assert mock_get.call_args.args[0].endswith(f"/data/wow/search/{resource}")
+    assert mock_get.call_args.kwargs["params"]["orderby"] == "id"
+    assert mock_get.call_args.kwargs["params"]["namespace"] == "static-us"
+
+
+def test_single_page_sends_one_request(api, mock_get) -> None:
+    serve_pages(mock_get, page_count=1)
+    assert ids(api.iter_search_decor()) == [0, 1, 2]
+    assert mock_get.call_count == 1
+
+
+def test_nothing_is_requested_until_iteration(api, mock_get) -> None:
+    results = api.iter_search_room()
+    mock_get.assert_not_called()
+    serve_pages(mock_get, page_count=2)
+    assert len(list(results)) == 2 * PAGE_SIZE
+
+
+def test_start_page_and_page_size(api, mock_get) -> None:
+    requested = serve_pages(mock_get, page_count=4)
+    results = list(api.iter_search_decor(_page=3, _pageSize=PAGE_SIZE))
+    assert ids(results) == list(range(2 * PAGE_SIZE, 4 * PAGE_SIZE))
+    assert sorted(requested) == [3, 4]
+    assert mock_get.call_args.kwargs["params"]["_pageSize"] == PAGE_SIZE
+
+
+def test_later_pages_are_fetched_concurrently(api, mock_get) -> None:
+    serve_pages(mock_get, page_count=9, delay=0.1)
+    start = time.perf_counter()
+    results = list(api.iter_search_fixture(prefetch=8))
+    elapsed = time.perf_counter() - start
+    assert len(results) == 9 * PAGE_SIZE
+    assert elapsed < 0.5
+
+
+def test_prefetch_bounds_pages_in_flight(api, mock_get) -> None:
+    requested = serve_pages(mock_get, page_count=20)
+    results = api.iter_search_decor(prefetch=2)
+    next(results)
+    next(results)
+    next(results)
+    next(results)  # first result of page 2
+    assert max(requested) <= 4
+    results.close()
+
+
+@pytest.mark.asyncio
+async def test_async_iterator(fake_credentials, mock_async_get) -> None:
+    requested = []
+
+    async def get(url, params=None, **kwargs):
+        requested.append(params["_page"])
+        await asyncio.sleep(0.01)
+        response = MagicMock(status_code=200, headers={})
+        response.json.return_value = search_page(params["_page"], 6)
+        return response
+
+    mock_async_get.side_effect = get
+    async with AsyncBlizzardApi(*fake_credentials, "us", "en_US") as client:
+        prime_token(client.wow.game_data)
+        results = [r async for r in client.wow.game_data.iter_search_decor(prefetch=5)]
+    assert ids(results) == list(range(6 * PAGE_SIZE))
+    assert sorted(requested) == [1, 2, 3, 4, 5, 6]
@@ -0,0 +1,135 @@
+"""Tests for client-side throttling (`blizzardapi2.rate_limit`).
+
+Time is faked by patching `time.monotonic`; `time.sleep` and `asyncio.sleep`
+are patched to record the delays they would have waited.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from blizzardapi2.aio.api import AsyncBaseApi
+from blizzardapi2.api import BaseApi
+from blizzardapi2.blizzard_api import BlizzardApi
+from blizzardapi2.context import ApiContext
+from blizzardapi2.rate_limit import RateLimiter
+from tests.conftest import prime_token
+
+URL = "https://us.api.blizzard.com/data/wow/token/index"
+
+
+@pytest.fixture
+def clock(mocker):
+    return mocker.patch("blizzardapi2.rate_limit.time.monotonic", return_value=0.0)
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.patch("blizzardapi2.rate_limit.time.sleep")
+
+
+def test_burst_up_to_limit_does_not_wait(clock, sleep) -> None:
+    limiter = RateLimiter([(3, 1.0)])
+    for _ in range(3):
+        limiter.acquire()
+    sleep.assert_not_called()
+
+
+def test_requests_beyond_limit_are_spaced(clock, sleep) -> None:
+    limiter = RateLimiter([(2, 1.0)])
+    for _ in range(4):
+        limiter.acquire()
+    assert [call.args[0] for call in sleep.call_args_list] == pytest.approx([1.0, 1.0])
+
+
+def test_window_slides_over_time(clock, sleep) -> None:
+    limiter = RateLimiter([(2, 1.0)])
+    limiter.acquire()
+    limiter.acquire()
+    clock.return_value = 1.0
+    limiter.acquire()
+    limiter.acquire()
+    sleep.assert_not_called()
+
+
+def test_tightest_quota_wins(clock, sleep) -> None:
+    limiter = RateLimiter([(100, 1.0), (3, 30.0)])
+    for _ in range(4):
+        limiter.acquire()
+    sleep.assert_called_once()
+    assert sleep.call_args.args[0] == pytest.approx(30.0)
+
+
+def test_default_quotas_match_blizzard() -> None:
+    windows = RateLimiter().windows
+    assert [(window.limit, window.period) for window in windows] == [
+        (100, 1.0),
+        (36_000, 3600.0),
+    ]
+
+
+def test_no_window_exceeds_a_quota(clock, sleep) -> None:
+    limiter = RateLimiter()
+    sent = []
+
+    def wait(delay):
+        clock.return_value += delay
+
+    sleep.side_effect = wait
+    for _ in range(80_000):
+        limiter.acquire()
+        sent.append(clock.return_value)
+        clock.return_value += 0.001
+
+    for limit, period in RateLimiter.BLIZZARD_QUOTAS:
+        # Sends i and i + limit must be a full period apart.
+        spans = (later - earlier for earlier, later in zip(sent, sent[limit:]))
+        assert min(spans) >= period - 1e-9
+    assert sum(1 for when in sent if when < 3600) == 36_000
+    assert sum(1 for when in sent if when < 1) == 100
+
+
+def test_no_quotas_never_waits(clock, sleep) -> None:
+    limiter = RateLimiter([])
+    for _ in range(1000):
+        limiter.acquire()
+    sleep.assert_not_called()
+
+
+def test_requests_go_through_limiter(fake_credentials, mock_get, mocker) -> None:
+    limiter = RateLimiter()
+    acquire = mocker.spy(limiter, "acquire")
+    api = BaseApi(*fake_credentials, context=ApiContext(rate_limiter=limiter))
+    prime_token(api)
+    api._make_request(URL, "us")
+    api._make_request(URL, "us")
+    assert acquire.call_count == 2
+
+
+def test_sub_clients_share_limiter(fake_credentials, mock_get, clock, sleep) -> None:
+    context = ApiContext(rate_limiter=RateLimiter([(2, 1.0)]))
+    api = BlizzardApi(*fake_credentials, "us", "en_US", context=context)
+    prime_token(api.wow.game_data)
+    api.wow.game_data.get_token_index()
+    api.hearthstone.game_data.get_card_back(155)
+    sleep.assert_not_called()
+    api.diablo3.community.get_act_index()
+    sleep.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_requests_wait_without_blocking(
+    fake_credentials, mock_async_get, clock, sleep, mocker
+) -> None:
+    async_sleep = mocker.patch("asyncio.sleep", new_callable=AsyncMock)
+    context = ApiContext(rate_limiter=RateLimiter([(1, 1.0)]))
+    api = AsyncBaseApi(*fake_credentials, context=context)
+    prime_token(api)
+    await api._make_request(URL, "us")
+    await api._make_request(URL, "us")
+    sleep.assert_not_called()
+    async_sleep.assert_awaited_once()
+    assert async_sleep.call_args.args[0] == pytest.approx(1.0)
+    await context.aclose()
@@ -0,0 +1,142 @@
+"""Tests for recording and replaying API traffic.
+
+Traffic is recorded from a ``FakeBlizzardServer``, then replayed with the
+server stopped, so replay is shown to need no network.
+"""
+
+from __future__ import annotations
+
+import gzip
+
+import httpx
+import pytest
+import requests
+
+from blizzardapi2.aio import AsyncBlizzardApi
+from blizzardapi2.blizzard_api import BlizzardApi
+from blizzardapi2.context import ApiContext
+from blizzardapi2.recording import (
+    Recorded,
+    RecordingSession,
+    ReplayMiss,
+    ReplaySession,
+    read_archive,
+)
+from blizzardapi2.retry import RetryPolicy
+from blizzardapi2.testing import FakeBlizzardServer, redirect
+
+
+def wow_game_data(context: ApiContext):
+    return BlizzardApi("id", "secret", "us", "en_US", context=context).wow.game_data
+
+
+@pytest.fixture(scope="module")
+def recorded(tmp_path_factory):
+    """Record a few calls; return the archive, the server URL and the results."""
+    path = tmp_path_factory.mktemp("recording") / "traffic.jsonl.gz"
+    server = FakeBlizzardServer(commodities=300, search_results=250)
+    with server, server.redirect(), RecordingSession(path) as session:
+        game_data = wow_game_data(ApiContext(session))
+        results = {
+            "item": game_data.get_item(19019),
+            "commodities": list(game_data.iter_commodities()),
+            "search": list(game_data.iter_search_decor(_pageSize=100)),
+        }
+    return path, server.url, results
+
+
+@pytest.fixture
+def replay(recorded):
+    path, url, _ = recorded
+    with redirect(url):
+        yield ReplaySession(path)
+
+
+@pytest.fixture
+def game_data(replay):
+    return wow_game_data(ApiContext(replay))
+
+
+def test_archive_holds_responses_but_no_credentials(recorded) -> None:
+    path, url, _ = recorded
+
+    entries = list(read_archive(path))
+    text = gzip.open(path, "rt").read()
+
+    assert len(entries) == 5  # item, commodities, 3 search pages
+    assert entries[0].url == f"{url}/data/wow/item/19019"
+    assert dict(entries[0].params) == {"namespace": "static-us", "locale": "en_US"}
+    assert entries[0].headers["Content-Length"] == str(len(entries[0].content))
+    assert "Bearer" not in text and "access_token" not in text
+
+
+def test_replay_serves_recorded_responses(recorded, game_data) -> None:
+    results = recorded[2]
+
+    assert game_data.get_item(19019) == results["item"]
+    assert list(game_data.iter_commodities()) == results["commodities"]
+    assert list(game_data.iter_search_decor(_pageSize=100)) == results["search"]
+
+
+def test_replay_miss(game_data) -> None:
+    with pytest.raises(ReplayMiss, match="/data/wow/item/1 "):
+        game_data.get_item(1)
+
+
+def test_repeated_requests_replay_in_order(tmp_path) -> None:
+    path = tmp_path / "repeated.jsonl.gz"
+    with gzip.open(path, "wt") as archive:
+        for status, body in ((200, b'{"n": 1}'), (503, b"\xff\xfe")):
+            line = Recorded("https://x/a", (("q", "1"),), status, {}, body).to_json()
+            archive.write(line + "\n")
+    replay = ReplaySession(path)
+
+    answers = [replay.get("https://x/a", {"q": 1}) for _ in range(3)]
+
+    assert len(replay) == 2
+    assert answers[0].json() == {"n": 1}
+    assert [answer.status_code for answer in answers] == [200, 503, 503]
+    assert answers[1].content == b"\xff\xfe"
+    with pytest.raises(requests.HTTPError, match="503 Server Error"):
+        answers[1].raise_for_status()
+
+
+def test_recording_appends(recorded, tmp_path) -> None:
+    path = tmp_path / "twice.jsonl.gz"
+    path.write_bytes(recorded[0].read_bytes())
+    server = FakeBlizzardServer()
+    with server, server.redirect(), RecordingSession(path) as session:
+        wow_game_data(ApiContext(session)).get_item(7)
+
+    assert len(list(read_archive(path))) == 6
+
+
+@pytest.mark.asyncio
+async def test_async_replay(recorded, replay) -> None:
+    client = httpx.AsyncClient(transport=replay.transport())
+    context = ApiContext(async_session=client)
+
+    async with AsyncBlizzardApi("id", "secret", "us", "en_US", context=context) as api:
+        item = await api.wow.game_data.get_item(19019)
+        with pytest.raises(ReplayMiss, match="/data/wow/item/1 "):
+            await api.wow.game_data.get_item(1)
+
+    assert item == recorded[2]["item"]
+
+
+@pytest.mark.asyncio
+async def test_replay_miss_is_not_retried(replay, mocker) -> None:
+    sleep = mocker.patch("time.sleep")
+    async_sleep = mocker.patch("asyncio.sleep")
+    client = httpx.AsyncClient(transport=replay.transport())
+    context = ApiContext(async_session=client, retry_policy=RetryPolicy())
+    sync_api = wow_game_data(ApiContext(replay, retry_policy=RetryPolicy()))
+
+    with pytest.raises(ReplayMiss):
+        sync_api.get_item(1)
+    async with AsyncBlizzardApi("id", "secret", "us", "en_US", context=context) as api:
+        with pytest.raises(ReplayMiss):
+            await api.wow.game_data.get_item(1)
+
+    sleep.assert_not_called()
+    async_sleep.assert_not_called()
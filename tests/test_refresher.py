@@ -0,0 +1,161 @@
+"""Tests for background token renewal (`blizzardapi2.refresher`).
+
+The refreshers renew client-credentials tokens ahead of the request path's
+refresh window. These tests check the schedule (lead, jitter, one renewal per
+OAuth authority) and that a running refresher keeps requests off the token
+endpoint, for both the thread and the asyncio variants.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from blizzardapi2.aio import AsyncBlizzardApi
+from blizzardapi2.aio.api import AsyncBaseApi
+from blizzardapi2.api import BaseApi
+from blizzardapi2.blizzard_api import BlizzardApi
+from blizzardapi2.refresher import TokenRefresher
+from blizzardapi2.types import Locale, Region
+from tests.conftest import FAKE_TOKEN, prime_token
+
+
+@pytest.fixture
+def api(fake_credentials) -> BaseApi:
+    client_id, client_secret = fake_credentials
+    return BaseApi(client_id, client_secret, Region.US)
+
+
+def test_regions_are_deduplicated_per_authority(api: BaseApi) -> None:
+    """Regions sharing oauth.battle.net share a token and are renewed once."""
+    refresher = TokenRefresher(api, ["us", "eu", "kr", "cn"])
+    assert refresher.regions == [Region.US, Region.CN]
+
+
+def test_missing_token_is_scheduled_immediately(api: BaseApi) -> None:
+    refresher = TokenRefresher(api, ["us"])
+    before = datetime.now(UTC)
+    assert refresher._initial_schedule()[Region.US] <= datetime.now(UTC)
+    assert refresher._initial_schedule()[Region.US] >= before
+
+
+def test_renewal_is_scheduled_ahead_of_request_refresh_window(api: BaseApi) -> None:
+    """Renewal lands before TOKEN_REFRESH_BUFFER + lead, minus up to `jitter`."""
+    prime_token(api, expires_in=3600)
+    expires_at = api._cached_token("us").expires_at
+    refresher = TokenRefresher(
+        api, ["us"], lead=timedelta(minutes=5), jitter=timedelta(minutes=2)
+    )
+
+    for _ in range(20):
+        due = refresher._next_refresh(Region.US)
+        latest = expires_at - api.TOKEN_REFRESH_BUFFER - timedelta(minutes=5)
+        assert latest - timedelta(minutes=2) <= due <= latest
+
+
+def test_short_lived_token_does_not_spin(api: BaseApi) -> None:
+    """A token shorter than the lead is renewed at most every retry_interval."""
+    prime_token(api, expires_in=60)
+    refresher = TokenRefresher(api, ["us"], retry_interval=timedelta(seconds=30))
+    assert refresher._next_refresh(Region.US) >= datetime.now(UTC) + timedelta(
+        seconds=29
+    )
+
+
+def test_thread_refresher_renews_missing_token(api: BaseApi, mock_post) -> None:
+    with api.start_token_refresher() as refresher:
+        deadline = time.monotonic() + 2
+        while api._cached_token("us") is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert refresher.running
+
+    assert not refresher.running
+    assert mock_post.call_count == 1
+    assert api._cached_token("us").access_token == FAKE_TOKEN
+
+
+def test_renew_token_replaces_a_valid_token(api: BaseApi, mock_post) -> None:
+    """Renewal fetches a new token before the request path would."""
+    prime_token(api, token="old_token", expires_in=600)
+    assert api._renew_token("us", lead=timedelta(minutes=5)) == FAKE_TOKEN
+    assert mock_post.call_count == 1
+
+
+def test_renew_token_reuses_a_token_renewed_by_another_worker(
+    api: BaseApi, mock_post
+) -> None:
+    """A token another worker sharing the store just renewed is not fetched again."""
+    prime_token(api, token="renewed_token")
+    assert api._renew_token("us", lead=timedelta(minutes=5)) == "renewed_token"
+    mock_post.assert_not_called()
+
+
+def test_refresher_needs_a_region(api: BaseApi) -> None:
+    with pytest.raises(ValueError, match="at least one region"):
+        api.start_token_refresher([])
+
+
+def test_failed_renewal_is_retried_later(api: BaseApi, mock_post) -> None:
+    """An OAuth failure is logged and rescheduled, not raised into the thread."""
+    mock_post.side_effect = [ConnectionError("down"), mock_post.return_value]
+    refresher = TokenRefresher(api, ["us"], retry_interval=timedelta(seconds=0.05))
+    refresher.start()
+    try:
+        deadline = time.monotonic() + 2
+        while api._cached_token("us") is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        refresher.stop()
+
+    assert mock_post.call_count == 2
+    assert api._cached_token("us").access_token == FAKE_TOKEN
+
+
+def test_blizzard_api_refresher_serves_every_subclient(
+    fake_credentials, mock_get, mock_post
+) -> None:
+    """A facade-level refresher fills the shared context for all games."""
+    client_id, client_secret = fake_credentials
+    api = BlizzardApi(client_id, client_secret, Region.EU, Locale.EN_GB)
+
+    with api.start_token_refresher():
+        deadline = time.monotonic() + 2
+        while len(api.context.token_store) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    api.wow.game_data.get_achievements_index()
+    api.hearthstone.game_data.get_metadata()
+    assert mock_post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_refresher_renews_missing_token(
+    fake_credentials, mock_async_post
+) -> None:
+    client_id, client_secret = fake_credentials
+    async with AsyncBlizzardApi(client_id, client_secret, Region.US) as api:
+        async with api.start_token_refresher() as refresher:
+            for _ in range(100):
+                if len(api.context.token_store):
+                    break
+                await asyncio.sleep(0.01)
+            assert refresher.running
+
+    assert not refresher.running
+    assert mock_async_post.call_count == 1
+    assert api.battlenet.oauth._cached_token("us").access_token == FAKE_TOKEN
+
+
+@pytest.mark.asyncio
+async def test_async_renew_token_reuses_a_token_renewed_by_another_worker(
+    fake_credentials, mock_async_post
+) -> None:
+    api = AsyncBaseApi(*fake_credentials)
+    prime_token(api, token="renewed_token")
+    assert await api._renew_token("us", lead=timedelta(minutes=5)) == "renewed_token"
+    prime_token(api, token="old_token", expires_in=600)
+    assert await api._renew_token("us", lead=timedelta(minutes=5)) == FAKE_TOKEN
+    assert mock_async_post.call_count == 1
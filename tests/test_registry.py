@@ -0,0 +1,161 @@
+"""Tests for the declarative endpoint tables in blizzardapi2.registry.
+
+A small table is installed on a throwaway ``LocaleApi`` subclass so the
+tests can observe when methods are generated; the WoW tables are only checked
+for introspection, their requests are covered by ``test_wow``.
+"""
+
+import inspect
+from typing import Any
+from urllib.parse import urlsplit
+
+import pytest
+
+from blizzardapi2.aio.wow import AsyncWowGameDataApi
+from blizzardapi2.api import LocaleApi
+from blizzardapi2.blizzard_api import BlizzardApi
+from blizzardapi2.registry import Endpoint, endpoint_template, endpoints
+from blizzardapi2.types import OptionalLocale, OptionalRegion
+from blizzardapi2.wow.wow_game_data_api import WowGameDataApi
+from blizzardapi2.wow.wow_profile_api import WowProfileApi
+from tests.conftest import prime_token
+
+TABLE = (
+    Endpoint(
+        "get_thing",
+        "/data/test/thing/{thing_id}",
+        "static",
+        "Return a thing by ID.",
+        params=(("thing_id", int, "The ID of the thing."),),
+        returns="A dictionary containing the thing.",
+        classic=True,
+    ),
+    Endpoint(
+        "get_owner_thing",
+        "/profile/test/{owner}/thing",
+        "profile",
+        "Return the thing of an owner.",
+        params=(
+            ("access_token", str, "The access token for authorization."),
+            ("owner", str, "The owner."),
+        ),
+    ),
+    Endpoint(
+        "search_thing",
+        "/data/test/search/thing",
+        "dynamic",
+        "Search for things.",
+        search=True,
+        keyword_only=False,
+    ),
+)
+
+
+@pytest.fixture
+def api_class() -> type[LocaleApi]:
+    @endpoints(TABLE)
+    class ThingApi(LocaleApi):
+        def search_thing(self) -> str:
+            return "hand-written"
+
+    return ThingApi
+
+
+@pytest.fixture
+def api(api_class: type[LocaleApi], fake_credentials) -> LocaleApi:
+    instance = api_class(*fake_credentials, "eu", "en_GB")
+    prime_token(instance)
+    return instance
+
+
+def test_methods_are_generated_on_first_lookup(api_class) -> None:
+    assert not inspect.isfunction(vars(api_class)["get_thing"])
+
+    method = api_class.get_thing
+
+    assert inspect.isfunction(method)
+    assert vars(api_class)["get_thing"] is method
+    assert method.__qualname__.endswith("ThingApi.get_thing")
+
+
+def test_generated_signature_and_docstring(api_class) -> None:
+    def get_thing(
+        self,
+        thing_id: int,
+        *,
+        region: OptionalRegion = None,
+        locale: OptionalLocale = None,
+        is_classic: bool = False,
+    ) -> dict[str, Any]: ...
+
+    assert inspect.signature(api_class.get_thing) == inspect.signature(get_thing)
+    doc = inspect.getdoc(api_class.get_thing)
+    assert doc.startswith("Return a thing by ID.\n\nArgs:\n    thing_id (int): ")
+    assert doc.endswith("Dict[str, Any]: A dictionary containing the thing.")
+
+
+def test_generated_method_requests_endpoint(api, mock_get) -> None:
+    api.get_thing(7, is_classic=True, region="us")
+
+    url = mock_get.call_args.args[0]
+    params = mock_get.call_args.kwargs["params"]
+    assert url == "https://us.api.blizzard.com/data/test/thing/7"
+    assert params["namespace"] == "static-classic-us"
+    assert params["locale"] == "en_GB"
+
+
+def test_parameters_outside_the_path_are_query_parameters(api, mock_get) -> None:
+    api.get_owner_thing("user-token", "someone")
+
+    url = mock_get.call_args.args[0]
+    headers = mock_get.call_args.kwargs["headers"]
+    assert url == "https://eu.api.blizzard.com/profile/test/someone/thing"
+    assert headers["Authorization"] == "Bearer user-token"
+
+
+def test_keyword_only_options_are_enforced(api) -> None:
+    with pytest.raises(TypeError):
+        api.get_thing(7, "us")
+
+
+def test_hand_written_methods_take_precedence(api, api_class) -> None:
+    assert api.search_thing() == "hand-written"
+    assert api_class.endpoints["search_thing"].search
+
+
+def test_wow_tables_are_introspectable() -> None:
+    item = WowGameDataApi.endpoints["get_item"]
+
+    assert item.path == "/data/wow/item/{item_id}"
+    assert (item.namespace, item.classic) == ("static", True)
+    assert AsyncWowGameDataApi.endpoints is WowGameDataApi.endpoints
+    assert {e.namespace for e in WowProfileApi.endpoints.values()} == {"profile"}
+    assert len(WowGameDataApi.endpoints) == 147
+
+
+def test_hand_written_methods_resolve_to_templates(fake_credentials, mock_get) -> None:
+    client = BlizzardApi(*fake_credentials, "us", "en_US")
+    apis = [
+        client.battlenet.oauth,
+        client.diablo3.community,
+        client.diablo3.game_data,
+        client.hearthstone.game_data,
+        client.starcraft2.community,
+        client.starcraft2.game_data,
+    ]
+    for api in apis:
+        prime_token(api)
+        for name, method in vars(type(api)).items():
+            if not name.startswith(("get_", "search_")) or name == "get_resource":
+                continue
+            required = [
+                parameter
+                for parameter in inspect.signature(method).parameters.values()
+                if parameter.default is inspect.Parameter.empty
+                and parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+            ][1:]
+            getattr(api, name)(*["Thrall-1234" for _ in required])
+            path = urlsplit(mock_get.call_args.args[0]).path
+
+            template = endpoint_template(path)
+            assert "Thrall" not in template, name
@@ -0,0 +1,176 @@
+"""Tests for retries of transient failures (`blizzardapi2.retry`).
+
+Sleeps are patched out and recorded, so the tests check the delays a policy
+would wait without waiting them.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+import requests
+
+from blizzardapi2.aio.api import AsyncBaseApi
+from blizzardapi2.api import BaseApi
+from blizzardapi2.context import ApiContext
+from blizzardapi2.retry import RetryPolicy
+from tests.conftest import prime_token
+
+URL = "https://us.api.blizzard.com/data/wow/token/index"
+
+
+def response(status_code: int = 200, **headers: str) -> MagicMock:
+    mock = MagicMock(status_code=status_code, headers=headers)
+    mock.json.return_value = {"status": status_code}
+    mock.aclose = AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def sleep(mocker) -> MagicMock:
+    return mocker.patch("blizzardapi2.retry.time.sleep")
+
+
+@pytest.fixture
+def api(fake_credentials) -> BaseApi:
+    api = BaseApi(*fake_credentials, context=ApiContext(retry_policy=RetryPolicy()))
+    prime_token(api)
+    return api
+
+
+@pytest.mark.parametrize("status_code", [429, 500, 502, 503, 504])
+def test_transient_status_is_retried(api, mock_get, sleep, status_code) -> None:
+    mock_get.side_effect = [response(status_code), response(200)]
+    assert api._make_request(URL, "us") == {"status": 200}
+    assert mock_get.call_count == 2
+    sleep.assert_called_once()
+
+
+@pytest.mark.parametrize("status_code", [400, 403, 404])
+def test_client_errors_are_not_retried(api, mock_get, sleep, status_code) -> None:
+    mock_get.return_value = response(status_code)
+    api._make_request(URL, "us")
+    assert mock_get.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_connection_errors_are_retried(api, mock_get, sleep) -> None:
+    mock_get.side_effect = [
+        requests.ConnectionError("reset"),
+        requests.Timeout("slow"),
+        response(200),
+    ]
+    assert api._make_request(URL, "us") == {"status": 200}
+    assert sleep.call_count == 2
+
+
+def test_budget_is_per_request(fake_credentials, mock_get, sleep) -> None:
+    context = ApiContext(retry_policy=RetryPolicy(max_retries=2))
+    api = BaseApi(*fake_credentials, context=context)
+    prime_token(api)
+    mock_get.return_value = response(503)
+    mock_get.return_value.raise_for_status.side_effect = requests.HTTPError("503")
+    with pytest.raises(requests.HTTPError):
+        api._make_request(URL, "us")
+    assert mock_get.call_count == 3
+
+    mock_get.reset_mock()
+    mock_get.side_effect = [response(503), response(503), response(200)]
+    assert api._make_request(URL, "us") == {"status": 200}
+
+
+def test_budget_exhausted_reraises_connection_error(
+    fake_credentials, mock_get, sleep
+) -> None:
+    context = ApiContext(retry_policy=RetryPolicy(max_retries=1))
+    api = BaseApi(*fake_credentials, context=context)
+    prime_token(api)
+    mock_get.side_effect = requests.ConnectionError("down")
+    with pytest.raises(requests.ConnectionError):
+        api._make_request(URL, "us")
+    assert mock_get.call_count == 2
+
+
+def test_retry_after_seconds_is_honored(api, mock_get, sleep) -> None:
+    mock_get.side_effect = [response(429, **{"Retry-After": "7"}), response(200)]
+    api._make_request(URL, "us")
+    sleep.assert_called_once_with(7.0)
+
+
+def test_too_long_retry_after_is_not_waited(api, mock_get, sleep) -> None:
+    mock_get.return_value = response(429, **{"Retry-After": "3600"})
+    api._make_request(URL, "us")
+    assert mock_get.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_retry_after_http_date() -> None:
+    when = datetime.now(UTC) + timedelta(seconds=30)
+    delay = RetryPolicy.retry_after(format_datetime(when, usegmt=True))
+    assert 28 <= delay <= 30
+    assert RetryPolicy.retry_after(None) is None
+    assert RetryPolicy.retry_after("soon") is None
+    assert RetryPolicy.retry_after("-5") == 0
+
+
+def test_backoff_is_capped_and_jittered(mocker) -> None:
+    uniform = mocker.patch("blizzardapi2.retry.random.uniform", return_value=1.0)
+    policy = RetryPolicy(backoff=1.0, max_backoff=10.0)
+    for attempt, cap in [(0, 1.0), (1, 2.0), (3, 8.0), (4, 10.0), (10, 10.0)]:
+        policy.backoff_delay(attempt)
+        assert uniform.call_args.args == (0, cap)
+
+
+def test_custom_statuses(fake_credentials, mock_get, sleep) -> None:
+    context = ApiContext(retry_policy=RetryPolicy(statuses=[500]))
+    api = BaseApi(*fake_credentials, context=context)
+    prime_token(api)
+    mock_get.return_value = response(429)
+    api._make_request(URL, "us")
+    assert mock_get.call_count == 1
+
+
+def test_retries_wait_for_rate_limiter(api, mock_get, sleep, mocker) -> None:
+    api.context.rate_limiter = MagicMock()
+    mock_get.side_effect = [response(503), response(200)]
+    api._make_request(URL, "us")
+    assert api.context.rate_limiter.acquire.call_count == 2
+
+
+def test_token_post_is_not_retried(fake_credentials, mock_get, mock_post, sleep):
+    context = ApiContext(retry_policy=RetryPolicy())
+    api = BaseApi(*fake_credentials, context=context)
+    mock_post.return_value.raise_for_status.side_effect = requests.HTTPError("503")
+    with pytest.raises(requests.HTTPError):
+        api._make_request(URL, "us")
+    assert mock_post.call_count == 1
+    mock_get.assert_not_called()
+
+
+def test_no_policy_does_not_retry(fake_credentials, mock_get, sleep) -> None:
+    api = BaseApi(*fake_credentials)
+    prime_token(api)
+    mock_get.return_value = response(503)
+    api._make_request(URL, "us")
+    assert mock_get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_retries(fake_credentials, mock_async_get, mocker) -> None:
+    async_sleep = mocker.patch("asyncio.sleep", new_callable=AsyncMock)
+    context = ApiContext(retry_policy=RetryPolicy())
+    api = AsyncBaseApi(*fake_credentials, context=context)
+    prime_token(api)
+    mock_async_get.side_effect = [
+        httpx.ConnectError("reset"),
+        response(429, **{"Retry-After": "2"}),
+        response(200),
+    ]
+    assert await api._make_request(URL, "us") == {"status": 200}
+    assert mock_async_get.call_count == 3
+    assert async_sleep.await_args_list[-1].args == (2.0,)
+    await context.aclose()
@@ -0,0 +1,186 @@
+"""Tests for coalescing of identical in-flight requests (`blizzardapi2.singleflight`).
+
+Concurrent identical calls are simulated with threads that all enter
+`_make_request` while the first upstream GET is held open on an event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from blizzardapi2.aio.api import AsyncBaseApi
+from blizzardapi2.api import BaseApi
+from blizzardapi2.context import ApiContext
+from blizzardapi2.singleflight import SingleFlight
+from tests.conftest import prime_token
+
+URL = "https://us.api.blizzard.com/profile/wow/character/stormrage/thrall"
+
+
+@pytest.fixture
+def api(fake_credentials) -> BaseApi:
+    api = BaseApi(*fake_credentials, context=ApiContext(single_flight=SingleFlight()))
+    prime_token(api)
+    return api
+
+
+def run_concurrently(api: BaseApi, mock_get, calls: list[dict]) -> list:
+    """Run `_make_request` calls in threads while the upstream GET is blocked."""
+    release = threading.Event()
+    entered = threading.Semaphore(0)
+    flights = api.context.single_flight
+    do = flights.do
+
+    def counting_do(key, call):
+        entered.release()
+        return do(key, call)
+
+    def slow_get(url, params=None, **kwargs):
+        release.wait(5)
+        response = MagicMock(status_code=200, headers={})
+        response.json.return_value = {"params": dict(params)}
+        return response
+
+    flights.do = counting_do
+    mock_get.side_effect = slow_get
+    with ThreadPoolExecutor(len(calls)) as pool:
+        futures = [pool.submit(api._make_request, URL, "us", call) for call in calls]
+        for _ in calls:
+            entered.acquire(timeout=5)
+        # Let the last callers reach the flight they wait on.
+        time.sleep(0.05)
+        release.set()
+        return [future.result() for future in futures]
+
+
+def test_identical_calls_share_one_request(api, mock_get) -> None:
+    params = {"namespace": "profile-us", "locale": "en_US"}
+    results = run_concurrently(api, mock_get, [dict(params) for _ in range(8)])
+    assert mock_get.call_count == 1
+    assert all(result is results[0] for result in results)
+    assert len(api.context.single_flight) == 0
+
+
+def test_different_params_do_not_share(api, mock_get) -> None:
+    results = run_concurrently(
+        api, mock_get, [{"locale": "en_US"}, {"locale": "de_DE"}, {"locale": "en_US"}]
+    )
+    assert mock_get.call_count == 2
+    assert results[0] is results[2]
+    assert results[1] == {"params": {"locale": "de_DE"}}
+
+
+def test_user_tokens_do_not_share_with_others(api, mock_get) -> None:
+    run_concurrently(
+        api,
+        mock_get,
+        [{"access_token": "alice"}, {"access_token": "bob"}, {}],
+    )
+    assert mock_get.call_count == 3
+    tokens = {
+        call.kwargs["headers"]["Authorization"] for call in mock_get.call_args_list
+    }
+    assert {"Bearer alice", "Bearer bob"} <= tokens
+
+
+def test_sequential_calls_are_not_coalesced(api, mock_get) -> None:
+    api._make_request(URL, "us")
+    api._make_request(URL, "us")
+    assert mock_get.call_count == 2
+
+
+def test_errors_are_shared_and_not_remembered() -> None:
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = 0
+
+    def failing():
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait(5)
+        raise requests.HTTPError("503")
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flights.do, "key", failing)
+        started.wait(5)
+        follower = pool.submit(flights.do, "key", failing)
+        while not follower.running():
+            pass
+        time.sleep(0.05)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(requests.HTTPError):
+                future.result()
+    assert calls == 1
+    assert flights.do("key", lambda: "ok") == "ok"
+
+
+@pytest.mark.asyncio
+async def test_async_identical_calls_share_one_request(
+    fake_credentials, mock_async_get
+) -> None:
+    context = ApiContext(single_flight=SingleFlight())
+    api = AsyncBaseApi(*fake_credentials, context=context)
+    prime_token(api)
+    response = mock_async_get.return_value
+
+    async def slow_get(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return response
+
+    mock_async_get.side_effect = slow_get
+    results = await asyncio.gather(*(api._make_request(URL, "us") for _ in range(10)))
+    assert mock_async_get.call_count == 1
+    assert all(result is results[0] for result in results)
+    assert len(context.single_flight) == 0
+    await context.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_errors_are_shared() -> None:
+    flights = SingleFlight()
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise requests.HTTPError("503")
+
+    results = await asyncio.gather(
+        *(flights.do_async("key", failing) for _ in range(3)), return_exceptions=True
+    )
+    assert calls == 1
+    assert all(isinstance(result, requests.HTTPError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_leader_does_not_cancel_followers() -> None:
+    flights = SingleFlight()
+    calls = 0
+
+    async def slow():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    leader = asyncio.create_task(flights.do_async("key", slow))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flights.do_async("key", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "result"
+    assert leader.cancelled()
+    assert calls == 1
+    assert len(flights) == 0
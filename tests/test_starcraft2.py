@@ -150,13 +150,14 @@ def test_game_data_get_league_data_no_query_params(fake_credentials, mock_get):
     assert kwargs["params"] == {}
 
 
-def test_subclients_have_independent_token_state(fake_credentials, mock_get):
-    """Community and game_data are separate BaseApi instances with their own tokens."""
+def test_subclients_share_token_state(fake_credentials, mock_get):
+    """Community and game_data share one context, so one token serves both."""
     client_id, client_secret = fake_credentials
     api = Starcraft2Api(client_id, client_secret)
 
     # Prime only the community client.
     prime_token(api.community)
 
-    assert api.community._access_token == FAKE_TOKEN
-    assert api.game_data._access_token is None
+    assert api.community.context is api.game_data.context
+    assert api.community._cached_token("us").access_token == FAKE_TOKEN
+    assert api.game_data._cached_token("us").access_token == FAKE_TOKEN
@@ -0,0 +1,210 @@
+"""Tests for incremental parsing of auction responses (`blizzardapi2.streaming`).
+
+The parser must produce the same auctions as `json.loads` however the body is
+split into chunks, including chunk boundaries inside strings, numbers and
+multi-byte UTF-8 characters.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import requests
+
+from blizzardapi2.aio import AsyncBlizzardApi
+from blizzardapi2.context import ApiContext
+from blizzardapi2.retry import RetryPolicy
+from blizzardapi2.streaming import JsonArrayStream, batched, iter_json_array
+from blizzardapi2.wow.wow_game_data_api import WowGameDataApi
+from tests.conftest import prime_token
+
+AUCTIONS = [
+    {
+        "id": auction_id,
+        "item": {"id": 19019, "name": "Thunderfury, Béni"},
+        "quantity": auction_id % 200,
+        "unit_price": 1234567,
+        "time_left": "SHORT",
+    }
+    for auction_id in range(500)
+]
+BODY = {
+    "_links": {"self": {"href": "https://us.api.blizzard.com/data/wow/auctions"}},
+    "connected_realm": {"href": "https://us.api.blizzard.com/data/wow/1"},
+    "auctions": AUCTIONS,
+    "commodities": {"href": "https://us.api.blizzard.com/commodities"},
+    "count": 500,
+}
+
+
+def chunked(data: bytes, size: int) -> list[bytes]:
+    return [data[start : start + size] for start in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 4096, 10**9])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_stream_matches_json_loads(size, indent) -> None:
+    raw = json.dumps(BODY, indent=indent, ensure_ascii=False).encode()
+    assert list(iter_json_array(chunked(raw, size), "auctions")) == AUCTIONS
+
+
+def test_items_are_returned_as_soon_as_complete() -> None:
+    stream = JsonArrayStream("auctions")
+    assert stream.feed(b'{"auctions": [{"id": 1}, {"id"') == [{"id": 1}]
+    assert stream.feed(b": 2}, 3") == [{"id": 2}]
+    assert stream.feed(b"4]") == [34]
+    assert stream.feed(b"}") == []
+    assert stream.close() == []
+
+
+def test_any_split_of_floats() -> None:
+    raw = (
+        b'{"x": 12.5, "y": -1e-3, "a": [1.25, 2, -3.5e-2, 1E+3, {"p": 0.5}, 7], '
+        b'"z": 6.02e23}'
+    )
+    expected = json.loads(raw)["a"]
+
+    for split in range(len(raw) + 1):
+        stream = JsonArrayStream("a")
+        items = stream.feed(raw[:split]) + stream.feed(raw[split:]) + stream.close()
+        assert items == expected, split
+
+
+def test_missing_key_yields_nothing() -> None:
+    assert list(iter_json_array([b'{"other": [1, 2]}'], "auctions")) == []
+
+
+def test_empty_array() -> None:
+    assert list(iter_json_array([b'{"auctions": []}'], "auctions")) == []
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [b'{"auctions": [{"id": 1}', b'{"auctions": [1 2]}', b"[1, 2]", b""],
+)
+def test_truncated_or_malformed_body_raises(raw) -> None:
+    with pytest.raises(ValueError):
+        list(iter_json_array([raw], "auctions"))
+
+
+def test_batched() -> None:
+    assert list(batched(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+@pytest.fixture
+def api(fake_credentials) -> WowGameDataApi:
+    api = WowGameDataApi(*fake_credentials, "us", "en_US")
+    prime_token(api)
+    return api
+
+
+@pytest.fixture
+def streamed(mock_get):
+    raw = json.dumps(BODY).encode()
+    mock_get.return_value.iter_content.side_effect = lambda size: iter(
+        chunked(raw, size)
+    )
+    return mock_get
+
+
+def test_iter_auctions_streams_the_response(api, streamed) -> None:
+    auctions = api.iter_auctions(1146)
+    streamed.assert_not_called()
+    assert list(auctions) == AUCTIONS
+    args, kwargs = streamed.call_args
+    assert (
+        args[0] == "https://us.api.blizzard.com/data/wow/connected-realm/1146/auctions"
+    )
+    assert kwargs["params"] == {"namespace": "dynamic-us", "locale": "en_US"}
+    assert kwargs["stream"] is True
+    streamed.return_value.close.assert_called()
+
+
+def test_iter_commodities_in_batches(api, streamed) -> None:
+    batches = list(api.iter_commodities(region="eu", batch_size=200))
+    assert [len(batch) for batch in batches] == [200, 200, 100]
+    assert streamed.call_args.args[0] == (
+        "https://eu.api.blizzard.com/data/wow/auctions/commodities"
+    )
+
+
+def test_stream_errors_raise(api, mock_get) -> None:
+    mock_get.return_value.raise_for_status.side_effect = requests.HTTPError("404")
+    with pytest.raises(requests.HTTPError):
+        list(api.iter_auctions(1))
+    mock_get.return_value.close.assert_called()
+
+
+def test_retried_stream_is_closed(fake_credentials, streamed) -> None:
+    context = ApiContext(retry_policy=RetryPolicy(backoff=0))
+    api = WowGameDataApi(*fake_credentials, "us", "en_US", context=context)
+    prime_token(api)
+    unavailable = MagicMock(status_code=503, headers={"Retry-After": "0"})
+    streamed.side_effect = [unavailable, streamed.return_value]
+
+    assert list(api.iter_commodities()) == AUCTIONS
+    unavailable.close.assert_called_once()
+
+
+class TrackedStream(httpx.AsyncByteStream):
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+        self.closed = False
+
+    async def __aiter__(self):
+        yield self.content
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_async_retried_stream_is_closed(fake_credentials) -> None:
+    streams = [TrackedStream(b"unavailable"), TrackedStream(json.dumps(BODY).encode())]
+    answers = iter(zip([503, 200], streams))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status, stream = next(answers)
+        return httpx.Response(status, headers={"Retry-After": "0"}, stream=stream)
+
+    context = ApiContext(
+        async_session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        retry_policy=RetryPolicy(backoff=0),
+    )
+    async with AsyncBlizzardApi(
+        *fake_credentials, "us", "en_US", context=context
+    ) as api:
+        prime_token(api.wow.game_data)
+        auctions = [a async for a in api.wow.game_data.iter_commodities()]
+
+    assert auctions == AUCTIONS
+    assert [stream.closed for stream in streams] == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_async_iter_commodities(fake_credentials) -> None:
+    raw = json.dumps(BODY).encode()
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, content=raw)
+
+    transport = httpx.MockTransport(handler)
+    context = ApiContext(async_session=httpx.AsyncClient(transport=transport))
+    async with AsyncBlizzardApi(
+        *fake_credentials, "us", "en_US", context=context
+    ) as api:
+        prime_token(api.wow.game_data)
+        auctions = [a async for a in api.wow.game_data.iter_commodities()]
+        batches = [
+            batch
+            async for batch in api.wow.game_data.iter_auctions(1146, batch_size=300)
+        ]
+    assert auctions == AUCTIONS
+    assert [len(batch) for batch in batches] == [300, 200]
+    assert seen[0].url.params["namespace"] == "dynamic-us"
+    assert seen[0].headers["Authorization"].startswith("Bearer ")
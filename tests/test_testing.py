@@ -0,0 +1,214 @@
+"""Tests for the local stand-in Blizzard server in blizzardapi2.testing.
+
+Unlike the rest of the suite, these tests send real HTTP requests, to a
+``FakeBlizzardServer`` on a loopback port.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+import requests
+
+from blizzardapi2.api import BaseApi
+from blizzardapi2.blizzard_api import BlizzardApi
+from blizzardapi2.context import ApiContext
+from blizzardapi2.retry import RetryPolicy
+from blizzardapi2.testing import FakeBlizzardServer, Faults, redirect
+from blizzardapi2.testing.server import auction_house, search_page
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeBlizzardServer(auctions=50, commodities=120, search_results=250) as fake:
+        yield fake
+
+
+@pytest.fixture
+def api(server, fake_credentials):
+    with server.redirect():
+        yield BlizzardApi(*fake_credentials, "eu", "en_GB")
+
+
+@pytest.fixture
+def serve(fake_credentials):
+    """Start a server with the given options; return it and a client of it."""
+    with contextlib.ExitStack() as stack:
+
+        def start(context=None, **options):
+            fake = stack.enter_context(FakeBlizzardServer(**options))
+            stack.enter_context(fake.redirect())
+            client = BlizzardApi(*fake_credentials, "us", "en_US", context=context)
+            return fake, client.wow.game_data
+
+        yield start
+
+
+def test_client_runs_against_server(api, server) -> None:
+    tokens = server.tokens
+
+    item = api.wow.game_data.get_item(19019)
+
+    assert item["id"] == 19019
+    href = item["_links"]["self"]["href"]
+    assert href.endswith("/data/wow/item/19019?namespace=static-11.0.2_56313-eu")
+    assert server.tokens == tokens + 1
+
+
+def test_requests_without_token_are_rejected(server) -> None:
+    response = requests.get(f"{server.url}/data/wow/item/1", timeout=5)
+
+    assert response.status_code == 401
+
+
+def test_auction_bodies(api) -> None:
+    auctions = api.wow.game_data.get_auctions(1146)["auctions"]
+    commodities = list(api.wow.game_data.iter_commodities())
+
+    assert len(auctions) == 50
+    assert {"id", "item", "buyout", "quantity", "time_left"} <= auctions[0].keys()
+    assert len(commodities) == 120
+    assert "unit_price" in commodities[0]
+
+
+def test_search_is_paginated(api) -> None:
+    page = api.wow.game_data.search_decor(_page=3, _pageSize=100)
+    results = list(api.wow.game_data.iter_search_decor(_pageSize=100))
+
+    assert (page["page"], page["pageCount"], page["pageSize"]) == (3, 3, 50)
+    assert [result["data"]["id"] for result in results] == list(range(1, 251))
+
+
+def test_payload_builders_are_deterministic() -> None:
+    assert auction_house(10, seed=1) == auction_house(10, seed=1)
+    assert json.loads(auction_house(10, seed=1)) != json.loads(auction_house(10))
+    assert search_page("/x", 5, 2, 1000)["results"] == []
+
+
+def test_redirect_restores_urls(server) -> None:
+    api_urls, oauth_urls = BaseApi.API_URLS, BaseApi.OAUTH_URLS
+
+    with redirect(server.url):
+        assert BaseApi.API_URLS == {"default": server.url}
+        assert BaseApi.OAUTH_URLS == {"default": server.url}
+
+    assert (BaseApi.API_URLS, BaseApi.OAUTH_URLS) == (api_urls, oauth_urls)
+
+
+def test_fixture_documents_are_served(serve, tmp_path) -> None:
+    item = tmp_path / "data" / "wow" / "item"
+    item.mkdir(parents=True)
+    (item / "19019.json").write_text('{"name": "Thunderfury"}')
+    _, game_data = serve(fixtures=tmp_path)
+
+    assert game_data.get_item(19019) == {"name": "Thunderfury"}
+    assert game_data.get_item(1)["id"] == 1
+    assert game_data.get_resource("/../../etc/passwd", query_params={})["id"] == 1
+
+
+def test_latency(serve) -> None:
+    _, game_data = serve(faults=Faults(latency=0.05))
+
+    start = time.perf_counter()
+    game_data.get_item(1)
+
+    assert time.perf_counter() - start >= 0.1  # token request + GET
+
+
+def test_server_errors_are_retried(serve) -> None:
+    policy = RetryPolicy(2, backoff=0)
+    faults = Faults(error_rate=1.0, error_statuses=(503,), retry_after=0)
+    fake, game_data = serve(ApiContext(retry_policy=policy), faults=faults)
+
+    with pytest.raises(requests.HTTPError) as error:
+        game_data.get_item(1)
+
+    assert error.value.response.status_code == 503
+    assert error.value.response.headers["Retry-After"] == "0"
+    assert fake.statuses[503] == 3
+
+
+def test_revoked_token_is_renewed(serve) -> None:
+    fake, game_data = serve(faults=Faults(unauthorized_rate=1.0))
+
+    with pytest.raises(requests.HTTPError):
+        game_data.get_item(1)
+
+    # The client renewed its token once after the first 401, then gave up.
+    assert (fake.tokens, fake.statuses[401]) == (2, 2)
+
+    fake.faults = Faults()
+    assert game_data.get_item(1)["id"] == 1
+    assert fake.tokens == 3
+
+
+def test_throttling(serve) -> None:
+    fake, game_data = serve(faults=Faults(throttle_rate=1.0, retry_after=2.5))
+
+    with pytest.raises(requests.HTTPError) as error:
+        game_data.get_item(1)
+
+    assert error.value.response.status_code == 429
+    assert error.value.response.headers["Retry-After"] == "2.5"
+
+
+def test_rate_limit_quota(serve) -> None:
+    fake, game_data = serve(faults=Faults(rate_limit=2))
+    game_data.get_item(1)
+    token = game_data._ensure_valid_token("us")
+
+    answers = [
+        requests.get(
+            f"{fake.url}/data/wow/item/1",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=5,
+        )
+        for _ in range(5)
+    ]
+
+    throttled = [answer for answer in answers if answer.status_code == 429]
+    assert throttled
+    assert all(int(answer.headers["Retry-After"]) >= 1 for answer in throttled)
+
+
+def test_faults_are_reproducible() -> None:
+    draws = []
+    for _ in range(2):
+        fake = FakeBlizzardServer(faults=Faults(error_rate=0.5, seed=7))
+        draws.append([fake.fault("Bearer x") for _ in range(50)])
+        fake.stop()
+
+    assert draws[0] == draws[1]
+    assert None in draws[0]
+    assert {fault[0] for fault in draws[0] if fault} <= {500, 502, 503, 504}
+
+
+def test_command_line_server() -> None:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "blizzardapi2.testing", "--port", "0"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        url = process.stdout.readline().split()[-1]
+        token = requests.post(
+            f"{url}/oauth/token",
+            params={"grant_type": "client_credentials"},
+            auth=("id", "secret"),
+            timeout=5,
+        ).json()["access_token"]
+        response = requests.get(
+            f"{url}/data/wow/item/5",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=5,
+        )
+    finally:
+        process.terminate()
+        process.wait()
+
+    assert response.json()["id"] == 5
@@ -0,0 +1,159 @@
+"""Tests for client-token storage (`blizzardapi2.token_store`).
+
+`FileTokenStore` lets every process on a host share one client token per
+OAuth authority. Separate `FileTokenStore` instances on the same directory
+open their own lock files, so threads that each own a store behave like
+separate processes: these tests use that to check that a cold start across
+many "workers" costs a single OAuth POST.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import threading
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from blizzardapi2.aio.api import AsyncBaseApi
+from blizzardapi2.api import BaseApi
+from blizzardapi2.context import ApiContext
+from blizzardapi2.token_store import (
+    ClientToken,
+    FileTokenStore,
+    MemoryTokenStore,
+    TokenStore,
+    token_key,
+)
+from tests.conftest import FAKE_TOKEN
+
+
+def make_token(access_token: str = FAKE_TOKEN, seconds: int = 3600) -> ClientToken:
+    return ClientToken(access_token, datetime.now(UTC) + timedelta(seconds=seconds))
+
+
+def test_token_key_separates_clients_and_authorities() -> None:
+    keys = {
+        token_key("a", "https://oauth.battle.net"),
+        token_key("b", "https://oauth.battle.net"),
+        token_key("a", "https://www.gateway.battlenet.com.cn"),
+    }
+    assert len(keys) == 3
+
+
+def test_incomplete_store_cannot_be_created() -> None:
+    class NoLockStore(TokenStore):
+        def get(self, key):
+            return None
+
+        def set(self, key, token):
+            pass
+
+    with pytest.raises(TypeError, match="lock"):
+        NoLockStore()
+
+
+def test_memory_store_round_trip() -> None:
+    store = MemoryTokenStore()
+    token = make_token()
+    assert store.get("key") is None
+    store.set("key", token)
+    assert store.get("key") == token
+    assert store.lock("key") is store.lock("key")
+
+
+def test_file_store_round_trip_between_instances(tmp_path) -> None:
+    """A token written by one store is read back by another on the same path."""
+    token = make_token()
+    FileTokenStore(tmp_path).set("key", token)
+    assert FileTokenStore(tmp_path).get("key") == token
+
+
+def test_file_store_files_are_private(tmp_path) -> None:
+    store = FileTokenStore(tmp_path / "tokens")
+    store.set("key", make_token())
+    (path,) = (store.directory).glob("*.json")
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(store.directory).st_mode) == 0o700
+
+
+def test_file_store_sees_renewals_from_other_processes(tmp_path) -> None:
+    reader = FileTokenStore(tmp_path)
+    writer = FileTokenStore(tmp_path)
+    writer.set("key", make_token("first"))
+    assert reader.get("key").access_token == "first"
+
+    writer.set("key", make_token("second", seconds=7200))
+    # Force a distinct mtime even on filesystems with coarse timestamps.
+    path = next(tmp_path.glob("*.json"))
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+    assert reader.get("key").access_token == "second"
+
+
+def test_file_store_ignores_corrupt_files(tmp_path) -> None:
+    store = FileTokenStore(tmp_path)
+    store.set("key", make_token())
+    next(tmp_path.glob("*.json")).write_text("{not json")
+    assert FileTokenStore(tmp_path).get("key") is None
+
+
+def test_file_store_lock_is_exclusive_across_instances(tmp_path) -> None:
+    first, second = FileTokenStore(tmp_path), FileTokenStore(tmp_path)
+    acquired = threading.Event()
+
+    def contend() -> None:
+        with second.lock("key"):
+            acquired.set()
+
+    with first.lock("key"):
+        thread = threading.Thread(target=contend)
+        thread.start()
+        assert not acquired.wait(0.2)
+    thread.join(2)
+    assert acquired.is_set()
+
+
+def test_workers_sharing_a_file_store_fetch_one_token(
+    tmp_path, fake_credentials, mock_post
+) -> None:
+    """Many workers with their own context and store renew the token once."""
+    client_id, client_secret = fake_credentials
+    workers = [
+        BaseApi(
+            client_id,
+            client_secret,
+            context=ApiContext(token_store=FileTokenStore(tmp_path)),
+        )
+        for _ in range(8)
+    ]
+    tokens: list[str] = []
+    barrier = threading.Barrier(len(workers))
+
+    def boot(api: BaseApi) -> None:
+        barrier.wait()
+        tokens.append(api._ensure_valid_token("us"))
+
+    threads = [threading.Thread(target=boot, args=(api,)) for api in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert tokens == [FAKE_TOKEN] * len(workers)
+    assert mock_post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_file_store(
+    tmp_path, fake_credentials, mock_async_post
+) -> None:
+    client_id, client_secret = fake_credentials
+    context = ApiContext(token_store=FileTokenStore(tmp_path))
+    api = AsyncBaseApi(client_id, client_secret, context=context)
+
+    assert await api._ensure_valid_token("us") == FAKE_TOKEN
+    assert FileTokenStore(tmp_path).get(api._token_key("us")).access_token == (
+        FAKE_TOKEN
+    )
+    assert mock_async_post.call_count == 1